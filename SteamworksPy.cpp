@@ -20,6 +20,9 @@
 #else
 	#error "Unsupported platform"
 #endif
+#include <cstring>
+#include <unordered_map>
+#include <vector>
 //-----------------------------------------------
 // Definitions
 //-----------------------------------------------
@@ -91,6 +94,359 @@ typedef void(*DeleteItemResultCallback_t) (DeleteItemResult_t);
 typedef void(*DownloadItemResultCallback_t) (DownloadItemResult_t);
 typedef void(*SteamUGCDetailsCallback_t) (SteamUGCDetails_t);
 typedef void(*GamepadTextInputDismissedCallback_t) (GamepadTextInputDismissed_t);
+typedef void(*IPCountryChangedCallback_t) ();
+//-----------------------------------------------
+// Event queue
+//-----------------------------------------------
+// In queue mode, callbacks and call results that have a Python handler are
+// written to a preallocated ring buffer instead of calling into Python, and
+// Python collects them all with one Events_Drain call per pump. Each record
+// is an EventHeader followed by the event struct, padded to 8 bytes.
+// Callbacks that do not fit are dropped and counted. Call results are bounded
+// by the calls Python made, so the ring grows to hold them, up to
+// EVENT_QUEUE_MAX_CAPACITY; a batched UGC query result alone is about 485 KB.
+// A call result that still does not fit is dropped but reported: Drain follows
+// the queued records with a header-only record for it, flagged
+// EVENT_IO_FAILURE, so its Python handler runs and the call is no longer in
+// flight. The queue is not locked: Python pumps and drains under the same lock.
+#define EVENT_IO_FAILURE 1
+#define EVENT_QUEUE_MAX_CAPACITY (64u << 20)
+struct EventHeader {
+	int32 type;			// k_iCallback of the event struct
+	uint32 size;		// bytes of struct after the header
+	uint64 handle;		// SteamAPICall_t for call results, 0 for callbacks
+	uint32 flags;		// EVENT_IO_FAILURE
+	uint32 reserved;
+};
+class EventQueue
+{
+public:
+	bool _enabled = false;
+	uint64 _dropped = 0;
+
+	void SetQueueMode(bool enabled, uint32 capacity) {
+		_enabled = enabled;
+		_buffer.assign(enabled ? capacity : 0, 0);
+		_head = _tail = _used = _count = 0;
+		_dataEnd = _buffer.size();
+		_failedCalls.clear();
+	}
+	// Queue a record; returns false if it was dropped
+	bool Push(int32 type, uint64 handle, uint32 flags, const void *payload, uint32 size) {
+		if (!TryPush(type, handle, flags, payload, size)) {
+			_dropped++;
+			return false;
+		}
+		return true;
+	}
+	// Queue a call result, growing the ring if needed, or report it as an IO failure if it cannot fit
+	void PushCallResult(int32 type, uint64 handle, uint32 flags, const void *payload, uint32 size) {
+		if (TryPush(type, handle, flags, payload, size)) {
+			return;
+		}
+		if (Grow(RecordSize(size)) && TryPush(type, handle, flags, payload, size)) {
+			return;
+		}
+		_dropped++;
+		EventHeader header = { type, 0, handle, EVENT_IO_FAILURE, 0 };
+		_failedCalls.push_back(header);
+	}
+	// Copy as many whole records as fit into buffer, then the failed call results; returns the
+	// bytes written and sets needed to the size of the next record left queued, 0 if none is
+	uint32 Drain(uint8 *buffer, uint32 capacity, uint32 *needed) {
+		uint32 written = DrainRecords(buffer, capacity);
+		*needed = 0;
+		if (_used > 0) {
+			EventHeader header;
+			memcpy(&header, &_buffer[_head == _dataEnd ? 0 : _head], sizeof(header));
+			*needed = (uint32)RecordSize(header.size);
+			return written;
+		}
+		// Only once the ring is empty, so a failure never overtakes queued records
+		size_t failed = 0;
+		while (failed < _failedCalls.size() && written + sizeof(EventHeader) <= capacity) {
+			memcpy(buffer + written, &_failedCalls[failed++], sizeof(EventHeader));
+			written += (uint32)sizeof(EventHeader);
+		}
+		_failedCalls.erase(_failedCalls.begin(), _failedCalls.begin() + failed);
+		if (!_failedCalls.empty()) {
+			*needed = (uint32)sizeof(EventHeader);
+		}
+		return written;
+	}
+
+	uint32 QueuedBytes() const {
+		return (uint32)_used;
+	}
+
+	uint32 QueuedEvents() const {
+		return _count + (uint32)_failedCalls.size();
+	}
+
+private:
+	std::vector<uint8> _buffer;
+	size_t _head = 0;
+	size_t _tail = 0;
+	size_t _used = 0;
+	uint32 _count = 0;
+	// Where the records before a wrap end
+	size_t _dataEnd = 0;
+	// Headers of call results that were dropped, waiting to be drained
+	std::vector<EventHeader> _failedCalls;
+
+	static size_t RecordSize(uint32 size) {
+		return (sizeof(EventHeader) + size + 7) & ~(size_t)7;
+	}
+
+	bool TryPush(int32 type, uint64 handle, uint32 flags, const void *payload, uint32 size) {
+		const size_t recordSize = RecordSize(size);
+		const size_t capacity = _buffer.size();
+		if (_used == 0) {
+			_head = _tail = 0;
+			_dataEnd = capacity;
+		}
+		size_t at;
+		if (_used == 0 || _tail > _head) {
+			// Free space is [tail, capacity) and then [0, head)
+			if (capacity - _tail >= recordSize) {
+				at = _tail;
+			}
+			else if (_head >= recordSize) {
+				_dataEnd = _tail;
+				at = 0;
+			}
+			else {
+				return false;
+			}
+		}
+		else if (_head - _tail >= recordSize) {
+			at = _tail;
+		}
+		else {
+			return false;
+		}
+		EventHeader header = { type, size, handle, flags, 0 };
+		memcpy(&_buffer[at], &header, sizeof(header));
+		if (size > 0) {
+			memcpy(&_buffer[at + sizeof(header)], payload, size);
+		}
+		_tail = at + recordSize;
+		_used += recordSize;
+		_count++;
+		return true;
+	}
+	// Move the queued records, in order, into a larger ring that has room for recordSize more bytes
+	bool Grow(size_t recordSize) {
+		// Room for as much again, so callbacks queued after it are not dropped
+		size_t capacity = _buffer.size() * 2;
+		if (capacity < (_used + recordSize) * 2) {
+			capacity = (_used + recordSize) * 2;
+		}
+		if (capacity > EVENT_QUEUE_MAX_CAPACITY) {
+			capacity = EVENT_QUEUE_MAX_CAPACITY;
+		}
+		if (capacity < _used + recordSize) {
+			return false;
+		}
+		std::vector<uint8> grown(capacity, 0);
+		const uint32 count = _count;
+		const size_t used = DrainRecords(&grown[0], (uint32)capacity);
+		_buffer.swap(grown);
+		_head = 0;
+		_tail = _used = used;
+		_count = count;
+		_dataEnd = capacity;
+		return true;
+	}
+	// Copy as many whole records as fit into buffer; returns the bytes written
+	uint32 DrainRecords(uint8 *buffer, uint32 capacity) {
+		uint32 written = 0;
+		while (_used > 0) {
+			if (_head == _dataEnd) {
+				_head = 0;
+				_dataEnd = _buffer.size();
+			}
+			EventHeader header;
+			memcpy(&header, &_buffer[_head], sizeof(header));
+			const size_t recordSize = RecordSize(header.size);
+			if (written + recordSize > capacity) {
+				break;
+			}
+			memcpy(buffer + written, &_buffer[_head], recordSize);
+			written += (uint32)recordSize;
+			_head += recordSize;
+			_used -= recordSize;
+			_count--;
+		}
+		return written;
+	}
+};
+static EventQueue eventQueue;
+// Queue the event in queue mode, otherwise call the Python callback
+template <class T>
+void Deliver(void(*callback)(T), const T &event) {
+	if (eventQueue._enabled) {
+		eventQueue.Push(T::k_iCallback, 0, 0, &event, sizeof(T));
+	}
+	else {
+		callback(event);
+	}
+}
+//-----------------------------------------------
+// Call results
+//-----------------------------------------------
+// Every asynchronous call gets its own pending entry keyed by its
+// SteamAPICall_t, so any number of calls of one type can be in flight. Each
+// completion is handed to the Python handler registered for its type with
+// CallResult_SetHandler, called as handler(hCall, bIOFailure, &result). The
+// result is passed by pointer, so large structs such as SteamUGCDetails_t are
+// not copied onto the stack for ctypes; it is only valid during the call.
+// Completed and cancelled entries are deleted once SteamAPI_RunCallbacks
+// returns, never from inside their own CCallResult.
+#define CALL_CREATE_ITEM 0
+#define CALL_SUBMIT_ITEM_UPDATE 1
+#define CALL_QUERY_UGC_DETAILS 2
+#define CALL_FIND_LEADERBOARD 3
+#define CALL_GLOBAL_STATS 4
+#define CALL_DELETE_ITEM 5
+#define CALL_QUERY_UGC_BATCH 6
+#define CALL_RESULT_TYPES 7
+// SteamworksPy's own event type for CALL_QUERY_UGC_BATCH results; Steam does not use it
+#define EVENT_UGC_QUERY_BATCH (SteamUGCQueryCompleted_t::k_iCallback + 90)
+// Result of a batched UGC details query, followed by m_unNumResults SteamUGCDetails_t
+struct UGCQueryBatchResult_t {
+	int32 m_eResult;
+	uint32 m_unNumResults;
+};
+// Set by SteamUseManualDispatch, see "Manual dispatch" below
+static bool manualDispatch = false;
+class PendingCall
+{
+public:
+	PendingCall(SteamAPICall_t hCall, uint64 context) : _hCall(hCall), _context(context) {}
+	virtual ~PendingCall() {
+		ReleaseQuery();
+	}
+	// Stop waiting for the result and release what the call holds
+	virtual void Cancel() {
+		ReleaseQuery();
+	}
+	// Fetch the result with SteamAPI_ManualDispatch_GetAPICallResult and complete the call
+	virtual void CompleteManual(HSteamPipe hSteamPipe) = 0;
+	void ReleaseQuery() {
+		if (_queryHandle != k_UGCQueryHandleInvalid && SteamUGC() != NULL) {
+			SteamUGC()->ReleaseQueryUGCRequest(_queryHandle);
+		}
+		_queryHandle = k_UGCQueryHandleInvalid;
+	}
+
+	SteamAPICall_t _hCall;
+	// Whatever the completion needs to know about the request, e.g. the queried PublishedFileId_t
+	uint64 _context;
+	// UGC query to release once the call is done
+	UGCQueryHandle_t _queryHandle = k_UGCQueryHandleInvalid;
+};
+static std::unordered_map<SteamAPICall_t, PendingCall*> pendingCalls;
+static std::vector<PendingCall*> completedCalls;
+static void *callResultHandlers[CALL_RESULT_TYPES];
+// Event type of each CALL_* type in queue mode; UGC details are queued under the query's type
+static const int32 callResultEvents[CALL_RESULT_TYPES] = {
+	CreateItemResult_t::k_iCallback,
+	SubmitItemUpdateResult_t::k_iCallback,
+	SteamUGCQueryCompleted_t::k_iCallback,
+	LeaderboardFindResult_t::k_iCallback,
+	GlobalStatsReceived_t::k_iCallback,
+	DeleteItemResult_t::k_iCallback,
+	EVENT_UGC_QUERY_BATCH,
+};
+
+static void FinishCall(PendingCall *call) {
+	pendingCalls.erase(call->_hCall);
+	completedCalls.push_back(call);
+}
+static void DeleteCompletedCalls() {
+	for (PendingCall *call : completedCalls) {
+		delete call;
+	}
+	completedCalls.clear();
+}
+static void DeleteAllCalls() {
+	for (auto &entry : pendingCalls) {
+		delete entry.second;
+	}
+	pendingCalls.clear();
+	DeleteCompletedCalls();
+}
+
+template <class O, class T>
+class PendingCallResult : public PendingCall
+{
+public:
+	typedef void (O::*Complete_t)(PendingCall *call, T *result, bool bIOFailure);
+
+	PendingCallResult(SteamAPICall_t hCall, uint64 context, O *owner, Complete_t complete) : PendingCall(hCall, context), _owner(owner), _complete(complete) {
+		// Manual dispatch completes calls from SteamAPICallCompleted_t instead
+		if (!manualDispatch) {
+			_callResult.Set(hCall, this, &PendingCallResult::OnComplete);
+		}
+	}
+
+	void CompleteManual(HSteamPipe hSteamPipe) override {
+		T result;
+		memset(&result, 0, sizeof(result));
+		bool bFailed = true;
+		if (!SteamAPI_ManualDispatch_GetAPICallResult(hSteamPipe, _hCall, &result, sizeof(result), T::k_iCallback, &bFailed)) {
+			bFailed = true;
+		}
+		OnComplete(&result, bFailed);
+	}
+
+	void Cancel() override {
+		_callResult.Cancel();
+		PendingCall::Cancel();
+	}
+
+private:
+	O *_owner;
+	Complete_t _complete;
+	CCallResult<PendingCallResult<O, T>, T> _callResult;
+
+	// Finished before the handler runs, so a handler that cancels its own call finds
+	// nothing to cancel; the call is only deleted after RunCallbacks returns
+	void OnComplete(T *result, bool bIOFailure) {
+		FinishCall(this);
+		(_owner->*_complete)(this, result, bIOFailure);
+	}
+};
+// Track the call result of hCall, completed through owner->complete; returns nullptr for an invalid handle
+template <class O, class T>
+PendingCall *StartCallResult(SteamAPICall_t hCall, uint64 context, O *owner, void (O::*complete)(PendingCall*, T*, bool)) {
+	if (hCall == k_uAPICallInvalid) {
+		return nullptr;
+	}
+	PendingCall *call = new PendingCallResult<O, T>(hCall, context, owner, complete);
+	pendingCalls[hCall] = call;
+	return call;
+}
+// Hand size bytes of a completed call's result to the Python handler registered for its type
+static void ForwardCallResultData(int32 callType, PendingCall *call, bool bIOFailure, const void *result, uint32 size) {
+	typedef void(*Handler_t) (SteamAPICall_t, bool, const void *);
+	Handler_t handler = (Handler_t)callResultHandlers[callType];
+	if (handler == nullptr) {
+		return;
+	}
+	if (eventQueue._enabled) {
+		eventQueue.PushCallResult(callResultEvents[callType], call->_hCall, bIOFailure ? EVENT_IO_FAILURE : 0, result, size);
+	}
+	else {
+		handler(call->_hCall, bIOFailure, result);
+	}
+}
+// Hand a completed call to the Python handler registered for its type
+template <class T>
+void ForwardCallResult(int32 callType, PendingCall *call, bool bIOFailure, const T &result) {
+	ForwardCallResultData(callType, call, bIOFailure, &result, sizeof(T));
+}
 //-----------------------------------------------
 // Workshop Class
 //-----------------------------------------------
@@ -102,10 +458,6 @@ public:
 	ItemInstalledCallback_t _pyItemInstalledCallback;
 	SteamUGCDetailsCallback_t _pySteamUGCDetailsCallback;
 
-	CCallResult<Workshop, CreateItemResult_t> _itemCreatedCallback;
-	CCallResult<Workshop, SubmitItemUpdateResult_t> _itemUpdatedCallback;
-	CCallResult<Workshop, SteamUGCQueryCompleted_t> _queryCompletedCallback;
-
 	CCallback<Workshop, ItemInstalled_t> _itemInstalledCallback;
 
 	Workshop() : _itemInstalledCallback(this, &Workshop::OnItemInstalled) {}
@@ -130,49 +482,106 @@ public:
 	void ClearSteamUGCDetailsCallback() {
 		_pySteamUGCDetailsCallback = nullptr;
 	}
+	// Run the handler for one manually dispatched callback; returns false if there is none
+	bool DispatchManual(int iCallback, void *pParam) {
+		if (iCallback == ItemInstalled_t::k_iCallback) {
+			OnItemInstalled((ItemInstalled_t*)pParam);
+			return true;
+		}
+		return false;
+	}
 
-	void CreateItem(AppId_t consumerAppId, EWorkshopFileType fileType){
+	SteamAPICall_t CreateItem(AppId_t consumerAppId, EWorkshopFileType fileType){
 		//TODO: Check if fileType is a valid value?
 		const SteamAPICall_t createItemCall = SteamUGC()->CreateItem(consumerAppId, fileType);
-		_itemCreatedCallback.Set(createItemCall, this, &Workshop::OnWorkshopItemCreated);
+		StartCallResult(createItemCall, 0, this, &Workshop::OnWorkshopItemCreated);
+		return createItemCall;
 	}
-	void SubmitItemUpdate(UGCUpdateHandle_t updateHandle, const char *pChangeNote){
+	SteamAPICall_t SubmitItemUpdate(UGCUpdateHandle_t updateHandle, const char *pChangeNote){
 		const SteamAPICall_t submitItemUpdateCall = SteamUGC()->SubmitItemUpdate(updateHandle, pChangeNote);
-		_itemUpdatedCallback.Set(submitItemUpdateCall, this, &Workshop::OnItemUpdateSubmitted);
+		StartCallResult(submitItemUpdateCall, 0, this, &Workshop::OnItemUpdateSubmitted);
+		return submitItemUpdateCall;
 	}
 
-	void QueryUGCItem(PublishedFileId_t nPublishedFileID) {
+	SteamAPICall_t QueryUGCItem(PublishedFileId_t nPublishedFileID) {
 		const UGCQueryHandle_t handle = SteamUGC()->CreateQueryUGCDetailsRequest(&nPublishedFileID, 1);
 		const SteamAPICall_t sendQueryCall = SteamUGC()->SendQueryUGCRequest(handle);
-		_queryCompletedCallback.Set(sendQueryCall, this, &Workshop::OnSteamUGCQueryCompleted);
+		PendingCall *call = StartCallResult(sendQueryCall, nPublishedFileID, this, &Workshop::OnSteamUGCQueryCompleted);
+		if (call == nullptr) {
+			SteamUGC()->ReleaseQueryUGCRequest(handle);
+			return k_uAPICallInvalid;
+		}
+		call->_queryHandle = handle;
+		return sendQueryCall;
+	}
+
+	// Query up to kNumUGCResultsPerPage items in one request
+	SteamAPICall_t QueryUGCItems(PublishedFileId_t *pPublishedFileIDs, uint32 count) {
+		const UGCQueryHandle_t handle = SteamUGC()->CreateQueryUGCDetailsRequest(pPublishedFileIDs, count);
+		const SteamAPICall_t sendQueryCall = SteamUGC()->SendQueryUGCRequest(handle);
+		PendingCall *call = StartCallResult(sendQueryCall, count, this, &Workshop::OnSteamUGCBatchQueryCompleted);
+		if (call == nullptr) {
+			SteamUGC()->ReleaseQueryUGCRequest(handle);
+			return k_uAPICallInvalid;
+		}
+		call->_queryHandle = handle;
+		return sendQueryCall;
 	}
 
 private:
-	void OnWorkshopItemCreated(CreateItemResult_t *createItemResult, bool bIOFailure) {
+	// UGCQueryBatchResult_t and the details after it, reused by every batch
+	std::vector<uint8> _batchResult;
+
+	void OnWorkshopItemCreated(PendingCall *call, CreateItemResult_t *createItemResult, bool bIOFailure) {
 		if(_pyItemCreatedCallback != nullptr && !bIOFailure) {
 			_pyItemCreatedCallback(*createItemResult);
 		}
+		ForwardCallResult(CALL_CREATE_ITEM, call, bIOFailure, *createItemResult);
 	}
-	void OnItemUpdateSubmitted(SubmitItemUpdateResult_t *submitItemUpdateResult, bool bIOFailure) {
+	void OnItemUpdateSubmitted(PendingCall *call, SubmitItemUpdateResult_t *submitItemUpdateResult, bool bIOFailure) {
 		if(_pyItemUpdatedCallback != nullptr && !bIOFailure) {
 			_pyItemUpdatedCallback(*submitItemUpdateResult);
 		}
+		ForwardCallResult(CALL_SUBMIT_ITEM_UPDATE, call, bIOFailure, *submitItemUpdateResult);
 	}
 	void OnItemInstalled(ItemInstalled_t *itemInstalledResult) {
 		if(_pyItemInstalledCallback != nullptr && itemInstalledResult->m_unAppID == SteamUtils()->GetAppID()) {
-			_pyItemInstalledCallback(*itemInstalledResult);
+			Deliver(_pyItemInstalledCallback, *itemInstalledResult);
 		}
 	}
-	void OnSteamUGCQueryCompleted(SteamUGCQueryCompleted_t *pCallback, bool bIOFailure) {
-		if (pCallback->m_eResult == k_EResultOK && !bIOFailure) {
-			SteamUGCDetails_t details;
-			if (SteamUGC()->GetQueryUGCResult(pCallback->m_handle, 0, &details)) {
+	void OnSteamUGCQueryCompleted(PendingCall *call, SteamUGCQueryCompleted_t *pCallback, bool bIOFailure) {
+		SteamUGCDetails_t details;
+		if (!bIOFailure && pCallback->m_eResult == k_EResultOK && SteamUGC()->GetQueryUGCResult(call->_queryHandle, 0, &details)) {
+			if (_pySteamUGCDetailsCallback != nullptr) {
 				_pySteamUGCDetailsCallback(details);
 			}
 		}
+		else {
+			// Failures still reach the per-call handler, with the requested ID and the reason
+			memset(&details, 0, sizeof(details));
+			details.m_nPublishedFileId = call->_context;
+			details.m_eResult = bIOFailure ? k_EResultIOFailure : pCallback->m_eResult == k_EResultOK ? k_EResultFileNotFound : pCallback->m_eResult;
+		}
+		ForwardCallResult(CALL_QUERY_UGC_DETAILS, call, bIOFailure, details);
 
 		ClearSteamUGCDetailsCallback();
-		SteamUGC()->ReleaseQueryUGCRequest(pCallback->m_handle);
+		call->ReleaseQuery();
+	}
+	void OnSteamUGCBatchQueryCompleted(PendingCall *call, SteamUGCQueryCompleted_t *pCallback, bool bIOFailure) {
+		UGCQueryBatchResult_t header;
+		header.m_eResult = bIOFailure ? k_EResultIOFailure : pCallback->m_eResult;
+		header.m_unNumResults = header.m_eResult == k_EResultOK ? pCallback->m_unNumResultsReturned : 0;
+		_batchResult.resize(sizeof(header) + header.m_unNumResults * sizeof(SteamUGCDetails_t));
+		SteamUGCDetails_t *details = (SteamUGCDetails_t*)&_batchResult[sizeof(header)];
+		for (uint32 i = 0; i < header.m_unNumResults; i++) {
+			if (!SteamUGC()->GetQueryUGCResult(call->_queryHandle, i, &details[i])) {
+				memset(&details[i], 0, sizeof(SteamUGCDetails_t));
+				details[i].m_eResult = k_EResultFail;
+			}
+		}
+		memcpy(&_batchResult[0], &header, sizeof(header));
+		ForwardCallResultData(CALL_QUERY_UGC_BATCH, call, bIOFailure, &_batchResult[0], (uint32)_batchResult.size());
+		call->ReleaseQuery();
 	}
 };
 
@@ -185,20 +594,20 @@ class Leaderboard
 public:
 	LeaderboardFindResultCallback_t _pyLeaderboardFindResultCallback;
 
-	CCallResult<Leaderboard, LeaderboardFindResult_t> _leaderboardFindResultCallback;
-
 	void SetLeaderboardFindResultCallback(LeaderboardFindResultCallback_t callback){
 		_pyLeaderboardFindResultCallback = callback;
 	}
-	void FindLeaderboard(const char *pchLeaderboardName){
+	SteamAPICall_t FindLeaderboard(const char *pchLeaderboardName){
 		SteamAPICall_t leaderboardFindResultCall = SteamUserStats()->FindLeaderboard(pchLeaderboardName);
-		_leaderboardFindResultCallback.Set(leaderboardFindResultCall, this, &Leaderboard::OnLeaderboardFindResult);
+		StartCallResult(leaderboardFindResultCall, 0, this, &Leaderboard::OnLeaderboardFindResult);
+		return leaderboardFindResultCall;
 	}
 private:
-	void OnLeaderboardFindResult(LeaderboardFindResult_t *leaderboardFindResult, bool bIOFailure) {
+	void OnLeaderboardFindResult(PendingCall *call, LeaderboardFindResult_t *leaderboardFindResult, bool bIOFailure) {
 		if(_pyLeaderboardFindResultCallback != nullptr && !bIOFailure) {
 			_pyLeaderboardFindResultCallback(*leaderboardFindResult);
 		}
+		ForwardCallResult(CALL_FIND_LEADERBOARD, call, bIOFailure, *leaderboardFindResult);
 	}
 };
 static Leaderboard leaderboard;
@@ -236,30 +645,61 @@ public:
 		_pyGamepadTextInputDismissedCallback = callback;
 	}
 
-	void RequestGlobalStats(int nHistoryDays) {
+	void SetIPCountryChangedCallback(IPCountryChangedCallback_t callback) {
+		_pyIPCountryChangedCallback = callback;
+	}
+
+	SteamAPICall_t RequestGlobalStats(int nHistoryDays) {
 		const SteamAPICall_t hSteamAPICall = SteamUserStats()->RequestGlobalStats(nHistoryDays);
-		_RequestGlobalStatsCallResult.Set(hSteamAPICall, this, &SteamCallbacks::OnGlobalStatsReceived);
+		StartCallResult(hSteamAPICall, 0, this, &SteamCallbacks::OnGlobalStatsReceived);
+		return hSteamAPICall;
 	}
 
-	void DeleteItem(PublishedFileId_t nPublishedFileID) {
+	SteamAPICall_t DeleteItem(PublishedFileId_t nPublishedFileID) {
 		const SteamAPICall_t hSteamAPICall = SteamUGC()->DeleteItem(nPublishedFileID);
-		_DeleteItemResult.Set(hSteamAPICall, this, &SteamCallbacks::OnItemDeleted);
+		StartCallResult(hSteamAPICall, nPublishedFileID, this, &SteamCallbacks::OnItemDeleted);
+		return hSteamAPICall;
 	}
 
 	bool DownloadItem(PublishedFileId_t nPublishedFileID, bool bHighPriority) {
 		return SteamUGC()->DownloadItem(nPublishedFileID, bHighPriority);
 	}
+	// Run the handler for one manually dispatched callback; returns false if there is none
+	bool DispatchManual(int iCallback, void *pParam) {
+		switch (iCallback) {
+			case GameOverlayActivated_t::k_iCallback:
+				OnGameOverlayActivated((GameOverlayActivated_t*)pParam);
+				return true;
+			case ScreenshotReady_t::k_iCallback:
+				OnScreenshotReady((ScreenshotReady_t*)pParam);
+				return true;
+			case UserStatsReceived_t::k_iCallback:
+				OnUserStatsReceived((UserStatsReceived_t*)pParam);
+				return true;
+			case UserStatsStored_t::k_iCallback:
+				OnUserStatsStored((UserStatsStored_t*)pParam);
+				return true;
+			case DownloadItemResult_t::k_iCallback:
+				OnItemDownloaded((DownloadItemResult_t*)pParam);
+				return true;
+			case GamepadTextInputDismissed_t::k_iCallback:
+				OnGamepadTextInputDismissed((GamepadTextInputDismissed_t*)pParam);
+				return true;
+			case IPCountry_t::k_iCallback:
+				OnIPCountryChanged((IPCountry_t*)pParam);
+				return true;
+		}
+		return false;
+	}
 
 private:
-	CCallResult< SteamCallbacks, GlobalStatsReceived_t > _RequestGlobalStatsCallResult;
-	CCallResult< SteamCallbacks, DeleteItemResult_t > _DeleteItemResult;
-
 	STEAM_CALLBACK(SteamCallbacks, OnGameOverlayActivated, GameOverlayActivated_t);
 	STEAM_CALLBACK(SteamCallbacks, OnScreenshotReady, ScreenshotReady_t);
 	STEAM_CALLBACK(SteamCallbacks, OnUserStatsReceived, UserStatsReceived_t);
 	STEAM_CALLBACK(SteamCallbacks, OnUserStatsStored, UserStatsStored_t);
 	STEAM_CALLBACK(SteamCallbacks, OnItemDownloaded, DownloadItemResult_t);
 	STEAM_CALLBACK(SteamCallbacks, OnGamepadTextInputDismissed, GamepadTextInputDismissed_t);
+	STEAM_CALLBACK(SteamCallbacks, OnIPCountryChanged, IPCountry_t);
 
 	GameOverlayActivatedCallback_t _pyGameOverlayActivatedCallback = nullptr;
 	ScreenshotReadyCallback_t _pyScreenshotReadyCallback = nullptr;
@@ -268,35 +708,38 @@ private:
 	DeleteItemResultCallback_t _pyDeleteItemResultCallback = nullptr;
 	DownloadItemResultCallback_t _pyDownloadItemResultCallback = nullptr;
 	GamepadTextInputDismissedCallback_t _pyGamepadTextInputDismissedCallback = nullptr;
+	IPCountryChangedCallback_t _pyIPCountryChangedCallback = nullptr;
 
-	void OnGlobalStatsReceived(GlobalStatsReceived_t *pCallback, bool bIOFailure) {
+	void OnGlobalStatsReceived(PendingCall *call, GlobalStatsReceived_t *pCallback, bool bIOFailure) {
 		if (_pyGlobalStatsReceivedCallback != nullptr && !bIOFailure && pCallback->m_eResult == k_EResultOK && SteamUtils()->GetAppID() == pCallback->m_nGameID) {
 			_pyGlobalStatsReceivedCallback(*pCallback);
 		}
+		ForwardCallResult(CALL_GLOBAL_STATS, call, bIOFailure, *pCallback);
 	}
 
-	void OnItemDeleted(DeleteItemResult_t *pCallback, bool bIOFailure) {
+	void OnItemDeleted(PendingCall *call, DeleteItemResult_t *pCallback, bool bIOFailure) {
 		if (_pyDeleteItemResultCallback != nullptr && !bIOFailure && pCallback->m_eResult == k_EResultOK) {
 			_pyDeleteItemResultCallback(*pCallback);
 		}
+		ForwardCallResult(CALL_DELETE_ITEM, call, bIOFailure, *pCallback);
 	}
 };
 
 void SteamCallbacks::OnGameOverlayActivated(GameOverlayActivated_t *pCallback) {
 	if (_pyGameOverlayActivatedCallback != nullptr) {
-		_pyGameOverlayActivatedCallback(*pCallback);
+		Deliver(_pyGameOverlayActivatedCallback, *pCallback);
 	}
 }
 
 void SteamCallbacks::OnScreenshotReady(ScreenshotReady_t *pCallback) {
 	if (_pyScreenshotReadyCallback != nullptr && pCallback->m_eResult == k_EResultOK) {
-		_pyScreenshotReadyCallback(*pCallback);
+		Deliver(_pyScreenshotReadyCallback, *pCallback);
 	}
 }
 
 void SteamCallbacks::OnUserStatsReceived(UserStatsReceived_t *pCallback) {
 	if (_pyUserStatsReceivedCallback != nullptr && SteamUtils()->GetAppID() == pCallback->m_nGameID && pCallback->m_eResult == k_EResultOK) {
-      _pyUserStatsReceivedCallback(*pCallback);
+      Deliver(_pyUserStatsReceivedCallback, *pCallback);
 	}
 }
 
@@ -315,13 +758,24 @@ void SteamCallbacks::OnUserStatsStored(UserStatsStored_t *pCallback) {
 
 void SteamCallbacks::OnItemDownloaded(DownloadItemResult_t *pCallback) {
 	if (_pyDownloadItemResultCallback != nullptr && pCallback->m_unAppID == SteamUtils()->GetAppID() && pCallback->m_eResult == k_EResultOK) {
-		_pyDownloadItemResultCallback(*pCallback);
+		Deliver(_pyDownloadItemResultCallback, *pCallback);
 	}
 }
 
 void SteamCallbacks::OnGamepadTextInputDismissed(GamepadTextInputDismissed_t *pCallback) {
 	if (_pyGamepadTextInputDismissedCallback != nullptr && pCallback->m_bSubmitted) {
-		_pyGamepadTextInputDismissedCallback(*pCallback);
+		Deliver(_pyGamepadTextInputDismissedCallback, *pCallback);
+	}
+}
+
+void SteamCallbacks::OnIPCountryChanged(IPCountry_t *pCallback) {
+	if (_pyIPCountryChangedCallback != nullptr) {
+		if (eventQueue._enabled) {
+			eventQueue.Push(IPCountry_t::k_iCallback, 0, 0, nullptr, 0);
+		}
+		else {
+			_pyIPCountryChangedCallback();
+		}
 	}
 }
 static SteamCallbacks callbacks;
@@ -339,11 +793,52 @@ SW_PY void Callbacks_SetUserStatsReceivedCallback(UserStatsReceivedCallback_t ca
 SW_PY void Callbacks_SetGlobalStatsReceivedCallback(GlobalStatsReceivedCallback_t callback) {
 	callbacks.SetGlobalStatsReceivedCallback(callback);
 }
-SW_PY void Stats_RequestGlobalStats(int nHistoryDays) {
-	callbacks.RequestGlobalStats(nHistoryDays);
+SW_PY SteamAPICall_t Stats_RequestGlobalStats(int nHistoryDays) {
+	if (SteamUserStats() == NULL) {
+		return k_uAPICallInvalid;
+	}
+	return callbacks.RequestGlobalStats(nHistoryDays);
+}
+SW_PY SteamAPICall_t Workshop_DeleteItem(PublishedFileId_t nPublishedFileID) {
+	if (SteamUGC() == NULL) {
+		return k_uAPICallInvalid;
+	}
+	return callbacks.DeleteItem(nPublishedFileID);
+}
+// Switch queue mode on with a ring buffer of capacity bytes, or off
+SW_PY void Events_SetQueueMode(bool enabled, uint32 capacity) {
+	eventQueue.SetQueueMode(enabled, capacity);
 }
-SW_PY void Workshop_DeleteItem(PublishedFileId_t nPublishedFileID) {
-	callbacks.DeleteItem(nPublishedFileID);
+// Move queued events into buffer; returns the bytes written, and sets *needed to the
+// size of the next record still queued, so Python can grow a buffer it does not fit
+SW_PY uint32 Events_Drain(uint8 *buffer, uint32 capacity, uint32 *needed) {
+	return eventQueue.Drain(buffer, capacity, needed);
+}
+// Number of events dropped because the queue was full
+SW_PY uint64 Events_GetDropped() {
+	return eventQueue._dropped;
+}
+// Number of events waiting for Events_Drain
+SW_PY uint32 Events_GetQueued() {
+	return eventQueue.QueuedEvents();
+}
+// Stop waiting for hCall and release its native resources, such as a UGC query
+// handle; returns false if hCall is not pending
+SW_PY bool CallResult_Cancel(SteamAPICall_t hCall) {
+	auto entry = pendingCalls.find(hCall);
+	if (entry == pendingCalls.end()) {
+		return false;
+	}
+	PendingCall *call = entry->second;
+	call->Cancel();
+	FinishCall(call);
+	return true;
+}
+// Register the Python handler for one CALL_* type; nullptr unregisters it
+SW_PY void CallResult_SetHandler(int32 callType, void *handler) {
+	if (callType >= 0 && callType < CALL_RESULT_TYPES) {
+		callResultHandlers[callType] = handler;
+	}
 }
 SW_PY void Workshop_SetDeleteItemResultCallback(DeleteItemResultCallback_t callback) {
 	callbacks.SetDeleteItemResultCallback(callback);
@@ -357,16 +852,56 @@ SW_PY void Workshop_SetDownloadItemResultCallback(DownloadItemResultCallback_t c
 SW_PY void Callbacks_SetGamepadTextInputDismissedCallback(GamepadTextInputDismissedCallback_t callback) {
 	callbacks.SetGamepadTextInputDismissedCallback(callback);
 }
+SW_PY void Callbacks_SetIPCountryChangedCallback(IPCountryChangedCallback_t callback) {
+	callbacks.SetIPCountryChangedCallback(callback);
+}
 
 
+//-----------------------------------------------
+// Manual dispatch
+//-----------------------------------------------
+// Instead of SteamAPI_RunCallbacks, which runs every registered CCallback and
+// CCallResult through virtual calls, RunCallbacks pulls messages off the pipe
+// itself. A callback only reaches a handler if Python has set the pointer it
+// forwards to; everything else is freed straight away. Call results are
+// looked up in pendingCalls by their SteamAPICallCompleted_t and fetched with
+// SteamAPI_ManualDispatch_GetAPICallResult.
+static void RunManualDispatch() {
+	const HSteamPipe hSteamPipe = SteamAPI_GetHSteamPipe();
+	SteamAPI_ManualDispatch_RunFrame(hSteamPipe);
+	CallbackMsg_t message;
+	while (SteamAPI_ManualDispatch_GetNextCallback(hSteamPipe, &message)) {
+		if (message.m_iCallback == SteamAPICallCompleted_t::k_iCallback) {
+			const SteamAPICallCompleted_t *completed = (SteamAPICallCompleted_t*)message.m_pubParam;
+			auto entry = pendingCalls.find(completed->m_hAsyncCall);
+			if (entry != pendingCalls.end()) {
+				entry->second->CompleteManual(hSteamPipe);
+			}
+		}
+		else if (!callbacks.DispatchManual(message.m_iCallback, message.m_pubParam)) {
+			workshop.DispatchManual(message.m_iCallback, message.m_pubParam);
+		}
+		SteamAPI_ManualDispatch_FreeLastCallback(hSteamPipe);
+	}
+}
 //-----------------------------------------------
 // Steamworks functions
 //-----------------------------------------------
 SW_PY bool SteamInit(){
 	return SteamAPI_Init();
 }
+// Switch RunCallbacks to manual dispatch; call once, after SteamInit succeeded
+SW_PY void SteamUseManualDispatch() {
+	if (!manualDispatch) {
+		SteamAPI_ManualDispatch_Init();
+		manualDispatch = true;
+	}
+}
 SW_PY void SteamShutdown() {
+  DeleteAllCalls();
+  eventQueue.SetQueueMode(false, 0);
   SteamAPI_Shutdown();
+  manualDispatch = false;
 }
 // Returns true/false if Steam is running
 SW_PY bool IsSteamRunning(void){
@@ -382,7 +917,13 @@ CSteamID CreateSteamID(uint32 steamID, int accountType){
 }
 // Callbacks
 SW_PY void RunCallbacks(){
-	SteamAPI_RunCallbacks();
+	if (manualDispatch) {
+		RunManualDispatch();
+	}
+	else {
+		SteamAPI_RunCallbacks();
+	}
+	DeleteCompletedCalls();
 }
 //-----------------------------------------------
 // Steam Apps
@@ -869,17 +1410,28 @@ SW_PY void Workshop_SetItemCreatedCallback(CreateItemResultCallback_t callback){
 	}
 	workshop.SetItemCreatedCallback(callback);
 }
-SW_PY void Workshop_CreateItem(AppId_t consumerAppId, EWorkshopFileType fileType){
+SW_PY SteamAPICall_t Workshop_CreateItem(AppId_t consumerAppId, EWorkshopFileType fileType){
 	if(SteamUGC() == NULL){
-		return;
+		return k_uAPICallInvalid;
 	}
-	workshop.CreateItem(consumerAppId, fileType);
+	return workshop.CreateItem(consumerAppId, fileType);
 }
-SW_PY void Workshop_QueryUGCItem(PublishedFileId_t nPublishedFileID) {
+SW_PY SteamAPICall_t Workshop_QueryUGCItem(PublishedFileId_t nPublishedFileID) {
 	if (SteamUGC() == NULL) {
-		return;
+		return k_uAPICallInvalid;
 	}
-	workshop.QueryUGCItem(nPublishedFileID);
+	return workshop.QueryUGCItem(nPublishedFileID);
+}
+// Size of SteamUGCDetails_t as the SDK packs it, for checking the layout Python reads it with
+SW_PY uint32 Workshop_GetUGCDetailsSize() {
+	return (uint32)sizeof(SteamUGCDetails_t);
+}
+// Query the details of up to kNumUGCResultsPerPage items in one request
+SW_PY SteamAPICall_t Workshop_QueryUGCItems(PublishedFileId_t *pPublishedFileIDs, uint32 count) {
+	if (SteamUGC() == NULL || count == 0 || count > kNumUGCResultsPerPage) {
+		return k_uAPICallInvalid;
+	}
+	return workshop.QueryUGCItems(pPublishedFileIDs, count);
 }
 SW_PY UGCUpdateHandle_t Workshop_StartItemUpdate(AppId_t consumerAppId, PublishedFileId_t publishedFileId){
 	return SteamUGC()->StartItemUpdate(consumerAppId, publishedFileId);
@@ -951,11 +1503,11 @@ SW_PY void Workshop_SetItemUpdatedCallback(SubmitItemUpdateResultCallback_t call
 	}
 	workshop.SetItemUpdatedCallback(callback);
 }
-SW_PY void Workshop_SubmitItemUpdate(UGCUpdateHandle_t updateHandle, const char *pChangeNote){
+SW_PY SteamAPICall_t Workshop_SubmitItemUpdate(UGCUpdateHandle_t updateHandle, const char *pChangeNote){
 	if(SteamUGC() == NULL){
-		return;
+		return k_uAPICallInvalid;
 	}
-	workshop.SubmitItemUpdate(updateHandle, pChangeNote);
+	return workshop.SubmitItemUpdate(updateHandle, pChangeNote);
 }
 SW_PY int Workshop_GetItemUpdateProgress(UGCUpdateHandle_t handle, uint64 *punBytesProcessed, uint64* punBytesTotal){
 	return static_cast<int>(SteamUGC()->GetItemUpdateProgress(handle, punBytesProcessed, punBytesTotal));;
@@ -1010,6 +1562,39 @@ SW_PY bool Workshop_GetItemInstallInfo(PublishedFileId_t nPublishedFileID, uint6
 	}
 	return SteamUGC()->GetItemInstallInfo(nPublishedFileID, punSizeOnDisk, pchFolder, cchFolderSize, punTimeStamp);
 }
+// Fills the state, size on disk, timestamp and folder of count items into parallel arrays.
+// Folder paths are packed one after another into pchFolders, without terminators, and
+// punFolderEnds gets the offset just past each one; items that are not installed get
+// zeros and an empty path. *pcchFoldersNeeded is set to the bytes all the paths take;
+// if that is more than cchFoldersSize, the paths from the first one that did not fit on
+// are left out, so call again with a larger buffer. Returns false if Steam is not available.
+SW_PY bool Workshop_GetItemsInstallInfo(const PublishedFileId_t *pPublishedFileIDs, uint32 count, uint32 *punStates, uint64 *punSizesOnDisk, uint32 *punTimeStamps, uint32 *punFolderEnds, char *pchFolders, uint32 cchFoldersSize, uint32 *pcchFoldersNeeded){
+	if(SteamUGC() == NULL){
+		return false;
+	}
+	char folder[1024];
+	uint32 used = 0;
+	bool fits = true;
+	for(uint32 i = 0; i < count; i++){
+		punStates[i] = SteamUGC()->GetItemState(pPublishedFileIDs[i]);
+		uint32 length = 0;
+		if(SteamUGC()->GetItemInstallInfo(pPublishedFileIDs[i], &punSizesOnDisk[i], folder, sizeof(folder), &punTimeStamps[i])){
+			length = (uint32)strlen(folder);
+			fits = fits && length <= cchFoldersSize - used;
+			if(fits){
+				memcpy(pchFolders + used, folder, length);
+			}
+		}
+		else{
+			punSizesOnDisk[i] = 0;
+			punTimeStamps[i] = 0;
+		}
+		used += length;
+		punFolderEnds[i] = used;
+	}
+	*pcchFoldersNeeded = used;
+	return true;
+}
 SW_PY bool Workshop_GetItemDownloadInfo(PublishedFileId_t publishedFileID, uint64 *punBytesDownloaded, uint64 *punBytesTotal){
 	if(SteamUGC() == NULL){
 		return false;
@@ -1025,9 +1610,49 @@ SW_PY void Leaderboard_SetFindLeaderboardResultCallback(LeaderboardFindResultCal
 	}
 	leaderboard.SetLeaderboardFindResultCallback(callback);
 }
-SW_PY void Leaderboard_FindLeaderboard(const char *pchLeaderboardName){
+SW_PY SteamAPICall_t Leaderboard_FindLeaderboard(const char *pchLeaderboardName){
 	if(SteamUserStats() == NULL){
-		return;
+		return k_uAPICallInvalid;
+	}
+	return leaderboard.FindLeaderboard(pchLeaderboardName);
+}
+//-----------------------------------------------
+// Batched calls
+//-----------------------------------------------
+// Operation codes, must match SteamBatch in steamworks/batch.py
+#define BATCH_STAT_INT 0
+#define BATCH_STAT_FLOAT 1
+#define BATCH_ACHIEVEMENT 2
+#define BATCH_GLOBAL_STAT_INT 3
+#define BATCH_GLOBAL_STAT_FLOAT 4
+#define BATCH_ITEM_STATE 5
+#define BATCH_DLC_INSTALLED 6
+#define BATCH_HAS_OTHER_APP 7
+struct BatchOp {
+	int32 op;
+	int32 reserved;
+	uint64 arg;
+	const char *name;
+};
+union BatchResult {
+	int64 i;
+	double f;
+};
+// Runs every operation in order and writes one result per operation; returns the number run
+SW_PY int32 Batch_Run(const BatchOp *ops, int32 count, BatchResult *results){
+	for(int32 i = 0; i < count; i++){
+		const BatchOp &op = ops[i];
+		switch(op.op){
+			case BATCH_STAT_INT: results[i].i = GetStatInt(op.name); break;
+			case BATCH_STAT_FLOAT: results[i].f = GetStatFloat(op.name); break;
+			case BATCH_ACHIEVEMENT: results[i].i = GetAchievement(op.name); break;
+			case BATCH_GLOBAL_STAT_INT: results[i].i = GetGlobalStatInt(op.name); break;
+			case BATCH_GLOBAL_STAT_FLOAT: results[i].f = GetGlobalStatFloat(op.name); break;
+			case BATCH_ITEM_STATE: results[i].i = Workshop_GetItemState(op.arg); break;
+			case BATCH_DLC_INSTALLED: results[i].i = IsDlcInstalled((int32)op.arg); break;
+			case BATCH_HAS_OTHER_APP: results[i].i = HasOtherApp((int32)op.arg); break;
+			default: return i;
+		}
 	}
-	leaderboard.FindLeaderboard(pchLeaderboardName);
+	return count;
 }
@@ -0,0 +1,35 @@
+#================================================
+# Shared fixtures for the SteamworksPy unit tests
+#================================================
+#
+# The tests run against SimulatedBackend, so they need neither Steam nor a
+# compiled SteamworksPy library. Run them from the repository root with
+#
+#   python -m pytest Tests/unit
+import os, sys
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+import pytest
+from steamworks import Steam
+from steamworks.simulated import SimulatedBackend
+#------------------------------------------------
+# A loaded Steam session on a simulated client that answers right away
+#------------------------------------------------
+@pytest.fixture
+def backend():
+    backend = SimulatedBackend(latency=0)
+    assert Steam.Init(backend=backend)
+    yield backend
+    Steam.Shutdown()
+#------------------------------------------------
+# pump(done) runs callbacks until done() or nothing is left in flight
+#------------------------------------------------
+@pytest.fixture
+def pump():
+    def pump(done=lambda: False, budget_ms=None, rounds=1000):
+        for _ in range(rounds):
+            Steam.RunCallbacks(budget_ms)
+            if done() or (not Steam.CallsInFlight() and not Steam.QueuedEvents()):
+                return
+        raise AssertionError("callbacks did not finish in %d rounds" % rounds)
+    return pump
@@ -0,0 +1,66 @@
+#================================================
+# steamworks.aio: awaitable call results
+#================================================
+import asyncio
+import pytest
+from steamworks import Steam, EResult
+import steamworks.aio as aio
+
+@pytest.fixture
+def items(backend):
+    for publishedFileId in range(1, 61):
+        backend.AddItem(publishedFileId, title=b"item %d" % publishedFileId)
+    return backend
+
+def run(coroutine):
+    async def pumped():
+        pump = aio.StartPump(hz=1000)
+        try:
+            return await coroutine
+        finally:
+            pump.cancel()
+    return asyncio.run(pumped())
+
+def test_awaits_the_result(items):
+    details = run(aio.QueryUGCItem(5))
+    assert (details.result, details.title) == (EResult['OK'], b"item 5")
+
+def test_many_calls_in_flight_at_once(items):
+    async def queryAll():
+        return await asyncio.gather(*[aio.QueryUGCItem(publishedFileId) for publishedFileId in range(1, 11)])
+    assert [details.published_file_id for details in run(queryAll())] == list(range(1, 11))
+
+def test_query_many_items(items):
+    details = run(aio.QueryUGCItems(range(1, 61)))
+    assert [item.published_file_id for item in details] == list(range(1, 61))
+
+def test_timeout_raises_and_cancels_the_call(items):
+    items.latency = 60
+    with pytest.raises(asyncio.TimeoutError):
+        run(aio.QueryUGCItem(1, timeout=0.05))
+    assert Steam.CallsInFlight() == 0
+    assert not items._callsInFlight
+
+def test_query_many_timeout_cancels_every_request(items):
+    items.latency = 60
+    with pytest.raises(asyncio.TimeoutError):
+        run(aio.QueryUGCItems(range(1, 61), timeout=0.05))
+    assert Steam.CallsInFlight() == 0
+    assert not items._callsInFlight
+
+def test_cancelled_task_cancels_the_call(items):
+    items.latency = 60
+    async def cancelQuery():
+        task = asyncio.ensure_future(aio.QueryUGCItem(1))
+        await asyncio.sleep(0.01)
+        assert Steam.CallsInFlight() == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    run(cancelQuery())
+    assert Steam.CallsInFlight() == 0
+    assert not items._callsInFlight
+
+def test_not_loaded_raises():
+    with pytest.raises(RuntimeError):
+        asyncio.run(aio.QueryUGCItem(1))
@@ -0,0 +1,80 @@
+#================================================
+# Call result deadlines and cancellation
+#================================================
+import time
+from steamworks import Steam, SteamWorkshop, EResult
+
+# Callbacks get a view that is only valid during the call
+def keep(found):
+    return lambda details: found.append(details.copy())
+
+def waitFor(done, seconds=2.0):
+    end = time.monotonic() + seconds
+    while not done() and time.monotonic() < end:
+        Steam.RunCallbacks()
+        time.sleep(0.005)
+    return done()
+
+def test_expired_call_gets_a_timeout_result(backend):
+    backend.latency = 60
+    backend.AddItem(1)
+    found = []
+    hCall = SteamWorkshop.QueryUGCItem(1, keep(found), timeout=0.05)
+    assert hCall
+    assert waitFor(lambda: found)
+    assert found[0].result == EResult['Timeout']
+    assert found[0].published_file_id == 1
+    assert Steam.CallsInFlight() == 0
+    # Cancelled natively too, so the late result never arrives
+    assert hCall not in backend._callsInFlight
+
+def test_call_timeout_is_the_default_deadline(backend, monkeypatch):
+    backend.latency = 60
+    monkeypatch.setattr(Steam, 'callTimeout', 0.05)
+    found = []
+    SteamWorkshop.QueryUGCItems([1, 2], found.append)
+    assert waitFor(lambda: found)
+    assert [details.result for details in found[0]] == [EResult['Timeout']] * 2
+
+def test_answered_call_does_not_time_out(backend, pump):
+    backend.AddItem(1)
+    found = []
+    SteamWorkshop.QueryUGCItem(1, keep(found), timeout=0.05)
+    pump(lambda: found)
+    time.sleep(0.1)
+    Steam.RunCallbacks()
+    assert [details.result for details in found] == [EResult['OK']]
+
+def test_cancelled_call_never_reaches_its_handler(backend, pump):
+    backend.AddItem(1)
+    found = []
+    hCall = SteamWorkshop.QueryUGCItem(1, keep(found), timeout=0.05)
+    assert Steam.CancelCall(hCall) is True
+    assert Steam.CancelCall(hCall) is False
+    time.sleep(0.1)
+    pump()
+    assert found == []
+    assert Steam.CallsInFlight() == 0
+    assert not backend._callsInFlight
+
+def test_handler_can_cancel_its_own_call(backend, pump):
+    backend.AddItem(1)
+    cancelled = []
+    def handler(details):
+        cancelled.append(Steam.CancelCall(hCall))
+    hCall = SteamWorkshop.QueryUGCItem(1, handler)
+    pump(lambda: cancelled)
+    assert cancelled == [False]
+    assert Steam.CallsInFlight() == 0
+
+def test_cancel_while_the_result_is_queued(backend, pump):
+    backend.AddItem(1)
+    Steam.EnableEventQueue()
+    found = []
+    hCall = SteamWorkshop.QueryUGCItem(1, keep(found))
+    # Delivered into the native queue, but not yet drained
+    Steam.lib.RunCallbacks()
+    assert Steam.CancelCall(hCall) is True
+    pump()
+    assert found == []
+    assert Steam.QueuedEvents() == 0
@@ -0,0 +1,75 @@
+#================================================
+# Steam.Subscribe / Steam.Unsubscribe: several subscribers per event type
+#================================================
+import pytest
+from steamworks import Steam, SteamFriends, SteamWorkshop, EventType
+
+@pytest.fixture
+def subscribe(backend):
+    subscribed = []
+    def subscribe(eventType, function):
+        subscribed.append((eventType, function))
+        return Steam.Subscribe(eventType, function)
+    yield subscribe
+    for eventType, function in subscribed:
+        Steam.Unsubscribe(eventType, function)
+
+def overlay(backend, active):
+    backend._fire('GameOverlayActivated', SteamFriends.GameOverlayActivated_t(active=active))
+
+def test_every_subscriber_gets_the_event(backend, subscribe):
+    first, second = [], []
+    subscribe('GameOverlayActivated', lambda event: first.append(event.active))
+    subscribe(EventType['GameOverlayActivated'], lambda event: second.append(event.active))
+    overlay(backend, 1)
+    assert first == [1] and second == [1]
+
+def test_native_setter_is_cleared_with_the_last_subscriber(backend, subscribe):
+    assert backend.callbacks.get('GameOverlayActivated') is None
+    first, second = [], []
+    firstHandler = lambda event: first.append(event.active)
+    secondHandler = lambda event: second.append(event.active)
+    subscribe('GameOverlayActivated', firstHandler)
+    subscribe('GameOverlayActivated', secondHandler)
+    trampoline = backend.callbacks['GameOverlayActivated']
+    assert trampoline is not None
+    assert Steam.Unsubscribe('GameOverlayActivated', firstHandler)
+    # One trampoline per type, kept while anyone listens
+    assert backend.callbacks['GameOverlayActivated'] is trampoline
+    overlay(backend, 1)
+    assert (first, second) == ([], [1])
+    assert Steam.Unsubscribe('GameOverlayActivated', secondHandler)
+    assert backend.callbacks['GameOverlayActivated'] is None
+    assert Steam.Unsubscribe('GameOverlayActivated', secondHandler) is False
+
+def test_legacy_setter_and_subscribers_share_the_event(backend, subscribe):
+    legacy, subscriber = [], []
+    SteamFriends.SetGameOverlayActivatedCallback(lambda event: legacy.append(event.active))
+    subscribe('GameOverlayActivated', lambda event: subscriber.append(event.active))
+    overlay(backend, 0)
+    SteamFriends.SetGameOverlayActivatedCallback(None)
+    overlay(backend, 1)
+    assert legacy == [0]
+    assert subscriber == [0, 1]
+
+def test_call_results_are_fanned_out_to_subscribers(backend, subscribe, pump):
+    backend.AddItem(7, title=b"seven")
+    seen, answered = [], []
+    subscribe('SteamUGCQueryCompleted', lambda details: seen.append(details.title))
+    SteamWorkshop.QueryUGCItem(7, lambda details: answered.append(details.published_file_id))
+    pump(lambda: seen)
+    assert answered == [7]
+    assert seen == [b"seven"]
+
+def test_every_event_type_can_be_subscribed(backend):
+    handler = lambda *args: None
+    for name in EventType:
+        assert Steam.Subscribe(name, handler) is True
+        assert Steam.Unsubscribe(name, handler) is True
+
+def test_unknown_event_type_raises(backend):
+    with pytest.raises(ValueError):
+        Steam.Subscribe('Bogus', lambda event: None)
+
+def test_subscribe_fails_when_not_loaded():
+    assert Steam.Subscribe('GameOverlayActivated', lambda event: None) is False
@@ -0,0 +1,95 @@
+#================================================
+# Native event queue: bulk drain and dispatch
+#================================================
+import asyncio
+import pytest
+from steamworks import Steam, SteamFriends, SteamWorkshop, EventType, EResult
+import steamworks.aio as aio
+
+@pytest.fixture
+def overlays(backend):
+    active = []
+    handler = lambda event: active.append(event.active)
+    Steam.Subscribe('GameOverlayActivated', handler)
+    yield active
+    Steam.Unsubscribe('GameOverlayActivated', handler)
+
+def overlay(backend, active):
+    backend._fire('GameOverlayActivated', SteamFriends.GameOverlayActivated_t(active=active))
+
+def test_queued_events_wait_for_run_callbacks(backend, overlays):
+    Steam.EnableEventQueue()
+    overlay(backend, 1)
+    overlay(backend, 0)
+    assert overlays == []
+    assert Steam.QueuedEvents() == 2
+    Steam.RunCallbacks()
+    assert overlays == [1, 0]
+    assert Steam.QueuedEvents() == 0
+
+def test_records_can_be_drained_and_dispatched_by_the_caller(backend, overlays):
+    Steam.EnableEventQueue(dispatch=False)
+    overlay(backend, 1)
+    Steam.RunCallbacks()
+    assert overlays == []
+    records = Steam.DrainEvents()
+    events = list(Steam.Events(records))
+    assert [(eventType, handle, ioFailure) for eventType, handle, ioFailure, offset, size in events] == \
+        [(EventType['GameOverlayActivated'], 0, False)]
+    assert Steam.DispatchEvents(records) == len(records)
+    assert overlays == [1]
+
+def test_callbacks_past_capacity_are_dropped(backend, overlays):
+    # Room for two records of a header and a one-byte struct
+    Steam.EnableEventQueue(capacity=2 * Steam.EVENT_HEADER.size + 16)
+    for active in range(5):
+        overlay(backend, active)
+    Steam.RunCallbacks()
+    assert overlays == [0, 1]
+    assert Steam.DroppedEvents() == 3
+
+def test_large_call_results_grow_the_queue(backend, pump):
+    for publishedFileId in range(1, 101):
+        backend.AddItem(publishedFileId)
+    Steam.EnableEventQueue(capacity=1024)
+    found = []
+    SteamWorkshop.QueryUGCItems(range(1, 101), found.append)
+    pump(lambda: found)
+    assert all(details.result == EResult['OK'] for details in found[0])
+    assert Steam.DroppedEvents() == 0
+    assert len(Steam._eventQueue[0]) > 1024
+
+def test_result_past_the_queue_limit_is_an_io_failure(backend, monkeypatch):
+    monkeypatch.setattr(Steam, 'EVENT_QUEUE_MAX_CAPACITY', 1024)
+    backend.AddItem(1)
+    Steam.EnableEventQueue(capacity=1024)
+    async def query():
+        pump = aio.StartPump(hz=1000)
+        try:
+            return await aio.QueryUGCItem(1, timeout=2)
+        finally:
+            pump.cancel()
+    with pytest.raises(aio.CallResultError):
+        asyncio.run(query())
+    assert Steam.CallsInFlight() == 0
+
+def test_enabling_again_keeps_queued_results(backend, pump):
+    backend.AddItem(1)
+    Steam.EnableEventQueue()
+    found = []
+    SteamWorkshop.QueryUGCItems([1], found.append)
+    Steam.lib.RunCallbacks()
+    Steam.EnableEventQueue(capacity=4096)
+    assert len(found) == 1
+    assert Steam.CallsInFlight() == 0
+
+def test_shutdown_turns_the_queue_off(backend, pump):
+    backend.AddItem(1)
+    Steam.EnableEventQueue()
+    Steam.Shutdown()
+    assert backend.eventQueueCapacity == 0
+    assert Steam.Init(backend=backend)
+    found = []
+    SteamWorkshop.QueryUGCItems([1], found.append)
+    Steam.RunCallbacks()
+    assert len(found) == 1
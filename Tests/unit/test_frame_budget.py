@@ -0,0 +1,72 @@
+#================================================
+# RunCallbacks(budget_ms): frame-budgeted dispatch
+#================================================
+import time
+import pytest
+from steamworks import Steam, SteamFriends
+
+@pytest.fixture
+def slowHandler(backend):
+    calls = []
+    def handler(*args):
+        time.sleep(0.005)
+        calls.append(time.perf_counter())
+    Steam.Subscribe('IPCountry', handler)
+    yield calls
+    Steam.Unsubscribe('IPCountry', handler)
+
+def changeCountry(backend, times):
+    for i in range(times):
+        backend.SetIPCountry(b"C%d" % i)
+
+def test_budget_turns_the_queue_on(backend):
+    assert Steam._eventQueue is None
+    Steam.RunCallbacks(budget_ms=2)
+    assert Steam._eventQueue is not None
+
+def test_events_past_the_budget_roll_over(backend, slowHandler):
+    changeCountry(backend, 5)
+    Steam.RunCallbacks(budget_ms=1)
+    # At least one event runs per call, and the budget stops the rest
+    assert len(slowHandler) == 1
+    assert Steam.QueuedEvents() == 4
+    rounds = 1
+    while Steam.QueuedEvents():
+        Steam.RunCallbacks(budget_ms=1)
+        rounds += 1
+    assert len(slowHandler) == 5
+    assert rounds == 5
+
+def test_unbudgeted_call_runs_the_backlog(backend, slowHandler):
+    changeCountry(backend, 4)
+    Steam.RunCallbacks(budget_ms=1)
+    assert Steam.QueuedEvents() == 3
+    Steam.RunCallbacks()
+    assert len(slowHandler) == 4
+    assert Steam.QueuedEvents() == 0
+
+def test_rolled_over_events_keep_their_order(backend):
+    seen = []
+    def handler(event):
+        time.sleep(0.002)
+        seen.append(event.active)
+    Steam.Subscribe('GameOverlayActivated', handler)
+    try:
+        Steam.EnableEventQueue()
+        for active in range(3):
+            backend._fire('GameOverlayActivated', SteamFriends.GameOverlayActivated_t(active=active))
+        Steam.RunCallbacks(budget_ms=1)
+        # Queued after the backlog, so dispatched after it
+        backend._fire('GameOverlayActivated', SteamFriends.GameOverlayActivated_t(active=3))
+        while Steam.QueuedEvents():
+            Steam.RunCallbacks(budget_ms=1)
+        assert seen == [0, 1, 2, 3]
+    finally:
+        Steam.Unsubscribe('GameOverlayActivated', handler)
+
+def test_disabling_the_queue_dispatches_the_backlog(backend, slowHandler):
+    changeCountry(backend, 3)
+    Steam.RunCallbacks(budget_ms=1)
+    Steam.DisableEventQueue()
+    assert len(slowHandler) == 3
+    assert Steam.QueuedEvents() == 0
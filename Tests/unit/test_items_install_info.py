@@ -0,0 +1,75 @@
+#================================================
+# SteamWorkshop.GetItemsInstallInfo: bulk state and install info
+#================================================
+import pytest
+from steamworks import Steam, SteamWorkshop, SteamBackend
+
+@pytest.fixture
+def items(backend, monkeypatch):
+    monkeypatch.setattr(SteamWorkshop, '_folderBuffer', bytearray(1 << 16))
+    for publishedFileId in range(1, 201):
+        backend.AddItem(publishedFileId, timeUpdated=1000 + publishedFileId, sizeOnDisk=publishedFileId * 10,
+                        folder=b"/steam/workshop/content/480/%d" % publishedFileId, installed=publishedFileId % 3 != 0)
+    return list(range(1, 201)) + [999]
+
+def test_matches_the_per_item_calls(items):
+    info = SteamWorkshop.GetItemsInstallInfo(items)
+    assert [entry.published_file_id for entry in info] == items
+    for entry in info:
+        assert entry.state == SteamWorkshop.GetItemState(entry.published_file_id)
+        installed = SteamWorkshop.GetItemInstallInfo(entry.published_file_id)
+        if installed:
+            assert (entry.size_on_disk, entry.timestamp, entry.folder) == (installed.size_on_disk, installed.timestamp, installed.folder)
+        else:
+            assert (entry.size_on_disk, entry.timestamp, entry.folder) == (0, 0, "")
+
+def test_small_folder_buffer_is_grown_and_retried(items, backend, monkeypatch):
+    monkeypatch.setattr(SteamWorkshop, '_folderBuffer', bytearray(16))
+    calls = []
+    getInfo = backend.Workshop_GetItemsInstallInfo
+    monkeypatch.setattr(backend, 'Workshop_GetItemsInstallInfo', lambda *args: calls.append(1) or getInfo(*args))
+    info = SteamWorkshop.GetItemsInstallInfo(items)
+    assert len(calls) == 2
+    assert info[0].folder == "/steam/workshop/content/480/1"
+    assert info[199].folder == "/steam/workshop/content/480/200"
+    calls.clear()
+    SteamWorkshop.GetItemsInstallInfo(items)
+    assert len(calls) == 1
+
+def test_failed_native_call_returns_false(items, backend, monkeypatch):
+    calls = []
+    monkeypatch.setattr(backend, 'Workshop_GetItemsInstallInfo', lambda *args: calls.append(1) or False)
+    assert SteamWorkshop.GetItemsInstallInfo(items) is False
+    assert len(calls) == 1
+
+def test_buffer_growth_is_capped(items, backend, monkeypatch):
+    # A library that always asks for more than any item can need
+    def greedy(*args):
+        args[-1].contents.value = 1 << 30
+        return True
+    monkeypatch.setattr(backend, 'Workshop_GetItemsInstallInfo', greedy)
+    assert SteamWorkshop.GetItemsInstallInfo(items) is False
+    assert len(SteamWorkshop._folderBuffer) == 1 << 16
+
+def test_retries_are_bounded(items, backend, monkeypatch):
+    # A library that never has enough room, as if items kept being installed
+    calls = []
+    def growing(*args):
+        calls.append(1)
+        args[-1].contents.value = args[-2] + 1
+        return True
+    monkeypatch.setattr(backend, 'Workshop_GetItemsInstallInfo', growing)
+    assert SteamWorkshop.GetItemsInstallInfo(items) is False
+    assert len(calls) == 3
+
+def test_backend_without_the_export_returns_false(monkeypatch):
+    # SteamBackend answers every export it does not implement with the default of its return type
+    monkeypatch.setattr(Steam, 'lib', SteamBackend())
+    monkeypatch.setattr(Steam, 'loaded', True)
+    assert SteamWorkshop.GetItemsInstallInfo([1, 2, 3]) is False
+
+def test_not_loaded_returns_false():
+    assert SteamWorkshop.GetItemsInstallInfo([1]) is False
+
+def test_empty_list(backend):
+    assert SteamWorkshop.GetItemsInstallInfo([]) == []
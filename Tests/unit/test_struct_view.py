@@ -0,0 +1,47 @@
+#================================================
+# StructView: call results passed by pointer
+#================================================
+import pytest
+from steamworks import Steam, SteamWorkshop
+
+@pytest.fixture
+def items(backend):
+    for publishedFileId in range(1, 4):
+        backend.AddItem(publishedFileId, title=b"item %d" % publishedFileId, timeUpdated=publishedFileId)
+
+@pytest.fixture(params=[False, True], ids=['direct', 'queued'])
+def mode(request, backend):
+    if request.param:
+        Steam.EnableEventQueue()
+    return request.param
+
+def test_view_is_unusable_after_the_handler(items, mode, pump):
+    kept = []
+    def handler(view):
+        kept.append((view, view.copy(), view.title))
+    SteamWorkshop.QueryUGCItem(2, handler)
+    pump(lambda: kept)
+    view, copy, title = kept[0]
+    assert title == b"item 2"
+    with pytest.raises(ValueError):
+        view.title
+    with pytest.raises(ValueError):
+        view.copy()
+    assert repr(view) == "<StructView released>"
+    # The copy belongs to the caller
+    assert (copy.published_file_id, copy.title, copy.time_updated) == (2, b"item 2", 2)
+
+def test_trailing_records_can_be_copied_inside_the_handler(items, mode, pump):
+    kept = []
+    def handler(view):
+        kept.append((view, view.copyTrailing(SteamWorkshop.SteamUGCDetails_t, view.num_results)))
+    Steam.Subscribe('UGCQueryBatch', handler)
+    try:
+        SteamWorkshop.QueryUGCItems([1, 2, 3], lambda found: None)
+        pump(lambda: kept)
+    finally:
+        Steam.Unsubscribe('UGCQueryBatch', handler)
+    view, details = kept[0]
+    assert [(item.published_file_id, item.title) for item in details] == [(1, b"item 1"), (2, b"item 2"), (3, b"item 3")]
+    with pytest.raises(ValueError):
+        view.copyTrailing(SteamWorkshop.SteamUGCDetails_t, 3)
@@ -0,0 +1,63 @@
+#================================================
+# SteamWorkshop.SubscribedItems: reusable subscribed-items buffer
+#================================================
+from array import array
+import pytest
+from steamworks import SteamWorkshop
+
+@pytest.fixture
+def counted(backend, monkeypatch):
+    # Start from an empty buffer and count how often the wrapper asks for the number of items
+    monkeypatch.setattr(SteamWorkshop, '_subscribedBuffer', (array('Q'), None))
+    calls = []
+    getCount = backend.Workshop_GetNumSubscribedItems
+    monkeypatch.setattr(backend, 'Workshop_GetNumSubscribedItems', lambda: calls.append(1) or getCount())
+    return calls
+
+def subscribe(backend, ids):
+    for publishedFileId in ids:
+        backend.AddItem(publishedFileId)
+
+def test_returns_every_subscribed_item(backend, counted):
+    subscribe(backend, range(1, 101))
+    backend.AddItem(500, subscribed=False)
+    assert SteamWorkshop.SubscribedItems().tolist() == list(range(1, 101))
+
+def test_count_is_only_asked_for_when_the_buffer_fills(backend, counted):
+    subscribe(backend, range(1, 41))
+    SteamWorkshop.SubscribedItems()
+    asked = len(counted)
+    assert asked == 1
+    for _ in range(5):
+        assert len(SteamWorkshop.SubscribedItems()) == 40
+    assert len(counted) == asked
+
+def test_buffer_grows_by_powers_of_two(backend, counted):
+    subscribe(backend, range(1, 41))
+    SteamWorkshop.SubscribedItems()
+    assert len(SteamWorkshop._subscribedBuffer[0]) == 64
+    subscribe(backend, range(41, 201))
+    assert SteamWorkshop.SubscribedItems().tolist() == list(range(1, 201))
+    assert len(SteamWorkshop._subscribedBuffer[0]) == 256
+
+def test_views_handed_out_before_growing_stay_valid(backend, counted):
+    subscribe(backend, range(1, 11))
+    before = SteamWorkshop.SubscribedItems()
+    subscribe(backend, range(11, 101))
+    SteamWorkshop.SubscribedItems()
+    assert before.tolist() == list(range(1, 11))
+
+def test_get_subscribed_items_returns_a_list(backend, counted):
+    subscribe(backend, range(1, 11))
+    assert SteamWorkshop.GetSubscribedItems() == list(range(1, 11))
+    assert SteamWorkshop.GetSubscribedItems(3) == [1, 2, 3]
+
+def test_numpy_view(backend, counted):
+    numpy = pytest.importorskip('numpy')
+    subscribe(backend, range(1, 11))
+    items = SteamWorkshop.SubscribedItems(asNumpy=True)
+    assert items.dtype == numpy.uint64
+    assert items.tolist() == list(range(1, 11))
+
+def test_not_loaded_returns_false():
+    assert SteamWorkshop.SubscribedItems() is False
@@ -0,0 +1,80 @@
+#================================================
+# SteamWorkshop.QueryUGCItems: batched details queries
+#================================================
+from ctypes import sizeof
+import pytest
+from steamworks import Steam, SteamWorkshop, EResult
+from steamworks.core import STEAM_CALLBACK_PACK
+
+def addItems(backend, ids):
+    for publishedFileId in ids:
+        backend.AddItem(publishedFileId, title=b"item %d" % publishedFileId, timeUpdated=publishedFileId)
+
+def test_splits_ids_into_requests_of_batch_size(backend):
+    addItems(backend, range(1, 601))
+    hCalls = SteamWorkshop.QueryUGCItems(range(1, 601), lambda found: None)
+    assert len(hCalls) == 600 // SteamWorkshop.UGC_QUERY_BATCH_SIZE
+    assert all(hCalls)
+
+def test_callback_gets_every_item_in_order_once(backend, pump):
+    addItems(backend, range(1, 121))
+    found = []
+    SteamWorkshop.QueryUGCItems(range(1, 121), found.append)
+    pump(lambda: found)
+    assert len(found) == 1
+    assert [details.published_file_id for details in found[0]] == list(range(1, 121))
+    assert all(details.result == EResult['OK'] for details in found[0])
+    assert found[0][41].title == b"item 42"
+    assert Steam.CallsInFlight() == 0
+
+def test_empty_list_answers_right_away(backend):
+    found = []
+    assert SteamWorkshop.QueryUGCItems([], found.append) == []
+    assert found == [[]]
+
+def test_failed_request_reports_each_item_with_its_result(backend, pump):
+    addItems(backend, range(1, 61))
+    backend.resultCodes['QueryUGCItems'] = EResult['FileNotFound']
+    found = []
+    SteamWorkshop.QueryUGCItems(range(1, 61), found.append)
+    pump(lambda: found)
+    assert [details.published_file_id for details in found[0]] == list(range(1, 61))
+    assert all(details.result == EResult['FileNotFound'] for details in found[0])
+
+def test_not_loaded_returns_false():
+    assert SteamWorkshop.QueryUGCItems([1], lambda found: None) is False
+
+def test_budgeted_queue_delivers_everything_without_drops(backend, pump):
+    addItems(backend, range(1, 151))
+    Steam.EnableEventQueue(capacity=4096)
+    found = []
+    SteamWorkshop.QueryUGCItems(range(1, 151), found.append)
+    pump(lambda: found, budget_ms=2)
+    assert len(found[0]) == 150
+    assert all(details.result == EResult['OK'] for details in found[0])
+    assert backend.droppedEvents == 0
+    assert Steam.CallsInFlight() == 0
+
+def test_results_past_queue_limit_arrive_as_io_failures(backend, pump, monkeypatch):
+    # A whole batch of details is far larger than this, so no result fits
+    monkeypatch.setattr(Steam, 'EVENT_QUEUE_MAX_CAPACITY', 4096)
+    addItems(backend, range(1, 101))
+    Steam.EnableEventQueue(capacity=4096)
+    found = []
+    SteamWorkshop.QueryUGCItems(range(1, 101), found.append)
+    pump(lambda: found)
+    assert [details.published_file_id for details in found[0]] == list(range(1, 101))
+    assert all(details.result == EResult['IOFailure'] for details in found[0])
+    assert backend.droppedEvents == 2
+    assert Steam.CallsInFlight() == 0
+
+def test_details_layout_mismatch_is_reported(backend, monkeypatch):
+    monkeypatch.setattr(backend, 'Workshop_GetUGCDetailsSize', lambda: sizeof(SteamWorkshop.SteamUGCDetails_t) + 4)
+    with pytest.raises(RuntimeError):
+        SteamWorkshop.QueryUGCItems([1], lambda found: None)
+    assert Steam.CallsInFlight() == 0
+
+def test_details_are_packed_like_the_sdk():
+    # Past the 129-byte title and 8000-byte description, 4-byte packing and natural alignment differ
+    expected = 8160 if STEAM_CALLBACK_PACK == 8 else 8156
+    assert SteamWorkshop.SteamUGCDetails_t.steam_owner_id.offset == expected
@@ -0,0 +1,81 @@
+#================================================
+# UGCDetailsCache: LRU, expiry, coalescing and invalidation
+#================================================
+import pytest
+from steamworks import Steam, SteamWorkshop, EResult
+from steamworks.ugccache import UGCDetailsCache
+
+@pytest.fixture
+def cache(backend):
+    for publishedFileId in range(1, 11):
+        backend.AddItem(publishedFileId, title=b"item %d" % publishedFileId, timeUpdated=100)
+    cache = UGCDetailsCache(maxItems=4, ttl=300)
+    yield cache
+    cache.Close()
+
+def fetch(cache, pump, publishedFileId):
+    found = []
+    cache.Get(publishedFileId, found.append)
+    pump(lambda: found)
+    return found[0]
+
+def test_second_get_is_answered_from_cache(cache, pump):
+    assert fetch(cache, pump, 1).title == b"item 1"
+    found = []
+    assert cache.Get(1, found.append) is True
+    assert found[0].title == b"item 1"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_requests_for_an_item_in_flight_are_coalesced(cache, pump):
+    found = []
+    cache.Get(1, found.append)
+    cache.GetMany([1, 2], found.append)
+    assert Steam.CallsInFlight() == 2
+    assert (cache.misses, cache.coalesced) == (2, 1)
+    pump(lambda: len(found) == 2)
+    assert found[0].published_file_id == 1
+    assert [details.published_file_id for details in found[1]] == [1, 2]
+
+def test_least_recently_used_entry_is_dropped_past_max_items(cache, pump):
+    for publishedFileId in range(1, 5):
+        fetch(cache, pump, publishedFileId)
+    assert cache.Peek(1) is not None
+    fetch(cache, pump, 5)
+    assert len(cache) == 4
+    assert 2 not in cache
+    assert 1 in cache
+
+def test_expired_entries_are_neither_contained_nor_returned(cache, pump):
+    fetch(cache, pump, 1)
+    cache.ttl = -1
+    assert 1 not in cache
+    assert cache.Peek(1) is None
+    assert len(cache) == 0
+
+def test_contains_leaves_counters_alone(cache, pump):
+    fetch(cache, pump, 1)
+    assert 1 in cache
+    assert cache.hits == 0
+
+def test_failed_lookups_are_passed_on_but_not_cached(cache, pump):
+    details = fetch(cache, pump, 99)
+    assert details.result == EResult['FileNotFound']
+    assert 99 not in cache
+
+def test_newer_install_drops_the_entry(cache, backend, pump):
+    fetch(cache, pump, 1)
+    fetch(cache, pump, 2)
+    backend.items[1].time_updated = 200
+    SteamWorkshop.DownloadItem(1, True)
+    SteamWorkshop.DownloadItem(2, True)
+    pump()
+    assert 1 not in cache
+    assert 2 in cache
+
+def test_invalidate(cache, pump):
+    fetch(cache, pump, 1)
+    fetch(cache, pump, 2)
+    cache.Invalidate(1)
+    assert 1 not in cache and 2 in cache
+    cache.Invalidate()
+    assert len(cache) == 0
@@ -0,0 +1,98 @@
+#================================================
+# UGCMetadataStore: persistent workshop metadata
+#================================================
+import pytest
+from steamworks import Steam, SteamWorkshop, UGCMetadataStore
+from steamworks.simulated import SimulatedBackend
+
+def addItems(backend, ids):
+    for publishedFileId in ids:
+        backend.AddItem(publishedFileId, title=b"item %d" % publishedFileId, timeUpdated=100 + publishedFileId,
+                        folder=b"/mods/%d" % publishedFileId, sizeOnDisk=publishedFileId)
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "workshop.db")
+
+def refresh(store, pump):
+    updated = []
+    count = store.Refresh(updated.append)
+    pump(lambda: updated)
+    return count, updated[0]
+
+def test_first_refresh_stores_every_subscribed_item(backend, pump, path):
+    addItems(backend, range(1, 121))
+    store = UGCMetadataStore(path)
+    count, updated = refresh(store, pump)
+    assert count == 120
+    assert len(updated) == 120
+    item = store.Get(7)
+    assert (item.title, item.folder, item.size_on_disk, item.install_timestamp) == ("item 7", "/mods/7", 7, 107)
+    store.Close()
+
+def test_items_are_read_from_disk_before_steam_answers(backend, pump, path):
+    addItems(backend, range(1, 11))
+    store = UGCMetadataStore(path)
+    refresh(store, pump)
+    store.Close()
+    Steam.Shutdown()
+    store = UGCMetadataStore(path)
+    assert len(store.Items()) == 10
+    assert store.Get(3).title == "item 3"
+    store.Close()
+
+def test_only_changed_items_are_queried(backend, pump, path):
+    addItems(backend, range(1, 21))
+    store = UGCMetadataStore(path)
+    refresh(store, pump)
+    backend.items[5].time_updated = 999
+    backend.items[5].title = b"renamed"
+    backend.items[6].needs_update = True
+    count, updated = refresh(store, pump)
+    assert count == 2
+    assert sorted(record.published_file_id for record in updated) == [5, 6]
+    assert store.Get(5).title == "renamed"
+    store.Close()
+
+def test_unsubscribed_items_are_removed(backend, pump, path):
+    addItems(backend, range(1, 11))
+    store = UGCMetadataStore(path)
+    refresh(store, pump)
+    backend.items[4].subscribed = False
+    count, updated = refresh(store, pump)
+    assert (count, updated) == (0, [])
+    assert store.Get(4) is None
+    assert len(store.Items()) == 9
+    store.Close()
+
+def test_nothing_changed_answers_right_away(backend, pump, path):
+    addItems(backend, range(1, 11))
+    store = UGCMetadataStore(path)
+    refresh(store, pump)
+    updated = []
+    assert store.Refresh(updated.append) == 0
+    assert updated == [[]]
+    store.Close()
+
+def test_failed_queries_keep_the_old_row(backend, pump, path):
+    addItems(backend, range(1, 11))
+    store = UGCMetadataStore(path)
+    refresh(store, pump)
+    backend.items[2].time_updated = 999
+    backend.resultCodes['QueryUGCItems'] = SimulatedBackend.RESULT_FILE_NOT_FOUND
+    count, updated = refresh(store, pump)
+    assert (count, updated) == (1, [])
+    assert store.Get(2).time_updated == 102
+    store.Close()
+
+def test_refresh_fails_when_install_info_cannot_be_read(backend, path, monkeypatch):
+    addItems(backend, range(1, 11))
+    monkeypatch.setattr(backend, 'Workshop_GetItemsInstallInfo', lambda *args: False)
+    store = UGCMetadataStore(path)
+    assert store.Refresh() is False
+    store.Close()
+
+def test_refresh_fails_when_steam_is_not_loaded(path):
+    store = UGCMetadataStore(path)
+    assert store.Refresh() is False
+    store.Close()
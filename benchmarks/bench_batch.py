@@ -0,0 +1,31 @@
+#================================================
+# One Batch_Run call vs one wrapper call per value
+#================================================
+from common import buildStub, nsPerCall
+from steamworks import *
+
+STATS = [("stat_%d" % i).encode() for i in range(40)]
+ACHIEVEMENTS = [("ACH_%d" % i).encode() for i in range(40)]
+ITEMS = list(range(1000, 1040))
+
+def separateCalls():
+    return ([SteamUserStats.GetStatInt(name) for name in STATS],
+            [SteamUserStats.GetAchievement(name) for name in ACHIEVEMENTS],
+            [SteamWorkshop.GetItemState(item) for item in ITEMS])
+
+if __name__ == "__main__":
+    Steam.Init(buildStub())
+    batch = Steam.Batch()
+    for name in STATS:
+        batch.GetStatInt(name)
+    for name in ACHIEVEMENTS:
+        batch.GetAchievement(name)
+    for item in ITEMS:
+        batch.GetItemState(item)
+    separate = separateCalls()
+    assert batch.Run() == separate[0] + separate[1] + separate[2]
+    separateNs = nsPerCall(separateCalls, number=2000)
+    batchNs = nsPerCall(batch.Run, number=2000)
+    print("%d values per frame" % len(batch.ops))
+    print("%-20s %12.1f us" % ("separate calls", separateNs / 1000))
+    print("%-20s %12.1f us" % ("Steam.Batch().Run", batchNs / 1000))
@@ -0,0 +1,58 @@
+#================================================
+# Wrapper dispatch: per-call lookup vs resolved function table
+#================================================
+#
+#  "before" replays the old wrapper body: isSteamLoaded() followed by a
+#  Steam.cdll.<Name> attribute lookup. "after" is the shipped wrapper, which
+#  checks Steam.loaded and calls through Steam.lib. Both sides get the
+#  signatures in NATIVE_SIGNATURES before anything is timed, so only the
+#  dispatch differs, not the argument conversion.
+#
+#================================================
+from common import buildStub, nsPerCall
+from steamworks import *
+#------------------------------------------------
+# The wrapper bodies as they were before the function table
+#------------------------------------------------
+def legacyIsSteamLoaded():
+    return Steam.cdll and not Steam.warn
+
+def legacyGetStatInt(name):
+    if legacyIsSteamLoaded():
+        return Steam.cdll.GetStatInt(name)
+    return 0
+
+def legacyGetItemState(publishedFileId):
+    if legacyIsSteamLoaded():
+        return Steam.cdll.Workshop_GetItemState(publishedFileId)
+    return False
+
+def legacyHasOtherApp(appID):
+    if legacyIsSteamLoaded():
+        return Steam.cdll.HasOtherApp(appID)
+    return False
+
+CASES = [
+    ("SteamUserStats.GetStatInt", "GetStatInt", lambda: legacyGetStatInt(b"kills"), lambda: SteamUserStats.GetStatInt(b"kills")),
+    ("SteamWorkshop.GetItemState", "Workshop_GetItemState", lambda: legacyGetItemState(4), lambda: SteamWorkshop.GetItemState(4)),
+    ("SteamApps.HasOtherApp", "HasOtherApp", lambda: legacyHasOtherApp(480), lambda: SteamApps.HasOtherApp(480)),
+]
+#------------------------------------------------
+# Give the legacy path the signature Steam.lib resolves, and resolve it there too
+#------------------------------------------------
+def resolveSignatures(export):
+    function = getattr(Steam.cdll, export)
+    function.restype, function.argtypes = NATIVE_SIGNATURES[export]
+    getattr(Steam.lib, export)
+
+if __name__ == "__main__":
+    Steam.Init(buildStub())
+    print("%-30s %12s %12s %8s" % ("wrapper", "before ns", "after ns", "saved"))
+    for name, export, before, after in CASES:
+        resolveSignatures(export)
+        # Alternate the two sides so drift in machine load hits both alike
+        beforeNs = afterNs = float('inf')
+        for _ in range(5):
+            beforeNs = min(beforeNs, nsPerCall(before, number=100000, repeat=3))
+            afterNs = min(afterNs, nsPerCall(after, number=100000, repeat=3))
+        print("%-30s %12.1f %12.1f %7.1f%%" % (name, beforeNs, afterNs, 100.0 * (beforeNs - afterNs) / beforeNs))
@@ -0,0 +1,60 @@
+#================================================
+# SteamAPI_RunCallbacks vs manual dispatch
+#================================================
+#
+#  Each mode runs in its own interpreter, since manual dispatch stays on
+#  until Shutdown. Reports how many call results per second reach Python
+#  when --calls FindLeaderboard requests are in flight at once and, with
+#  --lib, the cost of an idle RunCallbacks.
+#
+#  The stand-in library completes FindLeaderboard on the next RunCallbacks
+#  through a stand-in for each dispatch path, so its throughput shows the
+#  cost of the two native loops plus delivery into Python. Its idle path is
+#  the same in both modes, so no idle cost is reported for it. For Steam's
+#  own costs, point --lib at a real SteamworksPy build with Steam running
+#  and steam_appid.txt in the working directory.
+#
+#  python bench_dispatch_modes.py [--lib DIR] [--calls 500]
+#
+#================================================
+import argparse, json, subprocess, sys, time
+from common import buildStub, nsPerCall
+
+MODES = [("SteamAPI_RunCallbacks", False), ("manual dispatch", True)]
+
+def measure(libDir, manualDispatch, calls, idle):
+    from steamworks import Steam, SteamUserStats
+    Steam.Init(libDir, manualDispatch=manualDispatch)
+    if not Steam.loaded:
+        sys.exit("Steam failed to initialize")
+    idleNs = nsPerCall(Steam.RunCallbacks, number=20000) if idle else None
+    done = []
+    start = time.perf_counter()
+    issued = sum(1 for i in range(calls) if SteamUserStats.FindLeaderboard("bench_%d" % i, lambda result: done.append(1)))
+    throughput = None
+    if issued:
+        while len(done) < issued and time.perf_counter() - start < 60:
+            Steam.RunCallbacks()
+        throughput = len(done) / (time.perf_counter() - start)
+    Steam.Shutdown()
+    return {'idle_ns': idleNs, 'results_per_second': throughput}
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lib", help="directory holding SteamworksPy; defaults to the stand-in")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--idle", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    libDir = args.lib or buildStub()
+    if args.child is not None:
+        print(json.dumps(measure(libDir, bool(args.child), args.calls, args.idle)))
+        sys.exit()
+    print("%-24s %14s %18s" % ("mode", "idle ns", "results/s"))
+    for label, manualDispatch in MODES:
+        output = subprocess.check_output([sys.executable, __file__, "--lib", libDir, "--calls", str(args.calls),
+                                          "--child", str(int(manualDispatch))] + (["--idle"] if args.lib else []), text=True)
+        result = json.loads(output.splitlines()[-1])
+        idleNs, throughput = result['idle_ns'], result['results_per_second']
+        print("%-24s %14s %18s" % (label, "n/a" if idleNs is None else "%.1f" % idleNs,
+                                   "n/a" if throughput is None else "%.0f" % throughput))
@@ -0,0 +1,49 @@
+#================================================
+# Import time and memory of the steamworks package
+#================================================
+#
+#  Each scenario runs in a fresh interpreter so nothing is cached between
+#  them. Reports the best wall time over several runs and the memory
+#  allocated by the import, as measured by tracemalloc.
+#
+#  python bench_import.py [--runs 10]
+#
+#================================================
+import argparse, subprocess, sys
+from common import ROOT
+
+SCENARIOS = [
+    ("import steamworks", "import steamworks"),
+    ("steamworks.SteamUserStats", "import steamworks; steamworks.SteamUserStats"),
+    ("from steamworks import *", "from steamworks import *"),
+]
+
+PROGRAM = """
+import sys, time, tracemalloc
+sys.path.insert(0, %r)
+if %r:
+    tracemalloc.start()
+start = time.perf_counter()
+exec(%r)
+elapsed = time.perf_counter() - start
+print(elapsed, tracemalloc.get_traced_memory()[0])
+"""
+
+def run(statement, traced):
+    output = subprocess.check_output([sys.executable, "-c", PROGRAM % (ROOT, traced, statement)], text=True)
+    elapsed, allocated = output.split()
+    return float(elapsed), int(allocated)
+
+def measure(statement, runs):
+    # tracemalloc slows imports down, so memory comes from one separate traced run
+    elapsed = min(run(statement, False)[0] for _ in range(runs))
+    return elapsed, run(statement, True)[1]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    print("%-28s %10s %12s" % ("scenario", "ms", "KiB"))
+    for label, statement in SCENARIOS:
+        elapsed, allocated = measure(statement, args.runs)
+        print("%-28s %10.2f %12.1f" % (label, elapsed * 1000, allocated / 1024))
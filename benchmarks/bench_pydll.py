@@ -0,0 +1,31 @@
+#================================================
+# GIL handling: CDLL vs PyDLL for the NOGIL_FUNCTIONS getters
+#================================================
+#
+#  Calls each curated getter through a CDLL handle, which releases and
+#  reacquires the GIL around the call, and through the PyDLL handle the
+#  wrappers use, which keeps it held. Signatures come from NATIVE_SIGNATURES.
+#
+#================================================
+from ctypes import CDLL
+from common import buildStub, nsPerCall
+from steamworks import *
+
+ARGUMENTS = {
+    'GetStatInt': (b"kills",),
+    'GetStatFloat': (b"accuracy",),
+    'GetAchievement': (b"ACH_WIN",),
+    'Workshop_GetItemState': (4,),
+}
+
+if __name__ == "__main__":
+    Steam.Init(buildStub())
+    releasing = NativeFunctions(CDLL(Steam.cdll._name))
+    print("%-32s %12s %12s %10s" % ("export", "CDLL ns", "PyDLL ns", "saved ns"))
+    for name in sorted(NOGIL_FUNCTIONS):
+        args = ARGUMENTS.get(name, ())
+        slow = getattr(releasing, name)
+        fast = getattr(Steam.lib, name)
+        slowNs = nsPerCall(lambda: slow(*args))
+        fastNs = nsPerCall(lambda: fast(*args))
+        print("%-32s %12.1f %12.1f %10.1f" % (name, slowNs, fastNs, slowNs - fastNs))
@@ -0,0 +1,137 @@
+#================================================
+# Per-call cost of every public wrapper method
+#================================================
+#
+#  Runs each public method of the wrapper classes against the stand-in
+#  SteamworksPy library (make stub) and reports nanoseconds per call as JSON.
+#
+#  python bench_wrappers.py [--output results.json] [--baseline old.json] [--threshold 0.25]
+#
+#  With --baseline, methods slower than the baseline by more than the
+#  threshold are listed under "regressions" and the exit status is 1.
+#
+#================================================
+import argparse, json, platform, sys
+from common import buildStub, nsPerCall
+from steamworks import *
+
+CLASSES = [SteamApps, SteamFriends, SteamUser, SteamUserStats, SteamUtilities, SteamWorkshop]
+
+def ignore(*args):
+    pass
+
+# Arguments for every method that takes any; methods missing here are reported as errors
+ARGUMENTS = {
+    'SteamApps.HasOtherApp': (480,),
+    'SteamApps.IsDlcInstalled': (480,),
+    'SteamApps.IsAppInstalled': (480,),
+    'SteamFriends.GetFriendByIndex': (0,),
+    'SteamFriends.GetFriendPersonaName': (76561197960287930,),
+    'SteamFriends.SetRichPresence': (b"status", b"In menu"),
+    'SteamFriends.InviteFriend': (76561197960287930, b"+connect"),
+    'SteamFriends.SetPlayedWith': (76561197960287930,),
+    'SteamFriends.ActivateGameOverlay': ("Friends",),
+    'SteamFriends.ActivateGameOverlayToUser': ("steamid", 76561197960287930),
+    'SteamFriends.ActivateGameOverlayToWebPage': ("https://example.com",),
+    'SteamFriends.ActivateGameOverlayToStore': (480,),
+    'SteamFriends.ActivateGameOverlayInviteDialog': (109775240000000000,),
+    'SteamFriends.SetGameOverlayActivatedCallback': (ignore,),
+    'SteamUser.GetGobalStatFloat': (b"global_kills",),
+    'SteamUser.GetGlobalStatInt': (b"global_kills",),
+    'SteamUser.RequestGlobalStats': (7,),
+    'SteamUser.SetUserStatsReceivedCallback': (ignore,),
+    'SteamUser.SetGlobalStatsReceivedCallback': (ignore,),
+    'SteamUserStats.GetAchievement': (b"ACH_WIN",),
+    'SteamUserStats.GetStatFloat': (b"accuracy",),
+    'SteamUserStats.IndicateAchievementProgress': (b"ACH_WIN", 1, 10),
+    'SteamUserStats.GetStatInt': (b"kills",),
+    'SteamUserStats.ResetAllStats': (False,),
+    'SteamUserStats.SetAchievement': (b"ACH_WIN",),
+    'SteamUserStats.SetStat': (b"kills", 3),
+    'SteamUserStats.ClearAchievement': (b"ACH_WIN",),
+    'SteamUserStats.SetFindLeaderboardResultCallback': (ignore,),
+    'SteamUserStats.FindLeaderboard': ("Highscores",),
+    'SteamUtilities.SetOverlayNotificationPosition': (0,),
+    'SteamWorkshop.SetItemCreatedCallback': (ignore,),
+    'SteamWorkshop.SetQueryUGCItemCallback': (ignore,),
+    'SteamWorkshop.SetItemUpdatedCallback': (ignore,),
+    'SteamWorkshop.SetItemInstalledCallback': (ignore,),
+    'SteamWorkshop.SetDeleteItemResultCallback': (ignore,),
+    'SteamWorkshop.DownloadItem': (1000000000, False),
+    'SteamWorkshop.SetDownloadItemResultCallback': (ignore,),
+    'SteamWorkshop.CreateItem': (480, WorkshopFileType['Community']),
+    'SteamWorkshop.QueryUGCItem': (1000000000, ignore),
+    'SteamWorkshop.QueryUGCItems': (list(range(1000000000, 1000000120)), ignore),
+    'SteamWorkshop.GetItemsInstallInfo': (list(range(1000000000, 1000000064)),),
+    'SteamWorkshop.DeleteItem': (1000000000, ignore),
+    'SteamWorkshop.StartItemUpdate': (480, 1000000000),
+    'SteamWorkshop.SetItemTitle': (1, "Title"),
+    'SteamWorkshop.SetItemDescription': (1, "Description"),
+    'SteamWorkshop.SetItemTags': (1, "Maps", "Weapons"),
+    'SteamWorkshop.SetItemContent': (1, "/tmp/content"),
+    'SteamWorkshop.SetItemVisibility': (1, 0),
+    'SteamWorkshop.SubmitItemUpdate': (1, "Changes"),
+    'SteamWorkshop.GetItemUpdateProgress': (1,),
+    'SteamWorkshop.GetItemState': (1000000000,),
+    'SteamWorkshop.GetItemInstallInfo': (1000000000,),
+    'SteamWorkshop.GetItemDownloadInfo': (1000000000,),
+}
+#------------------------------------------------
+# Every public static/class method of the wrapper classes, in definition order
+#------------------------------------------------
+def publicMethods():
+    for cls in CLASSES:
+        for name, member in vars(cls).items():
+            if not name.startswith('_') and isinstance(member, (staticmethod, classmethod)):
+                yield "%s.%s" % (cls.__name__, name), getattr(cls, name)
+
+def measure(number):
+    results = []
+    for qualifiedName, method in publicMethods():
+        args = ARGUMENTS.get(qualifiedName, ())
+        entry = {"method": qualifiedName}
+        try:
+            method(*args)
+            entry["ns_per_call"] = round(nsPerCall(lambda: method(*args), number=number), 1)
+        except Exception as error:
+            entry["error"] = "%s: %s" % (type(error).__name__, error)
+        results.append(entry)
+    return results
+
+def regressions(results, baselinePath, threshold):
+    with open(baselinePath) as baselineFile:
+        baseline = {entry["method"]: entry.get("ns_per_call") for entry in json.load(baselineFile)["results"]}
+    slower = []
+    for entry in results:
+        before = baseline.get(entry["method"])
+        after = entry.get("ns_per_call")
+        if before and after and after > before * (1 + threshold):
+            slower.append({"method": entry["method"], "baseline_ns": before, "ns_per_call": after, "ratio": round(after / before, 3)})
+    return slower
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--baseline", help="earlier JSON output to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown vs the baseline (0.25 = 25%%)")
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    options = parser.parse_args()
+    Steam.Init(buildStub())
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "number": options.number,
+        "results": measure(options.number),
+    }
+    if options.baseline:
+        report["regressions"] = regressions(report["results"], options.baseline, options.threshold)
+    output = json.dumps(report, indent=2)
+    if options.output:
+        with open(options.output, "w") as outputFile:
+            outputFile.write(output + "\n")
+    else:
+        print(output)
+    if report.get("regressions") or any("error" in entry for entry in report["results"]):
+        sys.exit(1)
@@ -0,0 +1,19 @@
+#================================================
+# Shared helpers for the SteamworksPy benchmarks
+#================================================
+import os, sys, subprocess, timeit
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUILD_DIR = os.path.join(ROOT, "benchmarks", "build")
+sys.path.insert(0, ROOT)
+#------------------------------------------------
+# Build the stand-in SteamworksPy library and return its directory
+#------------------------------------------------
+def buildStub():
+    subprocess.check_call(["make", "-s", "-C", ROOT, "stub"])
+    return BUILD_DIR
+#------------------------------------------------
+# Best-of-N nanoseconds per call for a zero-argument callable
+#------------------------------------------------
+def nsPerCall(function, number=200000, repeat=5):
+    timer = timeit.Timer(function)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
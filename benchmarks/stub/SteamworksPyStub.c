@@ -0,0 +1,500 @@
+//===============================================
+//  STEAMWORKS FOR PYTHON - BENCHMARK STAND-IN
+//===============================================
+// Exports the same SW_PY symbols as SteamworksPy.cpp with trivial bodies,
+// so the Python wrapper layer can be measured without a Steam client.
+// Leaderboard_FindLeaderboard completes on the next RunCallbacks, through a
+// stand-in for either dispatch path; other asynchronous calls return
+// k_uAPICallInvalid (0) and never complete.
+//-----------------------------------------------
+#include <stdbool.h>
+#include <stdint.h>
+#include <string.h>
+#define SW_PY __attribute__ ((visibility("default")))
+typedef void *Callback_t;
+static Callback_t callbacks[16];
+static char userDataFolder[] = "/tmp/steam/userdata";
+//-----------------------------------------------
+// Call results
+//-----------------------------------------------
+#define CALL_FIND_LEADERBOARD 3
+#define CALL_RESULT_TYPES 7
+#define MAX_PENDING_CALLS 4096
+// SteamAPICallCompleted_t::k_iCallback
+#define CALL_COMPLETED_CALLBACK 703
+typedef void (*CallResultHandler_t)(uint64_t hCall, bool bIOFailure, const void *pResult);
+typedef struct {
+	uint64_t hSteamLeaderboard;
+	uint8_t bLeaderboardFound;
+} LeaderboardFindResult_t;
+typedef struct {
+	int32_t iCallback;
+	uint64_t hAsyncCall;
+} CallMessage_t;
+static CallResultHandler_t callResultHandlers[CALL_RESULT_TYPES];
+static uint64_t pendingCalls[MAX_PENDING_CALLS];
+static uint32_t pendingCount;
+static uint64_t nextCall = 1;
+static bool manualDispatch;
+//-----------------------------------------------
+// Callbacks
+//-----------------------------------------------
+SW_PY void Callbacks_SetGameOverlayActivatedCallback(Callback_t callback){
+	callbacks[0] = callback;
+}
+SW_PY void Callbacks_SetScreenshotReadyCallback(Callback_t callback){
+	callbacks[1] = callback;
+}
+SW_PY void Callbacks_SetUserStatsReceivedCallback(Callback_t callback){
+	callbacks[2] = callback;
+}
+SW_PY void Callbacks_SetGlobalStatsReceivedCallback(Callback_t callback){
+	callbacks[3] = callback;
+}
+SW_PY uint64_t Stats_RequestGlobalStats(int nHistoryDays){
+	return 0;
+}
+SW_PY uint64_t Workshop_DeleteItem(uint64_t nPublishedFileID){
+	return 0;
+}
+SW_PY bool CallResult_Cancel(uint64_t hCall){
+	uint32_t i;
+	for(i = 0; i < pendingCount; i++){
+		if(pendingCalls[i] == hCall){
+			pendingCalls[i] = pendingCalls[--pendingCount];
+			return true;
+		}
+	}
+	return false;
+}
+SW_PY void SteamUseManualDispatch(void){
+	manualDispatch = true;
+}
+SW_PY void CallResult_SetHandler(int32_t callType, Callback_t handler){
+	if(callType >= 0 && callType < CALL_RESULT_TYPES){
+		callResultHandlers[callType] = (CallResultHandler_t)handler;
+	}
+}
+SW_PY void Events_SetQueueMode(bool enabled, uint32_t capacity){
+}
+SW_PY uint32_t Events_Drain(uint8_t *buffer, uint32_t capacity, uint32_t *needed){
+	*needed = 0;
+	return 0;
+}
+SW_PY uint64_t Events_GetDropped(void){
+	return 0;
+}
+SW_PY uint32_t Events_GetQueued(void){
+	return 0;
+}
+SW_PY void Workshop_SetDeleteItemResultCallback(Callback_t callback){
+	callbacks[4] = callback;
+}
+SW_PY bool Workshop_DownloadItem(uint64_t nPublishedFileID, bool bHighPriority){
+	return true;
+}
+SW_PY void Workshop_SetDownloadItemResultCallback(Callback_t callback){
+	callbacks[5] = callback;
+}
+SW_PY void Callbacks_SetGamepadTextInputDismissedCallback(Callback_t callback){
+	callbacks[6] = callback;
+}
+SW_PY void Callbacks_SetIPCountryChangedCallback(Callback_t callback){
+	callbacks[12] = callback;
+}
+//-----------------------------------------------
+// Steamworks functions
+//-----------------------------------------------
+SW_PY bool SteamInit(void){
+	return true;
+}
+SW_PY void SteamShutdown(void){
+	manualDispatch = false;
+	pendingCount = 0;
+}
+SW_PY bool IsSteamRunning(void){
+	return true;
+}
+// Complete every pending call. Like SteamAPI_RunCallbacks, the default path
+// hands each result straight to its handler; like the manual dispatch loop,
+// the other reads a completion message per call and copies the result out of
+// the pipe first. Calls made from a handler complete on the next run.
+SW_PY void RunCallbacks(void){
+	static uint64_t completed[MAX_PENDING_CALLS];
+	const uint32_t count = pendingCount;
+	const CallResultHandler_t handler = callResultHandlers[CALL_FIND_LEADERBOARD];
+	uint32_t i;
+	memcpy(completed, pendingCalls, count * sizeof(uint64_t));
+	pendingCount = 0;
+	for(i = 0; i < count; i++){
+		LeaderboardFindResult_t result = { completed[i], 1 };
+		if(manualDispatch){
+			CallMessage_t message = { CALL_COMPLETED_CALLBACK, completed[i] };
+			uint8_t pipe[sizeof(LeaderboardFindResult_t)];
+			if(message.iCallback != CALL_COMPLETED_CALLBACK){
+				continue;
+			}
+			memcpy(pipe, &result, sizeof(result));
+			if(handler){
+				handler(message.hAsyncCall, false, pipe);
+			}
+		}
+		else if(handler){
+			handler(completed[i], false, &result);
+		}
+	}
+}
+//-----------------------------------------------
+// Steam Apps
+//-----------------------------------------------
+SW_PY int HasOtherApp(int32_t value){
+	return value == 480;
+}
+SW_PY int GetDlcCount(void){
+	return 2;
+}
+SW_PY bool IsDlcInstalled(int32_t value){
+	return true;
+}
+SW_PY bool IsAppInstalled(int32_t value){
+	return value == 480;
+}
+SW_PY const char* GetCurrentGameLanguage(void){
+	return "english";
+}
+//-----------------------------------------------
+// Steam Friends
+//-----------------------------------------------
+SW_PY int GetFriendCount(int flag){
+	return 12;
+}
+SW_PY uint64_t GetFriendByIndex(int thisFriend){
+	return 76561197960265728ull + thisFriend;
+}
+SW_PY const char* GetPersonaName(void){
+	return "Player";
+}
+SW_PY int GetPersonaState(void){
+	return 1;
+}
+SW_PY const char* GetFriendPersonaName(int steamID){
+	return "Friend";
+}
+SW_PY bool SetRichPresence(const char *serverKey, const char *serverValue){
+	return true;
+}
+SW_PY void ClearRichPresence(void){
+}
+SW_PY void InviteFriend(int steamID, const char* conString){
+}
+SW_PY void SetPlayedWith(int steamID){
+}
+SW_PY void ActivateGameOverlay(const char* name){
+}
+SW_PY void ActivateGameOverlayToUser(const char* url, int steamID){
+}
+SW_PY void ActivateGameOverlayToWebPage(const char* url){
+}
+SW_PY void ActivateGameOverlayToStore(int app_id){
+}
+SW_PY void ActivateGameOverlayInviteDialog(int steamID){
+}
+//-----------------------------------------------
+// Steam Matchmaking
+//-----------------------------------------------
+SW_PY void CreateLobby(int lobbyType, int cMaxMembers){
+}
+SW_PY void JoinLobby(int steamIDLobby){
+}
+SW_PY void LeaveLobby(int steamIDLobby){
+}
+SW_PY bool InviteUserToLobby(int steamIDLobby, int steamIDInvitee){
+	return true;
+}
+//-----------------------------------------------
+// Steam Music
+//-----------------------------------------------
+SW_PY bool MusicIsEnabled(void){
+	return true;
+}
+SW_PY bool MusicIsPlaying(void){
+	return false;
+}
+SW_PY float MusicGetVolume(void){
+	return 0.5f;
+}
+SW_PY void MusicPause(void){
+}
+SW_PY void MusicPlay(void){
+}
+SW_PY void MusicPlayNext(void){
+}
+SW_PY void MusicPlayPrev(void){
+}
+SW_PY void MusicSetVolume(float value){
+}
+//-----------------------------------------------
+// Steam Screenshots
+//-----------------------------------------------
+SW_PY void TriggerScreenshot(void){
+}
+SW_PY bool SetScreenshotLocation(uint32_t hScreenshot, const char *pchLocation){
+	return true;
+}
+//-----------------------------------------------
+// Steam User
+//-----------------------------------------------
+SW_PY uint64_t GetSteamID(void){
+	return 76561197960265728ull;
+}
+SW_PY int GetPlayerSteamLevel(void){
+	return 10;
+}
+SW_PY const char* GetUserDataFolder(void){
+	return userDataFolder;
+}
+//-----------------------------------------------
+// Steam User Stats
+//-----------------------------------------------
+SW_PY bool ClearAchievement(const char* name){
+	return true;
+}
+SW_PY bool IndicateAchievementProgress(const char *name, uint32_t nCurProgress, uint32_t nMaxProgress){
+	return true;
+}
+SW_PY bool GetAchievement(const char* name){
+	return name[0] == 'A';
+}
+SW_PY float GetStatFloat(const char* name){
+	return 1.5f;
+}
+SW_PY int32_t GetStatInt(const char* name){
+	return name[0];
+}
+SW_PY double GetGlobalStatFloat(const char* name){
+	return 2.5;
+}
+SW_PY int64_t GetGlobalStatInt(const char* name){
+	return 1ll << 40;
+}
+SW_PY bool ResetAllStats(bool achievesToo){
+	return true;
+}
+SW_PY bool RequestCurrentStats(void){
+	return true;
+}
+SW_PY bool SetAchievement(const char* name){
+	return true;
+}
+SW_PY bool SetStatFloat(const char* name, float value){
+	return true;
+}
+SW_PY bool SetStatInt(const char* name, int32_t value){
+	return true;
+}
+SW_PY bool StoreStats(void){
+	return true;
+}
+//-----------------------------------------------
+// Steam Utilities
+//-----------------------------------------------
+SW_PY uint8_t GetCurrentBatteryPower(void){
+	return 255;
+}
+SW_PY bool GetEnteredGamepadTextInput(char* buffer, uint32_t length){
+	return false;
+}
+SW_PY uint32_t GetEnteredGamepadTextLength(void){
+	return 0;
+}
+SW_PY const char* GetIPCountry(void){
+	return "US";
+}
+SW_PY uint32_t GetSecondsSinceAppActive(void){
+	return 60;
+}
+SW_PY uint32_t GetSecondsSinceComputerActive(void){
+	return 3600;
+}
+SW_PY uint32_t GetServerRealTime(void){
+	return 1500000000u;
+}
+SW_PY bool IsOverlayEnabled(void){
+	return true;
+}
+SW_PY bool IsSteamInBigPictureMode(void){
+	return false;
+}
+SW_PY bool IsSteamRunningInVR(void){
+	return false;
+}
+SW_PY bool IsSteamRunningOnSteamDeck(void){
+	return false;
+}
+SW_PY const char* GetSteamUILanguage(void){
+	return "english";
+}
+SW_PY uint32_t GetAppID(void){
+	return 480;
+}
+SW_PY void SetOverlayNotificationPosition(int pos){
+}
+SW_PY bool ShowGamepadTextInput(int inputMode, int lineInputMode, const char *description, uint32_t maxText, const char *presetText){
+	return true;
+}
+//-----------------------------------------------
+// Steam Workshop
+//-----------------------------------------------
+SW_PY void Workshop_SetItemCreatedCallback(Callback_t callback){
+	callbacks[7] = callback;
+}
+SW_PY uint64_t Workshop_CreateItem(uint32_t consumerAppId, int fileType){
+	return 0;
+}
+SW_PY uint64_t Workshop_QueryUGCItem(uint64_t nPublishedFileID){
+	return 0;
+}
+/* No SDK here to take the size from; 0 skips the layout check */
+SW_PY uint32_t Workshop_GetUGCDetailsSize(void){
+	return 0;
+}
+SW_PY uint64_t Workshop_QueryUGCItems(uint64_t *pPublishedFileIDs, uint32_t count){
+	return 0;
+}
+SW_PY uint64_t Workshop_StartItemUpdate(uint32_t consumerAppId, uint64_t publishedFileId){
+	return publishedFileId + 1;
+}
+SW_PY bool Workshop_SetItemTitle(uint64_t updateHandle, const char *pTitle){
+	return true;
+}
+SW_PY bool Workshop_SetItemDescription(uint64_t updateHandle, const char *pDescription){
+	return true;
+}
+SW_PY bool Workshop_SetItemUpdateLanguage(uint64_t updateHandle, const char *pLanguage){
+	return true;
+}
+SW_PY bool Workshop_SetItemMetadata(uint64_t updateHandle, const char *pMetadata){
+	return true;
+}
+SW_PY bool Workshop_SetItemVisibility(uint64_t updateHandle, int visibility){
+	return true;
+}
+SW_PY bool Workshop_SetItemTags(uint64_t updateHandle, const char ** stringArray, const int32_t stringCount){
+	return true;
+}
+SW_PY bool Workshop_SetItemContent(uint64_t updateHandle, const char *pContentFolder){
+	return true;
+}
+SW_PY bool Workshop_SetItemPreview(uint64_t updateHandle, const char *pPreviewFile){
+	return true;
+}
+SW_PY void Workshop_SetItemUpdatedCallback(Callback_t callback){
+	callbacks[8] = callback;
+}
+SW_PY uint64_t Workshop_SubmitItemUpdate(uint64_t updateHandle, const char *pChangeNote){
+	return 0;
+}
+SW_PY int Workshop_GetItemUpdateProgress(uint64_t handle, uint64_t *punBytesProcessed, uint64_t *punBytesTotal){
+	*punBytesProcessed = 512;
+	*punBytesTotal = 1024;
+	return 3;
+}
+SW_PY uint32_t Workshop_GetNumSubscribedItems(void){
+	return 64;
+}
+SW_PY uint32_t Workshop_GetSubscribedItems(uint64_t *pvecPublishedFileID, uint32_t maxEntries){
+	uint32_t i;
+	for(i = 0; i < maxEntries && i < 64; i++){
+		pvecPublishedFileID[i] = 1000000000ull + i;
+	}
+	return 64;
+}
+SW_PY uint32_t Workshop_GetItemState(uint64_t publishedFileID){
+	return (uint32_t)(publishedFileID & 0x3F);
+}
+SW_PY void Workshop_SetItemInstalledCallback(Callback_t callback){
+	callbacks[9] = callback;
+}
+SW_PY void Workshop_ClearItemInstalledCallback(void){
+	callbacks[9] = 0;
+}
+SW_PY void Workshop_SetSteamUGCDetailsCallback(Callback_t callback){
+	callbacks[10] = callback;
+}
+SW_PY void Workshop_ClearSteamUGCDetailsCallback(void){
+	callbacks[10] = 0;
+}
+SW_PY bool Workshop_GetItemInstallInfo(uint64_t nPublishedFileID, uint64_t *punSizeOnDisk, char *pchFolder, uint32_t cchFolderSize, uint32_t *punTimeStamp){
+	static const char folder[] = "/tmp/steam/workshop/content/480";
+	*punSizeOnDisk = 4096;
+	*punTimeStamp = 1500000000u;
+	if(cchFolderSize > 0){
+		strncpy(pchFolder, folder, cchFolderSize - 1);
+		pchFolder[cchFolderSize - 1] = 0;
+	}
+	return true;
+}
+SW_PY bool Workshop_GetItemsInstallInfo(const uint64_t *pPublishedFileIDs, uint32_t count, uint32_t *punStates, uint64_t *punSizesOnDisk, uint32_t *punTimeStamps, uint32_t *punFolderEnds, char *pchFolders, uint32_t cchFoldersSize, uint32_t *pcchFoldersNeeded){
+	static const char folder[] = "/tmp/steam/workshop/content/480";
+	uint32_t i, used = 0;
+	for(i = 0; i < count; i++){
+		punStates[i] = Workshop_GetItemState(pPublishedFileIDs[i]);
+		punSizesOnDisk[i] = 4096;
+		punTimeStamps[i] = 1500000000u;
+		if(used + sizeof(folder) - 1 <= cchFoldersSize){
+			memcpy(pchFolders + used, folder, sizeof(folder) - 1);
+		}
+		used += sizeof(folder) - 1;
+		punFolderEnds[i] = used;
+	}
+	*pcchFoldersNeeded = used;
+	return true;
+}
+SW_PY bool Workshop_GetItemDownloadInfo(uint64_t publishedFileID, uint64_t *punBytesDownloaded, uint64_t *punBytesTotal){
+	*punBytesDownloaded = 256;
+	*punBytesTotal = 1024;
+	return true;
+}
+//-----------------------------------------------
+// Steam Leaderboard
+//-----------------------------------------------
+SW_PY void Leaderboard_SetFindLeaderboardResultCallback(Callback_t callback){
+	callbacks[11] = callback;
+}
+SW_PY uint64_t Leaderboard_FindLeaderboard(const char *pchLeaderboardName){
+	if(pendingCount == MAX_PENDING_CALLS){
+		return 0;
+	}
+	pendingCalls[pendingCount++] = nextCall;
+	return nextCall++;
+}
+//-----------------------------------------------
+// Batched calls
+//-----------------------------------------------
+typedef struct {
+	int32_t op;
+	int32_t reserved;
+	uint64_t arg;
+	const char *name;
+} BatchOp;
+typedef union {
+	int64_t i;
+	double f;
+} BatchResult;
+SW_PY int32_t Batch_Run(const BatchOp *ops, int32_t count, BatchResult *results){
+	int32_t i;
+	for(i = 0; i < count; i++){
+		switch(ops[i].op){
+			case 0: results[i].i = GetStatInt(ops[i].name); break;
+			case 1: results[i].f = GetStatFloat(ops[i].name); break;
+			case 2: results[i].i = GetAchievement(ops[i].name); break;
+			case 3: results[i].i = GetGlobalStatInt(ops[i].name); break;
+			case 4: results[i].f = GetGlobalStatFloat(ops[i].name); break;
+			case 5: results[i].i = Workshop_GetItemState(ops[i].arg); break;
+			case 6: results[i].i = IsDlcInstalled((int32_t)ops[i].arg); break;
+			case 7: results[i].i = HasOtherApp((int32_t)ops[i].arg); break;
+			default: return i;
+		}
+	}
+	return count;
+}
@@ -0,0 +1,37 @@
+#================================================
+# Steamworks For Python
+#================================================
+#
+# Steam and the shared tables load with the package. Each wrapper class lives
+# in its own submodule, with its ctypes structures and callback types, and is
+# imported the first time it is accessed:
+#
+#   import steamworks                    # core only
+#   steamworks.SteamUserStats.StoreStats()  # loads steamworks.userstats
+#
+# `from steamworks import *` still works; it loads every submodule.
+import importlib
+from .core import (FriendFlags, WorkshopFileType, WorkshopItemState, EResult, CallResultType, EventType,
+                   CallResultEvents, EVENT_SOURCES, NATIVE_SIGNATURES, NOGIL_FUNCTIONS, WRAPPER_MODULES, SteamBackend, NativeFunctions, Steam, StructView, CallStatistics)
+#------------------------------------------------
+# Names resolved on first access, and the submodule that defines each one
+#------------------------------------------------
+_LAZY_MODULES = dict(WRAPPER_MODULES, SteamBatch='batch', SimulatedBackend='simulated',
+                     CallbackScheduler='scheduler', UGCDetailsCache='ugccache',
+                     UGCMetadataStore='ugcstore')
+
+__all__ = ['FriendFlags', 'WorkshopFileType', 'WorkshopItemState', 'EResult', 'CallResultType', 'EventType',
+           'CallResultEvents', 'EVENT_SOURCES', 'NATIVE_SIGNATURES', 'NOGIL_FUNCTIONS', 'SteamBackend', 'NativeFunctions', 'Steam', 'StructView', 'CallStatistics'] + list(_LAZY_MODULES)
+
+def __getattr__(name):
+    try:
+        module = _LAZY_MODULES[name]
+    except KeyError:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    # Later lookups find the class directly and skip this function
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
@@ -0,0 +1,124 @@
+#================================================
+# Steamworks For Python - asyncio call results
+#================================================
+#
+# Coroutine versions of the wrappers that finish through a call result:
+#
+#   import steamworks.aio as aio
+#   pump = aio.StartPump()
+#   created = await aio.CreateItem(appId, WorkshopFileType['Community'])
+#   details = await aio.QueryUGCItems(itemIds)
+#
+# Each coroutine returns a copy of the result struct, whatever its result
+# code; an IO failure raises CallResultError. Every call has its own pending
+# entry in SteamworksPy.cpp, so any number of them can be in flight at once,
+# and they leave the Set*Callback callbacks alone. `timeout` raises
+# asyncio.TimeoutError if the result has not arrived in time. A call that
+# times out or whose task is cancelled is cancelled in SteamworksPy too, which
+# releases what it holds, such as a UGC query handle.
+#
+# Results are delivered by whatever runs Steam.RunCallbacks: StartPump on the
+# event loop, Steam.StartCallbackThread, or the game loop.
+import asyncio
+from ctypes import c_char_p
+from .core import Steam
+from .user import SteamUser
+from .userstats import SteamUserStats
+from .workshop import SteamWorkshop
+#------------------------------------------------
+# Pump
+#------------------------------------------------
+# Run Steam.RunCallbacks on the running event loop, `hz` times per second,
+# or as a CallbackScheduler decides; returns the asyncio.Task, cancel it to stop
+def StartPump(hz=60, scheduler=None):
+    return asyncio.get_running_loop().create_task(Pump(hz, scheduler))
+# Coroutine behind StartPump, for callers that manage their own tasks
+async def Pump(hz=60, scheduler=None):
+    if scheduler is not None:
+        # Polling is cheap, and notices new calls within minInterval
+        while True:
+            scheduler.Poll()
+            await asyncio.sleep(scheduler.minInterval)
+    interval = 1.0 / hz
+    while True:
+        Steam.RunCallbacks()
+        await asyncio.sleep(interval)
+#------------------------------------------------
+# Call results
+#------------------------------------------------
+# Raised when Steam reports an IO failure for a call
+class CallResultError(Exception):
+    def __init__(self, callType, hCall):
+        Exception.__init__(self, "%s call %d failed with an IO failure" % (callType, hCall))
+        self.callType = callType
+        self.hCall = hCall
+# Create a UGC (Workshop) item; returns CreateItemResult_t
+async def CreateItem(appId, filetype, timeout=None):
+    return await _callResult('CreateItem', SteamWorkshop.CreateItemResult_t,
+                             lambda: Steam.lib.Workshop_CreateItem(appId, filetype), timeout)
+# Submit the item update with the given handle; returns SubmitItemUpdateResult_t
+async def SubmitItemUpdate(updateHandle, changeNote="", timeout=None):
+    changeNote = changeNote.encode() if changeNote else c_char_p(0)
+    return await _callResult('SubmitItemUpdate', SteamWorkshop.SubmitItemUpdateResult_t,
+                             lambda: Steam.lib.Workshop_SubmitItemUpdate(updateHandle, changeNote), timeout)
+# Query the details of one workshop item; returns SteamUGCDetails_t
+async def QueryUGCItem(publishedFileId, timeout=None):
+    return await _callResult('QueryUGCItem', SteamWorkshop.SteamUGCDetails_t,
+                             lambda: Steam.lib.Workshop_QueryUGCItem(publishedFileId), timeout)
+# Query the details of many workshop items; returns a list of SteamUGCDetails_t
+async def QueryUGCItems(publishedFileIds, timeout=None):
+    if not Steam.loaded:
+        raise RuntimeError("Steam is not loaded")
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    def resolve(details):
+        if not future.done():
+            future.set_result(details)
+    # The details are already copies, so they can cross to the loop as they are
+    hCalls = SteamWorkshop.QueryUGCItems(publishedFileIds, lambda details: loop.call_soon_threadsafe(resolve, details))
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        for hCall in hCalls:
+            if hCall:
+                Steam.CancelCall(hCall)
+        raise
+# Delete a workshop item; returns DeleteItemResult_t
+async def DeleteItem(publishedFileId, timeout=None):
+    return await _callResult('DeleteItem', SteamWorkshop.DeleteItemResult_t,
+                             lambda: Steam.lib.Workshop_DeleteItem(publishedFileId), timeout)
+# Find a leaderboard by name; returns FindLeaderboardResult_t
+async def FindLeaderboard(name, timeout=None):
+    return await _callResult('FindLeaderboard', SteamUserStats.FindLeaderboardResult_t,
+                             lambda: Steam.lib.Leaderboard_FindLeaderboard(name.encode()), timeout)
+# Request global statistics for the last nHistoryDays; returns GlobalStatsReceived_t
+async def RequestGlobalStats(nHistoryDays, timeout=None):
+    return await _callResult('RequestGlobalStats', SteamUser.GlobalStatsReceived_t,
+                             lambda: Steam.lib.Stats_RequestGlobalStats(nHistoryDays), timeout)
+#------------------------------------------------
+# Helpers
+#------------------------------------------------
+# Make one call through `issue` and wait for its result
+async def _callResult(callType, resultType, issue, timeout):
+    if not Steam.loaded:
+        raise RuntimeError("Steam is not loaded")
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    def resolve(result, ioFailure):
+        if future.done():
+            return
+        if ioFailure:
+            future.set_exception(CallResultError(callType, hCall))
+        else:
+            future.set_result(result)
+    def handler(result, ioFailure):
+        # The view is only valid during the handler; the pump may be on another thread
+        loop.call_soon_threadsafe(resolve, result.copy(), ioFailure)
+    hCall = Steam._startCallResult(callType, resultType, issue, handler)
+    if not hCall:
+        raise RuntimeError("Steam could not start the %s call" % callType)
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        Steam.CancelCall(hCall)
+        raise
@@ -0,0 +1,39 @@
+#================================================
+# Steamworks For Python - Steam Apps
+#================================================
+from ctypes import *
+from .core import Steam
+#------------------------------------------------
+# Class for Steam Apps
+#------------------------------------------------
+class SteamApps:
+    # Check if the user has a given application/game
+    @staticmethod
+    def HasOtherApp(appID):
+        if Steam.loaded:
+            return Steam.lib.HasOtherApp(appID)
+        return False
+    # Get the number of DLC the user owns for a parent application/game
+    @staticmethod
+    def GetDlcCount():
+        if Steam.loaded:
+            return Steam.lib.GetDlcCount()
+        return 0
+    # Check give the given DLC is installed, returns true/false
+    @staticmethod
+    def IsDlcInstalled(appID):
+        if Steam.loaded:
+            return Steam.lib.IsDlcInstalled(appID)
+        return False
+    # Check if given application/game is installed, not necessarily owned
+    @staticmethod
+    def IsAppInstalled(appID):
+        if Steam.loaded:
+            return Steam.lib.IsAppInstalled(appID)
+        return False
+    # Get the user's game language
+    @staticmethod
+    def GetCurrentGameLanguage():
+        if Steam.loaded:
+            return Steam._sessionValue('GetCurrentGameLanguage')
+        return ""
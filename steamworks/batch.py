@@ -0,0 +1,94 @@
+#================================================
+# Steamworks For Python - batched calls
+#================================================
+from ctypes import *
+from array import array
+from .core import Steam
+#------------------------------------------------
+# Class for batched native calls
+#------------------------------------------------
+#
+# Queue getters with the chained methods below, then call Run() to execute
+# them all in one Batch_Run call. Run() returns one value per queued getter,
+# in order. A batch can be kept and run again every frame.
+#
+#   hud = Steam.Batch().GetStatInt(b"kills").GetAchievement(b"ACH_WIN").GetItemState(itemId)
+#   kills, won, state = hud.Run()
+class SteamBatch:
+    # A class that describes the BatchOp struct in SteamworksPy.cpp
+    class BatchOp_t(Structure):
+        _fields_ = [
+            ("op", c_int32),
+            ("reserved", c_int32),
+            ("arg", c_uint64),
+            ("name", c_char_p),
+        ]
+    # Operation codes, must match BATCH_* in SteamworksPy.cpp
+    STAT_INT = 0
+    STAT_FLOAT = 1
+    ACHIEVEMENT = 2
+    GLOBAL_STAT_INT = 3
+    GLOBAL_STAT_FLOAT = 4
+    ITEM_STATE = 5
+    DLC_INSTALLED = 6
+    HAS_OTHER_APP = 7
+    # How each result is decoded, and what Run() returns when Steam is not loaded
+    RESULT_TYPES = (int, float, bool, int, float, int, bool, bool)
+
+    def __init__(self):
+        self.ops = []
+        self._native = None
+
+    def _add(self, op, arg=0, name=None):
+        self.ops.append((op, arg, name))
+        self._native = None
+        return self
+    # Build the native operation array and the result buffer once per shape
+    def _build(self):
+        count = len(self.ops)
+        ops = (SteamBatch.BatchOp_t * count)()
+        for i, (op, arg, name) in enumerate(self.ops):
+            ops[i].op = op
+            ops[i].arg = arg
+            ops[i].name = name
+        # Every result slot is 8 bytes; floats are read back through a double view
+        results = array('q', bytes(8 * count))
+        types = [SteamBatch.RESULT_TYPES[op] for op, arg, name in self.ops]
+        self._native = (ops, results, (c_int64 * count).from_buffer(results), types)
+    # Queue the value of an integer statistic
+    def GetStatInt(self, name):
+        return self._add(SteamBatch.STAT_INT, name=name)
+    # Queue the value of a float statistic
+    def GetStatFloat(self, name):
+        return self._add(SteamBatch.STAT_FLOAT, name=name)
+    # Queue whether the user has a given achievement
+    def GetAchievement(self, name):
+        return self._add(SteamBatch.ACHIEVEMENT, name=name)
+    # Queue the value of an integer global statistic
+    def GetGlobalStatInt(self, name):
+        return self._add(SteamBatch.GLOBAL_STAT_INT, name=name)
+    # Queue the value of a float global statistic
+    def GetGlobalStatFloat(self, name):
+        return self._add(SteamBatch.GLOBAL_STAT_FLOAT, name=name)
+    # Queue the `WorkshopItemState` flags of a workshop item
+    def GetItemState(self, publishedFileId):
+        return self._add(SteamBatch.ITEM_STATE, arg=publishedFileId)
+    # Queue whether the given DLC is installed
+    def IsDlcInstalled(self, appID):
+        return self._add(SteamBatch.DLC_INSTALLED, arg=appID)
+    # Queue whether the user has a given application/game
+    def HasOtherApp(self, appID):
+        return self._add(SteamBatch.HAS_OTHER_APP, arg=appID)
+    # Run every queued getter in one native call and return their values
+    def Run(self):
+        if not self.ops:
+            return []
+        if Steam.loaded:
+            if self._native is None:
+                self._build()
+            ops, results, resultsView, types = self._native
+            Steam.lib.Batch_Run(ops, len(ops), resultsView)
+            ints = results.tolist()
+            floats = memoryview(results).cast('B').cast('d').tolist()
+            return [floats[i] if kind is float else kind(ints[i]) for i, kind in enumerate(types)]
+        return [SteamBatch.RESULT_TYPES[op]() for op, arg, name in self.ops]
@@ -0,0 +1,1189 @@
+#================================================
+# Steamworks For Python - core
+#================================================
+from ctypes import *
+import sys, os, functools, importlib, struct, threading, time
+import logging
+logger = logging.getLogger(__name__)
+#------------------------------------------------
+# User Status
+#------------------------------------------------
+FriendFlags = {  # regular friend
+    'None': 0x00,
+    'Blocked': 0x01,
+    'FriendshipRequested': 0x02,
+    'Immediate': 0x04,
+    'ClanMember': 0x08,
+    'OnGameServer': 0x10,
+    'RequestingFriendship': 0x80,
+    'RequestingInfo': 0x100,
+    'Ignored': 0x200,
+    'IgnoredFriend': 0x400,
+    'Suggested': 0x800,
+    'All': 0xFFFF,
+    }
+#------------------------------------------------
+# Workshop File Types
+#------------------------------------------------
+WorkshopFileType = {
+    'Community': 0x00,			# normal Workshop item that can be subscribed to
+    'Microtransaction': 0x01,	# Workshop item that is meant to be voted on for the purpose of selling in-game
+
+    # NOTE: There are more workshop file types defined "in isteamremotestorage.h",
+    # but we do not need them for now.
+}
+#------------------------------------------------
+# Workshop Item States
+#------------------------------------------------
+WorkshopItemState = {
+    "ItemStateNone":			0,	# item not tracked on client
+    "ItemStateSubscribed":		1,	# current user is subscribed to this item. Not just cached.
+    "ItemStateLegacyItem":		2,	# item was created with ISteamRemoteStorage
+    "ItemStateInstalled":		4,	# item is installed and usable (but maybe out of date)
+    "ItemStateNeedsUpdate":		8,	# items needs an update. Either because it's not installed yet or creator updated content
+    "ItemStateDownloading":		16,	# item update is currently downloading
+    "ItemStateDownloadPending":	32,	# DownloadItem() was called for this item, content isn't available until DownloadItemResult_t is fired
+}
+#------------------------------------------------
+# Result codes (EResult) the wrappers check
+#------------------------------------------------
+EResult = {
+    'OK': 1,
+    'Fail': 2,
+    'FileNotFound': 9,
+    'IOFailure': 15,
+    'Timeout': 16,
+}
+# Packing of the Steam SDK's callback structs: VALVE_CALLBACK_PACK_SMALL (4) on
+# Linux and macOS, VALVE_CALLBACK_PACK_LARGE (8) on Windows
+STEAM_CALLBACK_PACK = 8 if sys.platform == 'win32' else 4
+#------------------------------------------------
+# Call result types, must match CALL_* in SteamworksPy.cpp
+#------------------------------------------------
+CallResultType = {
+    'CreateItem': 0,
+    'SubmitItemUpdate': 1,
+    'QueryUGCItem': 2,
+    'FindLeaderboard': 3,
+    'RequestGlobalStats': 4,
+    'DeleteItem': 5,
+    'QueryUGCItems': 6,
+}
+#------------------------------------------------
+# Event types in the native event queue: k_iCallback of the event struct
+#------------------------------------------------
+EventType = {
+    'GameOverlayActivated': 331,
+    'IPCountry': 701,
+    'GamepadTextInputDismissed': 714,
+    'UserStatsReceived': 1101,
+    'LeaderboardFindResult': 1104,
+    'GlobalStatsReceived': 1112,
+    'ScreenshotReady': 2301,
+    'SteamUGCQueryCompleted': 3401,
+    'CreateItemResult': 3403,
+    'SubmitItemUpdateResult': 3404,
+    'ItemInstalled': 3405,
+    'DownloadItemResult': 3406,
+    'DeleteItemResult': 3417,
+    # SteamworksPy's own type for batched UGC details queries
+    'UGCQueryBatch': 3491,
+}
+# Event type each call result is queued under, must match callResultEvents in SteamworksPy.cpp
+CallResultEvents = {
+    'CreateItem': EventType['CreateItemResult'],
+    'SubmitItemUpdate': EventType['SubmitItemUpdateResult'],
+    'QueryUGCItem': EventType['SteamUGCQueryCompleted'],
+    'FindLeaderboard': EventType['LeaderboardFindResult'],
+    'RequestGlobalStats': EventType['GlobalStatsReceived'],
+    'DeleteItem': EventType['DeleteItemResult'],
+    'QueryUGCItems': EventType['UGCQueryBatch'],
+}
+# Event type -> (wrapper class, struct name or None, native setter) for the
+# callbacks Steam.Subscribe registers natively; the wrapper module is imported on
+# first use. The call result types in CallResultEvents are fanned out from Python.
+EVENT_SOURCES = {
+    EventType['GameOverlayActivated']: ('SteamFriends', 'GameOverlayActivated_t', 'Callbacks_SetGameOverlayActivatedCallback'),
+    EventType['IPCountry']: (None, None, 'Callbacks_SetIPCountryChangedCallback'),
+    EventType['GamepadTextInputDismissed']: ('SteamUtilities', 'GamepadTextInputDismissed_t', 'Callbacks_SetGamepadTextInputDismissedCallback'),
+    EventType['UserStatsReceived']: ('SteamUser', 'UserStatsReceived_t', 'Callbacks_SetUserStatsReceivedCallback'),
+    EventType['ScreenshotReady']: ('SteamScreenshots', 'ScreenshotReady_t', 'Callbacks_SetScreenshotReadyCallback'),
+    EventType['ItemInstalled']: ('SteamWorkshop', 'ItemInstalled_t', 'Workshop_SetItemInstalledCallback'),
+    EventType['DownloadItemResult']: ('SteamWorkshop', 'DownloadItemResult_t', 'Workshop_SetDownloadItemResultCallback'),
+}
+#------------------------------------------------
+# Native signatures: (restype, argtypes) for every SW_PY export in SteamworksPy.cpp
+#------------------------------------------------
+# Callback setters take a CFUNCTYPE instance, which c_void_p accepts as-is
+NATIVE_SIGNATURES = {
+    # Callbacks
+    'Callbacks_SetGameOverlayActivatedCallback':        (None, [c_void_p]),
+    'Callbacks_SetScreenshotReadyCallback':             (None, [c_void_p]),
+    'Callbacks_SetUserStatsReceivedCallback':           (None, [c_void_p]),
+    'Callbacks_SetGlobalStatsReceivedCallback':         (None, [c_void_p]),
+    'Callbacks_SetGamepadTextInputDismissedCallback':   (None, [c_void_p]),
+    'Callbacks_SetIPCountryChangedCallback':            (None, [c_void_p]),
+    'Stats_RequestGlobalStats':                         (c_uint64, [c_int]),
+    'Workshop_DeleteItem':                              (c_uint64, [c_uint64]),
+    'Workshop_QueryUGCItems':                           (c_uint64, [POINTER(c_uint64), c_uint32]),
+    'Workshop_GetUGCDetailsSize':                       (c_uint32, []),
+    'CallResult_SetHandler':                            (None, [c_int32, c_void_p]),
+    'CallResult_Cancel':                                (c_bool, [c_uint64]),
+    'Events_SetQueueMode':                              (None, [c_bool, c_uint32]),
+    'Events_Drain':                                     (c_uint32, [c_void_p, c_uint32, POINTER(c_uint32)]),
+    'Events_GetDropped':                                (c_uint64, []),
+    'Events_GetQueued':                                 (c_uint32, []),
+    'Workshop_SetDeleteItemResultCallback':             (None, [c_void_p]),
+    'Workshop_DownloadItem':                            (c_bool, [c_uint64, c_bool]),
+    'Workshop_SetDownloadItemResultCallback':           (None, [c_void_p]),
+    # Steamworks
+    'SteamInit':                                        (c_bool, []),
+    'SteamUseManualDispatch':                           (None, []),
+    'SteamShutdown':                                    (None, []),
+    'IsSteamRunning':                                   (c_bool, []),
+    'RunCallbacks':                                     (None, []),
+    # Apps
+    'HasOtherApp':                                      (c_bool, [c_int32]),
+    'GetDlcCount':                                      (c_int, []),
+    'IsDlcInstalled':                                   (c_bool, [c_int32]),
+    'IsAppInstalled':                                   (c_bool, [c_int32]),
+    'GetCurrentGameLanguage':                           (c_char_p, []),
+    # Friends
+    'GetFriendCount':                                   (c_int, [c_int]),
+    'GetFriendByIndex':                                 (c_uint64, [c_int]),
+    'GetPersonaName':                                   (c_char_p, []),
+    'GetPersonaState':                                  (c_int, []),
+    'GetFriendPersonaName':                             (c_char_p, [c_int]),
+    'SetRichPresence':                                  (c_bool, [c_char_p, c_char_p]),
+    'ClearRichPresence':                                (None, []),
+    'InviteFriend':                                     (None, [c_int, c_char_p]),
+    'SetPlayedWith':                                    (None, [c_int]),
+    'ActivateGameOverlay':                              (None, [c_char_p]),
+    'ActivateGameOverlayToUser':                        (None, [c_char_p, c_int]),
+    'ActivateGameOverlayToWebPage':                     (None, [c_char_p]),
+    'ActivateGameOverlayToStore':                       (None, [c_int]),
+    'ActivateGameOverlayInviteDialog':                  (None, [c_int]),
+    # Matchmaking
+    'CreateLobby':                                      (None, [c_int, c_int]),
+    'JoinLobby':                                        (None, [c_int]),
+    'LeaveLobby':                                       (None, [c_int]),
+    'InviteUserToLobby':                                (c_bool, [c_int, c_int]),
+    # Music
+    'MusicIsEnabled':                                   (c_bool, []),
+    'MusicIsPlaying':                                   (c_bool, []),
+    'MusicGetVolume':                                   (c_float, []),
+    'MusicPause':                                       (None, []),
+    'MusicPlay':                                        (None, []),
+    'MusicPlayNext':                                    (None, []),
+    'MusicPlayPrev':                                    (None, []),
+    'MusicSetVolume':                                   (None, [c_float]),
+    # Screenshots
+    'TriggerScreenshot':                                (None, []),
+    'SetScreenshotLocation':                            (c_bool, [c_uint32, c_char_p]),
+    # User
+    'GetSteamID':                                       (c_uint64, []),
+    'GetPlayerSteamLevel':                              (c_int, []),
+    'GetUserDataFolder':                                (c_char_p, []),
+    # User Statistics
+    'ClearAchievement':                                 (c_bool, [c_char_p]),
+    'IndicateAchievementProgress':                      (c_bool, [c_char_p, c_uint32, c_uint32]),
+    'GetAchievement':                                   (c_bool, [c_char_p]),
+    'GetStatFloat':                                     (c_float, [c_char_p]),
+    'GetStatInt':                                       (c_int32, [c_char_p]),
+    'GetGlobalStatFloat':                               (c_double, [c_char_p]),
+    'GetGlobalStatInt':                                 (c_int64, [c_char_p]),
+    'ResetAllStats':                                    (c_bool, [c_bool]),
+    'RequestCurrentStats':                              (c_bool, []),
+    'SetAchievement':                                   (c_bool, [c_char_p]),
+    'SetStatFloat':                                     (c_bool, [c_char_p, c_float]),
+    'SetStatInt':                                       (c_bool, [c_char_p, c_int32]),
+    'StoreStats':                                       (c_bool, []),
+    # Utilities
+    'GetCurrentBatteryPower':                           (c_uint8, []),
+    'GetEnteredGamepadTextInput':                       (c_bool, [c_char_p, c_uint32]),
+    'GetEnteredGamepadTextLength':                      (c_uint32, []),
+    'GetIPCountry':                                     (c_char_p, []),
+    'GetSecondsSinceAppActive':                         (c_uint32, []),
+    'GetSecondsSinceComputerActive':                    (c_uint32, []),
+    'GetServerRealTime':                                (c_uint32, []),
+    'IsOverlayEnabled':                                 (c_bool, []),
+    'IsSteamInBigPictureMode':                          (c_bool, []),
+    'IsSteamRunningInVR':                               (c_bool, []),
+    'IsSteamRunningOnSteamDeck':                        (c_bool, []),
+    'GetSteamUILanguage':                               (c_char_p, []),
+    'GetAppID':                                         (c_uint32, []),
+    'SetOverlayNotificationPosition':                   (None, [c_int]),
+    'ShowGamepadTextInput':                             (c_bool, [c_int, c_int, c_char_p, c_uint32, c_char_p]),
+    # Workshop
+    'Workshop_SetItemCreatedCallback':                  (None, [c_void_p]),
+    'Workshop_CreateItem':                              (c_uint64, [c_uint32, c_int]),
+    'Workshop_QueryUGCItem':                            (c_uint64, [c_uint64]),
+    'Workshop_StartItemUpdate':                         (c_uint64, [c_uint32, c_uint64]),
+    'Workshop_SetItemTitle':                            (c_bool, [c_uint64, c_char_p]),
+    'Workshop_SetItemDescription':                      (c_bool, [c_uint64, c_char_p]),
+    'Workshop_SetItemUpdateLanguage':                   (c_bool, [c_uint64, c_char_p]),
+    'Workshop_SetItemMetadata':                         (c_bool, [c_uint64, c_char_p]),
+    'Workshop_SetItemVisibility':                       (c_bool, [c_uint64, c_int]),
+    'Workshop_SetItemTags':                             (c_bool, [c_uint64, POINTER(c_char_p), c_int32]),
+    'Workshop_SetItemContent':                          (c_bool, [c_uint64, c_char_p]),
+    'Workshop_SetItemPreview':                          (c_bool, [c_uint64, c_char_p]),
+    'Workshop_SetItemUpdatedCallback':                  (None, [c_void_p]),
+    'Workshop_SubmitItemUpdate':                        (c_uint64, [c_uint64, c_char_p]),
+    'Workshop_GetItemUpdateProgress':                   (c_int, [c_uint64, POINTER(c_uint64), POINTER(c_uint64)]),
+    'Workshop_GetNumSubscribedItems':                   (c_uint32, []),
+    'Workshop_GetSubscribedItems':                      (c_uint32, [POINTER(c_uint64), c_uint32]),
+    'Workshop_GetItemState':                            (c_uint32, [c_uint64]),
+    'Workshop_SetItemInstalledCallback':                (None, [c_void_p]),
+    'Workshop_ClearItemInstalledCallback':              (None, []),
+    'Workshop_SetSteamUGCDetailsCallback':              (None, [c_void_p]),
+    'Workshop_ClearSteamUGCDetailsCallback':            (None, []),
+    'Workshop_GetItemInstallInfo':                      (c_bool, [c_uint64, POINTER(c_uint64), c_char_p, c_uint32, POINTER(c_uint32)]),
+    'Workshop_GetItemsInstallInfo':                     (c_bool, [c_void_p, c_uint32, c_void_p, c_void_p, c_void_p, c_void_p, c_void_p, c_uint32, POINTER(c_uint32)]),
+    'Workshop_GetItemDownloadInfo':                     (c_bool, [c_uint64, POINTER(c_uint64), POINTER(c_uint64)]),
+    # Leaderboard
+    'Leaderboard_SetFindLeaderboardResultCallback':     (None, [c_void_p]),
+    'Leaderboard_FindLeaderboard':                      (c_uint64, [c_char_p]),
+    # Batched calls
+    'Batch_Run':                                        (c_int32, [c_void_p, c_int32, c_void_p]),
+}
+#------------------------------------------------
+# Getters that only read client-side state and never block; these are called
+# through a PyDLL handle so they skip releasing and reacquiring the GIL
+#------------------------------------------------
+NOGIL_FUNCTIONS = frozenset([
+    'GetAppID', 'GetServerRealTime', 'IsOverlayEnabled', 'IsSteamRunningInVR',
+    'GetSecondsSinceAppActive', 'GetSecondsSinceComputerActive', 'GetSteamID',
+    'GetStatInt', 'GetStatFloat', 'GetAchievement', 'Workshop_GetItemState',
+])
+#------------------------------------------------
+# Backend interface
+#------------------------------------------------
+#
+# Steam.lib is the backend every wrapper talks to. A backend exposes each
+# export in NATIVE_SIGNATURES as a callable attribute that takes and returns
+# the same values as the SteamworksPy export: ctypes pointers and buffers for
+# out parameters, CFUNCTYPE instances for the Set*Callback setters. Exports
+# a backend does not implement return the zero value of their restype.
+class SteamBackend:
+    def __getattr__(self, name):
+        try:
+            restype, argtypes = NATIVE_SIGNATURES[name]
+        except KeyError:
+            raise AttributeError("SteamworksPy export %s has no declared signature" % name)
+        if restype is None:
+            value = None
+        elif restype is c_char_p:
+            value = b""
+        else:
+            value = restype().value
+        function = lambda *args: value
+        setattr(self, name, function)
+        return function
+#------------------------------------------------
+# Native function table; each export is resolved and typed on first use
+#------------------------------------------------
+class NativeFunctions(SteamBackend):
+    def __init__(self, library, pyLibrary=None):
+        self._library = library
+        self._pyLibrary = pyLibrary
+    # Only called on a miss, so every later access is a plain instance attribute
+    def __getattr__(self, name):
+        try:
+            restype, argtypes = NATIVE_SIGNATURES[name]
+        except KeyError:
+            raise AttributeError("SteamworksPy export %s has no declared signature" % name)
+        if self._pyLibrary is not None and name in NOGIL_FUNCTIONS:
+            function = getattr(self._pyLibrary, name)
+        else:
+            function = getattr(self._library, name)
+        function.restype = restype
+        function.argtypes = argtypes
+        setattr(self, name, function)
+        return function
+#------------------------------------------------
+# Wrapper classes and the submodule that defines each one
+#------------------------------------------------
+WRAPPER_MODULES = {
+    'SteamApps': 'apps',
+    'SteamFriends': 'friends',
+    'SteamMatchmaking': 'matchmaking',
+    'SteamMusic': 'music',
+    'SteamScreenshots': 'screenshots',
+    'SteamUser': 'user',
+    'SteamUserStats': 'userstats',
+    'SteamUtilities': 'utils',
+    'SteamWorkshop': 'workshop',
+}
+# Import every wrapper submodule and return its wrapper class
+def wrapperClasses():
+    return [getattr(importlib.import_module('.' + module, __package__), name) for name, module in WRAPPER_MODULES.items()]
+#------------------------------------------------
+# Main Steam Class, obviously
+#------------------------------------------------
+class Steam:
+    # Set some basic variables for the Steam class
+    cdll = None
+    # Second handle to the same library that keeps the GIL held, see NOGIL_FUNCTIONS
+    pydll = None
+    warn = False
+    # True once Init succeeded; wrappers check this instead of calling isSteamLoaded()
+    loaded = False
+    # Backend the wrappers call into, set by Init
+    lib = None
+    # Seconds spent in each phase of the last Init
+    initTimings = {}
+    # True if the last Init switched RunCallbacks to manual dispatch
+    manualDispatch = False
+    # Values that do not change during a session, keyed by export and decoded
+    # to str; cleared by Init and Shutdown, see _sessionValue
+    sessionCache = {}
+    # Set by StartCallbackThread: (thread, stop event)
+    _callbackThread = None
+    # Callable that receives each callback delivery while the pump thread runs, see StartCallbackThread
+    callbackDispatch = None
+    # Held while callbacks run, so a manual RunCallbacks never overlaps the pump thread
+    _callbackLock = threading.RLock()
+    # SteamAPICall_t -> handler(result, ioFailure) for calls in flight
+    _pendingCalls = {}
+    # Every SteamAPICall_t in flight, with or without a handler of its own
+    _inFlightCalls = set()
+    # Seconds a call may stay in flight before it times out, for calls made without a timeout; None waits forever
+    callTimeout = None
+    # Deadlines of calls with a timeout, checked by RunCallbacks
+    _deadlines = None
+    # SteamAPICall_t -> (call type, result struct, fields of its timeout result) for calls with a deadline
+    _deadlineCalls = {}
+    # Published file IDs passed to DownloadItem that are still downloading
+    _downloads = set()
+    # Set whenever a call or download starts, so an idle CallbackScheduler runs early
+    _callIssued = threading.Event()
+    # Call type -> handler for results whose call has none, set by the Set*Callback wrappers
+    _callResultDefaults = {}
+    # Call type -> CFUNCTYPE registered with CallResult_SetHandler this session
+    _callResultTrampolines = {}
+    # Call type -> result struct, for decoding queued call results
+    _callResultTypes = {}
+    # Event type -> (struct or None, fan-out) for callbacks with subscribers, see Subscribe
+    _eventHandlers = {}
+    # Event type -> tuple of subscribed functions; replaced, never mutated, so dispatch needs no lock
+    _subscribers = {}
+    # Event type -> the function each Set*Callback wrapper subscribed
+    _legacyCallbacks = {}
+    # Event type -> (struct or None, CFUNCTYPE, fan-out), built once and kept for the life of the process
+    _eventTrampolines = {}
+    # Event type -> function calling its subscribers; kept for the process, like the trampolines
+    _eventFanOuts = {}
+    # Queued event type -> call type, the reverse of CallResultEvents
+    _callResultEventTypes = {eventType: callType for callType, eventType in CallResultEvents.items()}
+    # Set by EnableEventQueue: (bytearray, ctypes view of it, dispatch from RunCallbacks)
+    _eventQueue = None
+    # Events_GetDropped at the last drain
+    _droppedEvents = 0
+    # (records, offset) that a budgeted RunCallbacks has yet to dispatch
+    _eventBacklog = None
+    # Record header in the event queue: type, size, handle, flags, reserved
+    EVENT_HEADER = struct.Struct('=iIQII')
+    EVENT_IO_FAILURE = 1
+    # Largest the native ring grows to hold call results, EVENT_QUEUE_MAX_CAPACITY in SteamworksPy.cpp
+    EVENT_QUEUE_MAX_CAPACITY = 64 << 20
+    # Events_Drain sets this to the size of the next record it left queued
+    _drainNeeded = pointer(c_uint32())
+    # Initialize Steam
+    #
+    # Loads the SteamworksPy library from dynamicLibDir, unless a SteamBackend
+    # such as SimulatedBackend is passed, in which case the wrappers talk to it
+    # instead. With `manualDispatch`, RunCallbacks pulls events off the Steam
+    # pipe itself and only runs the handlers Python has set, instead of going
+    # through SteamAPI_RunCallbacks; it stays on until Shutdown.
+    #
+    # Returns True if Steam was loaded, False otherwise.
+    @staticmethod
+    def Init(dynamicLibDir=None, backend=None, manualDispatch=False):
+        timings = Steam.initTimings = {}
+        phaseStart = time.perf_counter()
+        # Each Init starts afresh; an earlier failed one must not stick, and until this one
+        # finishes, wrappers and the pump thread must not use the backend being swapped in
+        Steam.loaded = False
+        Steam.warn = False
+        if backend is not None:
+            Steam.lib = backend
+            logger.info("SteamworksPy using %s", type(backend).__name__)
+        elif dynamicLibDir is None:
+            logger.error("SteamworksPy failed to load (no dynamicLibDir or backend given)")
+            Steam.warn = True
+            return False
+        else:
+            Steam.lib = Steam._loadLibrary(dynamicLibDir)
+            if Steam.lib is None:
+                return False
+        phaseStart = Steam._endInitPhase(timings, 'load_library', phaseStart)
+        # Check that Steam is running
+        if Steam.lib.IsSteamRunning():
+            logger.info("Steam is running")
+        else:
+            logger.error("Steam is not running")
+        phaseStart = Steam._endInitPhase(timings, 'is_steam_running', phaseStart)
+        # Boot up the Steam API
+        if Steam.lib.SteamInit():
+            logger.info("Steamworks initialized!")
+        else:
+            logger.error("Steamworks failed to initialize!")
+            Steam.warn = True
+        Steam.manualDispatch = manualDispatch and not Steam.warn
+        if Steam.manualDispatch:
+            Steam.lib.SteamUseManualDispatch()
+        Steam._endInitPhase(timings, 'steam_init', phaseStart)
+        logger.info("Steam.Init phases: %s", ", ".join("%s %.1f ms" % (phase, seconds * 1000) for phase, seconds in timings.items()))
+        Steam.sessionCache = {}
+        Steam._pendingCalls = {}
+        Steam._inFlightCalls = set()
+        Steam._deadlines = TimerWheel()
+        Steam._deadlineCalls = {}
+        Steam._downloads = set()
+        Steam._callResultTrampolines = {}
+        Steam._eventHandlers = {}
+        Steam._subscribers = {}
+        Steam._legacyCallbacks = {}
+        Steam._eventQueue = None
+        Steam._eventBacklog = None
+        Steam._droppedEvents = 0
+        Steam.loaded = not Steam.warn
+        # The IP country is the only session value Steam can change mid-session
+        Steam.Subscribe('IPCountry', Steam._onIPCountryChanged)
+        return Steam.loaded
+    # Load the SteamworksPy library for this platform and return its function table
+    @staticmethod
+    def _loadLibrary(dynamicLibDir):
+        os.environ['LD_LIBRARY_PATH'] = dynamicLibDir
+        # Loading SteamworksPy API for Linux
+        if sys.platform == 'linux' or sys.platform == 'linux2':
+            libraryPath = os.path.join(dynamicLibDir, "SteamworksPy.so")
+            Steam.cdll = CDLL(libraryPath)
+            logger.info("SteamworksPy loaded for Linux")
+        # Loading SteamworksPy API for Mac
+        elif sys.platform == 'darwin':
+            libraryPath = os.path.join(dynamicLibDir, "SteamworksPy.dylib" )
+            Steam.cdll = CDLL(libraryPath)
+            logger.info("SteamworksPy loaded for Mac")
+        # Loading SteamworksPy API for Windows
+        elif sys.platform == 'win32':
+            # Check Windows architecture
+            libraryPath = os.path.join(dynamicLibDir, "SteamworksPy.dll")
+            Steam.cdll = CDLL(libraryPath)
+            logger.info("SteamworksPy loaded for Windows")
+        # Unrecognized platform, warn user, do not load Steam API
+        else:
+            logger.error("SteamworksPy failed to load (unsupported platform!)")
+            Steam.warn = True
+            return None
+        # The loader reuses the already mapped library, so this only adds a handle
+        Steam.pydll = PyDLL(libraryPath)
+        # Exports are typed lazily from NATIVE_SIGNATURES the first time they are used
+        return NativeFunctions(Steam.cdll, Steam.pydll)
+    # Record how long an Init phase took and return the start of the next one
+    @staticmethod
+    def _endInitPhase(timings, phase, phaseStart):
+        now = time.perf_counter()
+        timings[phase] = now - phaseStart
+        return now
+    # Initialize Steam on a worker thread
+    #
+    # Returns a concurrent.futures.Future that resolves to True once Steam is
+    # loaded, or False if initialization failed. Wrappers keep returning their
+    # "not loaded" defaults until then. Steam.initTimings holds the per-phase
+    # timings once the future is done.
+    @staticmethod
+    def InitAsync(dynamicLibDir=None, backend=None, manualDispatch=False):
+        from concurrent.futures import Future
+        future = Future()
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                loaded = Steam.Init(dynamicLibDir, backend, manualDispatch)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(loaded)
+        threading.Thread(target=run, name="SteamInit", daemon=True).start()
+        return future
+    # Is Steam loaded
+    @staticmethod
+    def isSteamLoaded():
+        return Steam.loaded
+    # Running callbacks
+    #
+    # With the event queue on, the queued events are then drained and
+    # dispatched in one go, unless EnableEventQueue was told not to. Pass
+    # `budget_ms` to stop running handlers once that many milliseconds have
+    # passed; the rest roll over to the next call, see QueuedEvents. At least
+    # one event runs per call. A budget turns the event queue on if it is off.
+    @staticmethod
+    def RunCallbacks(budget_ms=None):
+        if Steam.loaded:
+            with Steam._callbackLock:
+                if budget_ms is not None and Steam._eventQueue is None:
+                    Steam.EnableEventQueue()
+                Steam.lib.RunCallbacks()
+                if Steam._eventQueue is not None and Steam._eventQueue[2]:
+                    Steam._dispatchQueued(None if budget_ms is None else time.perf_counter() + budget_ms / 1000.0)
+                if Steam._deadlines:
+                    for hCall in Steam._deadlines.Expire(time.monotonic()):
+                        Steam._expireCall(hCall)
+            return True
+        return False
+    # Have the native layer queue callbacks and call results instead of calling into Python
+    #
+    # Events are written to a ring buffer of `capacity` bytes and collected
+    # with one native call per pump, instead of one ctypes callback each.
+    # Callbacks that do not fit are dropped, see DroppedEvents. Call results
+    # grow the buffer instead, up to EVENT_QUEUE_MAX_CAPACITY; past that a call
+    # result is dropped too, but still reaches its handler as an IO failure. With `dispatch`
+    # RunCallbacks drains and dispatches them as usual; without it the caller
+    # drains with DrainEvents and reads the records with Events.
+    @staticmethod
+    def EnableEventQueue(capacity=1 << 20, dispatch=True):
+        if not Steam.loaded:
+            return False
+        with Steam._callbackLock:
+            # Already on: setting the mode again resets the ring, so hand over what it holds first
+            if Steam._eventQueue is not None:
+                Steam._flushEventQueue()
+            buffer = bytearray(capacity)
+            Steam._eventQueue = (buffer, (c_uint8 * capacity).from_buffer(buffer), dispatch)
+            Steam.lib.Events_SetQueueMode(True, capacity)
+        return True
+    # Go back to calling into Python for every event; anything still queued is dispatched first
+    @staticmethod
+    def DisableEventQueue():
+        if Steam._eventQueue is None:
+            return
+        with Steam._callbackLock:
+            Steam._flushEventQueue()
+            Steam.lib.Events_SetQueueMode(False, 0)
+            Steam._eventQueue = None
+    # Dispatch everything still queued, before the native ring is reset
+    @staticmethod
+    def _flushEventQueue():
+        if Steam._eventQueue[2]:
+            Steam._dispatchQueued(None)
+        else:
+            Steam.DispatchEvents(Steam.DrainEvents())
+    # Move every queued event out of the native layer in one call
+    #
+    # Returns a memoryview of packed records, each an EVENT_HEADER followed by
+    # the event struct and padded to 8 bytes. It is only valid until the next
+    # drain; copy it to keep it.
+    @staticmethod
+    def DrainEvents():
+        if Steam._eventQueue is None:
+            return memoryview(b"")
+        with Steam._callbackLock:
+            buffer, view, dispatch = Steam._eventQueue
+            size = Steam.lib.Events_Drain(view, len(buffer), Steam._drainNeeded)
+            dropped = Steam.lib.Events_GetDropped()
+            if dropped != Steam._droppedEvents:
+                logger.warning("Steam event queue full, %d events dropped so far", dropped)
+                Steam._droppedEvents = dropped
+            needed = Steam._drainNeeded.contents.value
+            if needed > len(buffer):
+                # The native ring grew for a call result larger than this buffer. A new
+                # buffer leaves the records returned below, and any backlog, untouched.
+                capacity = max(needed, 2 * len(buffer))
+                grown = bytearray(capacity)
+                Steam._eventQueue = (grown, (c_uint8 * capacity).from_buffer(grown), dispatch)
+                if not size:
+                    return Steam.DrainEvents()
+        return memoryview(buffer)[:size]
+    # Yield (event type, handle, ioFailure, payload offset, payload size) for each record from byte `start`
+    @staticmethod
+    def Events(records, start=0):
+        header = Steam.EVENT_HEADER
+        offset = start
+        end = len(records)
+        while offset < end:
+            eventType, size, handle, flags, reserved = header.unpack_from(records, offset)
+            payload = offset + header.size
+            yield eventType, handle, bool(flags & Steam.EVENT_IO_FAILURE), payload, size
+            offset += (header.size + size + 7) & ~7
+    # Hand drained records to the same handlers direct delivery would call
+    #
+    # Starts at byte `start` and, given a perf_counter `deadline`, stops after
+    # the first event that finishes past it. Returns the offset of the first
+    # record not dispatched, len(records) once all of them are.
+    @staticmethod
+    def DispatchEvents(records, start=0, deadline=None):
+        header = Steam.EVENT_HEADER
+        offset = start
+        end = len(records)
+        while offset < end:
+            eventType, size, handle, flags, reserved = header.unpack_from(records, offset)
+            payload = offset + header.size
+            offset += (header.size + size + 7) & ~7
+            if handle:
+                callType = Steam._callResultEventTypes.get(eventType)
+                resultType = Steam._callResultTypes.get(callType)
+                if resultType is not None:
+                    ioFailure = bool(flags & Steam.EVENT_IO_FAILURE)
+                    # A call result the queue had no room for comes back as a bare header
+                    result = resultType.from_buffer(records, payload) if size else resultType()
+                    Steam._routeCallResult(callType, handle, ioFailure, StructView(result))
+            else:
+                structType, function = Steam._eventHandlers.get(eventType, (None, None))
+                if function is None:
+                    pass
+                elif structType is None:
+                    function()
+                else:
+                    function(structType.from_buffer_copy(records, payload))
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return offset
+    # Dispatch what the last budgeted run left over, then drain and dispatch new events until `deadline`
+    #
+    # Leftovers stay in the drain buffer, which is not drained again until
+    # they have all run, so rolling over copies nothing.
+    @staticmethod
+    def _dispatchQueued(deadline):
+        while True:
+            if Steam._eventBacklog is None:
+                records = Steam.DrainEvents()
+                if not records:
+                    return
+                start = 0
+            else:
+                records, start = Steam._eventBacklog
+                Steam._eventBacklog = None
+            offset = Steam.DispatchEvents(records, start, deadline)
+            if offset < len(records):
+                Steam._eventBacklog = (records, offset)
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+    # Number of events waiting to be dispatched: rolled over by a budgeted RunCallbacks plus still queued natively
+    @staticmethod
+    def QueuedEvents():
+        if Steam._eventQueue is None:
+            return 0
+        count = Steam.lib.Events_GetQueued()
+        if Steam._eventBacklog is not None:
+            records, offset = Steam._eventBacklog
+            count += sum(1 for event in Steam.Events(records, offset))
+        return count
+    # Number of events the native queue has dropped because it was full
+    @staticmethod
+    def DroppedEvents():
+        return Steam._droppedEvents
+    # Run callbacks on a dedicated thread, `hz` times per second
+    #
+    # Callbacks then fire on that thread. Pass `dispatch` to have them handed
+    # back instead: every delivery becomes one zero-argument callable passed to
+    # `dispatch`, so `queue.put` (call each item from the game loop) or an
+    # asyncio loop's `call_soon_threadsafe` both work. Structs are copied
+    # before they are handed over. Pass a CallbackScheduler as `scheduler` to
+    # pump fast only while calls are in flight; `hz` is then ignored. Replaces
+    # a pump that is already running.
+    @staticmethod
+    def StartCallbackThread(hz=60, dispatch=None, scheduler=None):
+        Steam.StopCallbackThread()
+        interval = 1.0 / hz
+        stop = threading.Event()
+        def pump():
+            deadline = time.monotonic()
+            while Steam.loaded:
+                try:
+                    if scheduler is None:
+                        Steam.RunCallbacks()
+                    else:
+                        scheduler.Pump()
+                except Exception:
+                    logger.exception("Steam callback pump")
+                if scheduler is not None:
+                    # A new call wakes the thread early; so does StopCallbackThread
+                    Steam._callIssued.wait(scheduler.interval)
+                    if stop.is_set():
+                        break
+                    continue
+                deadline = max(deadline + interval, time.monotonic())
+                if stop.wait(deadline - time.monotonic()):
+                    break
+        Steam.callbackDispatch = dispatch
+        thread = threading.Thread(target=pump, name="SteamCallbacks", daemon=True)
+        Steam._callbackThread = (thread, stop)
+        thread.start()
+    # Stop the pump thread and wait for its current RunCallbacks to finish
+    @staticmethod
+    def StopCallbackThread():
+        if Steam._callbackThread is None:
+            return
+        thread, stop = Steam._callbackThread
+        Steam._callbackThread = None
+        stop.set()
+        Steam._callIssued.set()
+        # A callback on the pump thread may stop it; it exits after that callback
+        if thread is not threading.current_thread():
+            thread.join()
+        Steam.callbackDispatch = None
+    # Is the pump thread running
+    @staticmethod
+    def isCallbackThreadRunning():
+        return Steam._callbackThread is not None
+    # Wrap a user callback so it honours callbackDispatch
+    #
+    # Every Set*Callback wrapper passes its callback through here before it
+    # becomes a CFUNCTYPE.
+    @staticmethod
+    def _wrapCallback(callback):
+        def deliver(*args):
+            dispatch = Steam.callbackDispatch
+            if dispatch is None:
+                return callback(*args)
+            # ctypes struct arguments point into the caller's stack frame
+            dispatch(functools.partial(callback, *[Steam._ownedCopy(arg) for arg in args]))
+        return deliver
+    # Call `function` with every event of `eventType`, alongside any other subscribers
+    #
+    # `eventType` is an EventType name or value. Each callback type in
+    # EVENT_SOURCES has one trampoline, registered with the native layer only
+    # while the type has subscribers, so events nobody listens to never reach
+    # Python. A call result type, such as GlobalStatsReceived, delivers every
+    # result of its calls made through the wrappers, except IO failures. The
+    # struct passed to `function` is only valid during the call. Raises
+    # ValueError for an unknown event type.
+    @staticmethod
+    def Subscribe(eventType, function):
+        eventType = EventType.get(eventType, eventType)
+        if eventType not in EVENT_SOURCES and eventType not in Steam._callResultEventTypes:
+            raise ValueError("unknown Steam event type %r" % (eventType,))
+        if not Steam.loaded:
+            return False
+        trampoline = None
+        if eventType in EVENT_SOURCES:
+            structType, trampoline, deliver = Steam._eventTrampoline(eventType)
+        with Steam._callbackLock:
+            subscribers = Steam._subscribers.get(eventType, ())
+            Steam._subscribers[eventType] = subscribers + (function,)
+            if not subscribers and trampoline is not None:
+                Steam._eventHandlers[eventType] = (structType, deliver)
+                getattr(Steam.lib, EVENT_SOURCES[eventType][2])(trampoline)
+        return True
+    # Stop calling `function` for `eventType`; returns False if it was not subscribed
+    @staticmethod
+    def Unsubscribe(eventType, function):
+        eventType = EventType.get(eventType, eventType)
+        with Steam._callbackLock:
+            subscribers = list(Steam._subscribers.get(eventType, ()))
+            if function not in subscribers:
+                return False
+            subscribers.remove(function)
+            if subscribers:
+                Steam._subscribers[eventType] = tuple(subscribers)
+            else:
+                del Steam._subscribers[eventType]
+                Steam._eventHandlers.pop(eventType, None)
+                if Steam.loaded and eventType in EVENT_SOURCES:
+                    getattr(Steam.lib, EVENT_SOURCES[eventType][2])(None)
+        return True
+    # Replace the one subscriber a Set*Callback wrapper owns for `eventType`
+    @staticmethod
+    def _setLegacyCallback(eventType, callback):
+        with Steam._callbackLock:
+            previous = Steam._legacyCallbacks.pop(eventType, None)
+            if previous is not None:
+                Steam.Unsubscribe(eventType, previous)
+            if callback is not None:
+                Steam._legacyCallbacks[eventType] = callback
+                Steam.Subscribe(eventType, callback)
+    # Return (struct or None, CFUNCTYPE, fan-out) for `eventType`, building them on first use
+    @staticmethod
+    def _eventTrampoline(eventType):
+        try:
+            return Steam._eventTrampolines[eventType]
+        except KeyError:
+            pass
+        className, structName, setter = EVENT_SOURCES[eventType]
+        structType = None
+        if structName is not None:
+            module = importlib.import_module('.' + WRAPPER_MODULES[className], __package__)
+            structType = getattr(getattr(module, className), structName)
+        deliver = Steam._eventFanOut(eventType)
+        if structType is None:
+            trampoline = CFUNCTYPE(None)(deliver)
+        else:
+            trampoline = CFUNCTYPE(None, structType)(deliver)
+        # The event queue calls the fan-out directly, see DispatchEvents
+        Steam._eventTrampolines[eventType] = (structType, trampoline, deliver)
+        return Steam._eventTrampolines[eventType]
+    # Return the function that calls every subscriber of `eventType`, building it on first use
+    @staticmethod
+    def _eventFanOut(eventType):
+        try:
+            return Steam._eventFanOuts[eventType]
+        except KeyError:
+            pass
+        def fanOut(*args):
+            for function in Steam._subscribers.get(eventType, ()):
+                try:
+                    function(*args)
+                except Exception:
+                    # One subscriber failing must not starve the others
+                    logger.exception("Steam event %d subscriber %r", eventType, function)
+        Steam._eventFanOuts[eventType] = Steam._wrapCallback(fanOut)
+        return Steam._eventFanOuts[eventType]
+    # Copy a callback argument that points into memory the callback does not own
+    @staticmethod
+    def _ownedCopy(arg):
+        if isinstance(arg, StructView):
+            return arg.copy()
+        if isinstance(arg, Structure):
+            return type(arg).from_buffer_copy(arg)
+        return arg
+    # Shutdown
+    #
+    # Stops the pump thread first, so no callback runs during or after SteamShutdown.
+    @staticmethod
+    def Shutdown():
+        Steam.StopCallbackThread()
+        Steam.loaded = False
+        Steam.manualDispatch = False
+        Steam.sessionCache = {}
+        Steam._pendingCalls = {}
+        Steam._inFlightCalls = set()
+        Steam._deadlines = None
+        Steam._deadlineCalls = {}
+        Steam._downloads = set()
+        # The native queue outlives the session; left on, the next session's events would sit in it unread
+        if Steam._eventQueue is not None:
+            Steam.lib.Events_SetQueueMode(False, 0)
+        Steam._eventQueue = None
+        Steam._eventBacklog = None
+        Steam.lib.SteamShutdown()
+    # Make an asynchronous call and route its result to `handler(result, ioFailure)`
+    #
+    # `issue` makes the native call and returns its SteamAPICall_t. Without a
+    # handler the result goes to the default for `callType`, if any. After
+    # `timeout` seconds (default Steam.callTimeout) without an answer the call
+    # is cancelled and the handler gets a zeroed result whose result field is
+    # EResult['Timeout'], with `timeoutFields` filled in. Returns the
+    # SteamAPICall_t, 0 if Steam could not start the call.
+    @staticmethod
+    def _startCallResult(callType, resultType, issue, handler=None, timeout=None, timeoutFields=None):
+        Steam._installCallResultTrampoline(callType, resultType)
+        if timeout is None:
+            timeout = Steam.callTimeout
+        # Holding the pump means the result cannot arrive before its handler is stored
+        with Steam._callbackLock:
+            hCall = issue()
+            if hCall:
+                Steam._inFlightCalls.add(hCall)
+                if handler is not None:
+                    Steam._pendingCalls[hCall] = handler
+                if timeout is not None:
+                    Steam._deadlineCalls[hCall] = (callType, resultType, timeoutFields)
+                    Steam._deadlines.Add(hCall, time.monotonic() + timeout)
+        if hCall:
+            Steam._callIssued.set()
+        return hCall
+    # Set the handler for results of `callType` whose call has no handler of its own
+    @staticmethod
+    def _setCallResultDefault(callType, resultType, handler):
+        Steam._installCallResultTrampoline(callType, resultType)
+        Steam._callResultDefaults[callType] = handler
+    # Register the one native handler that routes every result of `callType`
+    @staticmethod
+    def _installCallResultTrampoline(callType, resultType):
+        if callType in Steam._callResultTrampolines:
+            return
+        def trampoline(hCall, ioFailure, result):
+            Steam._routeCallResult(callType, hCall, ioFailure, StructView(result.contents))
+        trampoline = CFUNCTYPE(None, c_uint64, c_bool, POINTER(resultType))(trampoline)
+        Steam._callResultTrampolines[callType] = trampoline
+        Steam._callResultTypes[callType] = resultType
+        Steam.lib.CallResult_SetHandler(CallResultType[callType], trampoline)
+    # Hand one call result, a StructView, to the handler of its call or the default for its type
+    @staticmethod
+    def _routeCallResult(callType, hCall, ioFailure, result):
+        if hCall not in Steam._inFlightCalls:
+            # Cancelled or timed out while its result sat in the event queue
+            result._release()
+            return
+        Steam._inFlightCalls.discard(hCall)
+        if Steam._deadlineCalls.pop(hCall, None) is not None:
+            Steam._deadlines.Remove(hCall)
+        handler = Steam._pendingCalls.pop(hCall, None)
+        if handler is None:
+            handler = Steam._callResultDefaults.get(callType)
+        eventType = CallResultEvents.get(callType)
+        try:
+            if handler is not None:
+                handler(result, ioFailure)
+            if not ioFailure and Steam._subscribers.get(eventType):
+                Steam._eventFanOut(eventType)(result)
+        finally:
+            # The memory behind it is gone once the handler returns
+            result._release()
+    # Give up on a call whose deadline passed: cancel it natively and hand its handler a timeout result
+    @staticmethod
+    def _expireCall(hCall):
+        callType, resultType, timeoutFields = Steam._deadlineCalls.pop(hCall)
+        Steam.lib.CallResult_Cancel(hCall)
+        result = resultType()
+        for field, value in (timeoutFields or {}).items():
+            setattr(result, field, value)
+        if hasattr(result, 'result'):
+            result.result = EResult['Timeout']
+        logger.info("%s call %d timed out", callType, hCall)
+        Steam._routeCallResult(callType, hCall, False, StructView(result))
+    # Stop waiting for a call made through a wrapper
+    #
+    # Its handler is dropped without being called, and SteamworksPy releases
+    # what the call holds, such as the query handle of a QueryUGCItem.
+    # Returns False if the call was not in flight.
+    @staticmethod
+    def CancelCall(hCall):
+        if not Steam.loaded:
+            return False
+        with Steam._callbackLock:
+            # Already answered, e.g. a handler cancelling its own call: nothing left to release
+            if hCall not in Steam._inFlightCalls:
+                return False
+            Steam._pendingCalls.pop(hCall, None)
+            Steam._inFlightCalls.discard(hCall)
+            if Steam._deadlineCalls.pop(hCall, None) is not None:
+                Steam._deadlines.Remove(hCall)
+            # False if the result already sits in the event queue; it is discarded when drained
+            Steam.lib.CallResult_Cancel(hCall)
+            return True
+    # Call result handler that passes successful results on to a wrapper callback
+    #
+    # Like the wrappers always have, `callback` only sees results that were not
+    # an IO failure and, where `checkResult` is set, whose result field is OK.
+    # Timeouts, see _startCallResult, are passed on too.
+    @staticmethod
+    def _resultCallback(callback, checkResult=False):
+        deliver = Steam._wrapCallback(callback)
+        def handler(result, ioFailure):
+            if not ioFailure and (not checkResult or result.result in (EResult['OK'], EResult['Timeout'])):
+                deliver(result)
+        return handler
+    # Count the DownloadItem as in flight until the item stops downloading
+    @staticmethod
+    def _trackDownload(publishedFileId):
+        Steam._downloads.add(publishedFileId)
+        Steam._callIssued.set()
+    # Number of call results and downloads still in flight
+    @staticmethod
+    def CallsInFlight():
+        if Steam._downloads:
+            busy = WorkshopItemState['ItemStateDownloading'] | WorkshopItemState['ItemStateDownloadPending']
+            Steam._downloads = {item for item in Steam._downloads if Steam.lib.Workshop_GetItemState(item) & busy}
+        return len(Steam._inFlightCalls) + len(Steam._downloads)
+    # Return the cached value of a session-constant getter, calling it on a miss
+    @staticmethod
+    def _sessionValue(export):
+        try:
+            return Steam.sessionCache[export]
+        except KeyError:
+            value = getattr(Steam.lib, export)()
+            if isinstance(value, bytes):
+                value = value.decode()
+            Steam.sessionCache[export] = value
+            return value
+    # Steam reports a new IP country; the next GetIPCountry asks again
+    @staticmethod
+    def _onIPCountryChanged():
+        Steam.sessionCache.pop('GetIPCountry', None)
+    # Start an empty batch of getters that runs in a single native call
+    @staticmethod
+    def Batch():
+        from .batch import SteamBatch
+        return SteamBatch()
+    # Per-method call statistics collected while instrumentation is enabled
+    _callStatistics = {}
+    # Original class members replaced by EnableInstrumentation
+    _uninstrumented = {}
+    # Wrap every public wrapper method with call counting and timing
+    #
+    # While disabled the original methods are in place, so the hot path pays
+    # nothing. Statistics survive Disable/Enable; call ResetStats() to clear.
+    @staticmethod
+    def EnableInstrumentation():
+        if Steam._uninstrumented:
+            return
+        for cls in wrapperClasses():
+            for name, member in list(vars(cls).items()):
+                if name.startswith('_') or not isinstance(member, (staticmethod, classmethod)):
+                    continue
+                qualifiedName = "%s.%s" % (cls.__name__, name)
+                statistics = Steam._callStatistics.setdefault(qualifiedName, CallStatistics())
+                timed = statistics.wrap(member.__func__)
+                Steam._uninstrumented[(cls, name)] = member
+                setattr(cls, name, type(member)(timed))
+    # Put the original wrapper methods back
+    @staticmethod
+    def DisableInstrumentation():
+        for (cls, name), member in Steam._uninstrumented.items():
+            setattr(cls, name, member)
+        Steam._uninstrumented = {}
+    # Is instrumentation enabled
+    @staticmethod
+    def isInstrumented():
+        return bool(Steam._uninstrumented)
+    # Snapshot of the collected statistics for every method called at least once
+    #
+    # Returns a dict keyed by 'Class.Method' (e.g. 'SteamUserStats.StoreStats')
+    # whose values have 'calls', 'total_seconds', 'max_seconds' and
+    # 'histogram', a dict of bucket upper bound in microseconds to call count.
+    @staticmethod
+    def stats():
+        return {name: statistics.snapshot() for name, statistics in Steam._callStatistics.items() if statistics.calls}
+    # Clear the collected statistics
+    @staticmethod
+    def ResetStats():
+        for statistics in Steam._callStatistics.values():
+            statistics.reset()
+#------------------------------------------------
+# Call deadlines
+#------------------------------------------------
+# Hashed timer wheel for call deadlines
+#
+# Adding and removing a deadline is a dict operation, and Expire only looks
+# at the slots whose tick has passed since the last call, so checking it on
+# every RunCallbacks costs next to nothing. Deadlines fire up to one
+# `resolution` late. Deadlines more than a full turn away sit in their slot
+# until a later turn reaches them.
+class TimerWheel:
+    def __init__(self, resolution=0.05, slots=256):
+        self.resolution = resolution
+        self._slots = [{} for _ in range(slots)]
+        # Key -> index of the slot holding it
+        self._slotOf = {}
+        # Next tick Expire has to look at
+        self._tick = int(time.monotonic() / resolution)
+
+    def __len__(self):
+        return len(self._slotOf)
+    # Set the deadline of `key`, replacing any earlier one
+    def Add(self, key, deadline):
+        self.Remove(key)
+        index = max(int(deadline / self.resolution), self._tick) % len(self._slots)
+        self._slots[index][key] = deadline
+        self._slotOf[key] = index
+    # Forget the deadline of `key`; returns False if it had none
+    def Remove(self, key):
+        index = self._slotOf.pop(key, None)
+        if index is None:
+            return False
+        del self._slots[index][key]
+        return True
+    # Remove and return the keys whose deadline is at or before `now`
+    def Expire(self, now):
+        tick = int(now / self.resolution)
+        expired = []
+        if tick <= self._tick:
+            return expired
+        count = len(self._slots)
+        # After more than a full turn every slot is due once
+        for t in range(self._tick, min(tick, self._tick + count)):
+            slot = self._slots[t % count]
+            if not slot:
+                continue
+            for key, deadline in list(slot.items()):
+                if deadline <= now:
+                    del slot[key]
+                    del self._slotOf[key]
+                    expired.append(key)
+        self._tick = tick
+        return expired
+#------------------------------------------------
+# Call result views
+#------------------------------------------------
+# Read-only view of a call result struct that SteamworksPy owns
+#
+# Call results are passed by pointer, and attribute access reads straight
+# from that memory, so only the fields a handler touches are ever decoded
+# (a SteamUGCDetails_t is nearly 10 KB, most of it description and tags).
+# The view stops working when the handler returns; call copy() inside the
+# handler to keep the result.
+class StructView:
+    __slots__ = ('_struct',)
+
+    def __init__(self, struct):
+        self._struct = struct
+
+    def __getattr__(self, name):
+        struct = self._struct
+        if struct is None:
+            raise ValueError("call result is no longer valid; copy() it inside the handler to keep it")
+        return getattr(struct, name)
+
+    def __repr__(self):
+        if self._struct is None:
+            return "<StructView released>"
+        return "<StructView of %s>" % type(self._struct).__name__
+    # Return the result as a struct the caller owns
+    def copy(self):
+        struct = self._struct
+        if struct is None:
+            raise ValueError("call result is no longer valid; copy() it inside the handler to keep it")
+        return type(struct).from_buffer_copy(struct)
+    # Return an owned array of the `count` structs of `elementType` that follow the result in memory
+    def copyTrailing(self, elementType, count):
+        struct = self._struct
+        if struct is None:
+            raise ValueError("call result is no longer valid; copy() it inside the handler to keep it")
+        trailing = (elementType * count).from_address(addressof(struct) + sizeof(struct))
+        return type(trailing).from_buffer_copy(trailing)
+
+    def _release(self):
+        self._struct = None
+#------------------------------------------------
+# Call statistics for instrumented wrapper methods
+#------------------------------------------------
+class CallStatistics:
+    # Latency buckets are powers of two in microseconds: <1, <2, <4, ... <2^20, and above
+    BUCKETS = 22
+    BUCKET_BOUNDS = [2 ** i for i in range(BUCKETS - 1)] + [float('inf')]
+
+    def __init__(self):
+        # The pump thread and the game thread can both record into one instance
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.totalSeconds = 0.0
+            self.maxSeconds = 0.0
+            self.histogram = [0] * CallStatistics.BUCKETS
+
+    def record(self, seconds):
+        bucket = min(int(seconds * 1e6).bit_length(), CallStatistics.BUCKETS - 1)
+        with self._lock:
+            self.calls += 1
+            self.totalSeconds += seconds
+            if seconds > self.maxSeconds:
+                self.maxSeconds = seconds
+            self.histogram[bucket] += 1
+    # Return a function that calls `function` and records how long it took
+    def wrap(self, function):
+        record = self.record
+        perfCounter = time.perf_counter
+        def timed(*args, **kwargs):
+            start = perfCounter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(perfCounter() - start)
+        timed.__name__ = function.__name__
+        timed.__wrapped__ = function
+        return timed
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'total_seconds': self.totalSeconds,
+                'max_seconds': self.maxSeconds,
+                'histogram': {bound: count for bound, count in zip(CallStatistics.BUCKET_BOUNDS, self.histogram) if count},
+            }
@@ -0,0 +1,114 @@
+#================================================
+# Steamworks For Python - Steam Friends
+#================================================
+from ctypes import *
+from .core import Steam, FriendFlags, EventType
+#------------------------------------------------
+# Class for Steam Friends
+#------------------------------------------------
+class SteamFriends:
+    # Get number of friends user has
+    @staticmethod
+    def GetFriendCount(flag=FriendFlags['All']):
+        if Steam.loaded:
+            return Steam.lib.GetFriendCount(flag)
+        return 0
+    # Get a friend by index
+    @staticmethod
+    def GetFriendByIndex(friendInt, flag=FriendFlags['All']):
+        if Steam.loaded:
+            return Steam.lib.GetFriendByIndex(friendInt, flag)
+        return 0
+    # Get the user's Steam username
+    @staticmethod
+    def GetPlayerName():
+        if Steam.loaded:
+            return Steam.lib.GetPersonaName()
+        return ""
+    # Get the user's state on Steam
+    @staticmethod
+    def GetPlayerState():
+        if Steam.loaded:
+            return Steam.lib.GetPersonaState()
+        return False
+    # Get given friend's Steam username
+    @staticmethod
+    def GetFriendPersonaName(steamID):
+        if Steam.loaded:
+            return Steam.lib.GetFriendPersonaName(steamID)
+        return ""
+    # Set the game information in Steam; used in 'View Game Info'
+    @staticmethod
+    def SetRichPresence(serverKey, serverValue):
+        if Steam.loaded:
+            return Steam.lib.SetRichPresence(serverKey, serverValue)
+        return False
+    # Clear the game information in Steam; used in 'View Game Info'
+    @staticmethod
+    def ClearRichPresence():
+        if Steam.loaded:
+            Steam.lib.ClearRichPresence()
+            return True
+        return False
+    # Invite friend to current game/lobby
+    @staticmethod
+    def InviteFriend(steamID, connection):
+        if Steam.loaded:
+            return Steam.lib.InviteFriend(steamID, connection)
+        return False
+    # Set player as 'Played With' for game
+    @staticmethod
+    def SetPlayedWith(steamID):
+        if Steam.loaded:
+            Steam.lib.SetPlayedWith(steamID)
+            return True
+        return False
+    # Activates the overlay with optional dialog to open the following: "Friends", "Community", "Players", "Settings", "OfficialGameGroup", "Stats", "Achievements", "LobbyInvite"
+    @staticmethod
+    def ActivateGameOverlay(dialog=''):
+        if Steam.loaded:
+            Steam.lib.ActivateGameOverlay(dialog.encode())
+            return True
+        return False
+    # Activates the overlay to the following: "steamid", "chat", "jointrade", "stats", "achievements", "friendadd", "friendremove", "friendrequestaccept", "friendrequestignore"
+    @staticmethod
+    def ActivateGameOverlayToUser(url, steamID):
+        if Steam.loaded:
+            Steam.lib.ActivateGameOverlayToUser(url.encode(), steamID)
+            return True
+        return False
+    # Activates the overlay with specified web address
+    @staticmethod
+    def ActivateGameOverlayToWebPage(url):
+        if Steam.loaded:
+            Steam.lib.ActivateGameOverlayToWebPage(url.encode())
+            return True
+        return False
+    # Activates the overlay with the application/game Steam store page
+    @staticmethod
+    def ActivateGameOverlayToStore(appID):
+        if Steam.loaded:
+            Steam.lib.ActivateGameOverlayToStore(appID)
+            return True
+        return False
+    # Activates game overlay to open the invite dialog. Invitations will be sent for the provided lobby
+    @staticmethod
+    def ActivateGameOverlayInviteDialog(steamID):
+        if Steam.loaded:
+            Steam.lib.ActivateGameOverlayInviteDialog(steamID)
+            return True
+        return False
+
+    class GameOverlayActivated_t(Structure):
+        _fields_ = [
+            ("active", c_uint8)
+        ]
+    gameOverlayActivatedCallback = None
+
+    @classmethod
+    def SetGameOverlayActivatedCallback(cls, callback):
+        if Steam.loaded:
+            cls.gameOverlayActivatedCallback = callback
+            Steam._setLegacyCallback(EventType['GameOverlayActivated'], callback)
+            return True
+        return False
@@ -0,0 +1,36 @@
+#================================================
+# Steamworks For Python - Steam Matchmaking
+#================================================
+from ctypes import *
+from .core import Steam
+#------------------------------------------------
+# Class for Steam Matchmaking
+#------------------------------------------------ 
+class SteamMatchmaking:
+    # Create a lobby on the Steam servers, if private the lobby will not be returned by any RequestLobbyList() call
+    @staticmethod
+    def CreateLobby(lobbyType, maxMembers):
+        if Steam.loaded:
+            Steam.lib.CreateLobby(lobbyType, maxMembers)
+            return True
+        return
+    # Join an existing lobby
+    @staticmethod
+    def JoinLobby(lobbyID):
+        if Steam.loaded:
+            Steam.lib.JoinLobby(lobbyID)
+            return True
+        return False
+    # Leave a lobby, this will take effect immediately on the client side, other users will be notified by LobbyChatUpdate_t callback
+    @staticmethod
+    def LeaveLobby(lobbyID):
+        if Steam.loaded:
+            Steam.lib.LeaveLobby(lobbyID)
+            return True
+        return False
+    # Invite another user to the lobby, the target user will receive a LobbyInvite_t callback, will return true if the invite is successfully sent, whether or not the target responds
+    @staticmethod
+    def InviteUserToLobby(lobbyID, steamID):
+        if Steam.loaded:
+            return Steam.lib.InviteUserToLobby(lobbyID, steamID)
+        return False
@@ -0,0 +1,62 @@
+#================================================
+# Steamworks For Python - Steam Music
+#================================================
+from ctypes import *
+from .core import Steam
+#------------------------------------------------
+# Class for Steam Music
+#------------------------------------------------
+class SteamMusic:
+    # Is Steam music enabled
+    @staticmethod
+    def MusicIsEnabled():
+        if Steam.loaded:
+            return Steam.lib.MusicIsEnabled()
+        return False
+    # Is Steam music playing something
+    @staticmethod
+    def MusicIsPlaying():
+        if Steam.loaded:
+            return Steam.lib.MusicIsPlaying()
+        return False
+    # Get the volume level of the music
+    @staticmethod
+    def MusicGetVolume():
+        if Steam.loaded:
+            return Steam.lib.MusicGetVolume()
+        return 0
+    # Pause whatever Steam music is playing
+    @staticmethod
+    def MusicPause():
+        if Steam.loaded:
+            Steam.lib.MusicPause()
+            return True
+        return False
+    # Play current track/album
+    @staticmethod
+    def MusicPlay():
+        if Steam.loaded:
+            Steam.lib.MusicPlay()
+            return True
+        return False
+    # Play next track/album
+    @staticmethod
+    def MusicPlayNext():
+        if Steam.loaded:
+            Steam.lib.MusicPlayNext()
+            return True
+        return False
+    # Play previous track/album
+    @staticmethod
+    def MusicPlayPrev():
+        if Steam.loaded:
+            Steam.lib.MusicPlayPrev()
+            return True
+        return False
+    # Set the volume of Steam music
+    @staticmethod
+    def MusicSetVolume(value):
+        if Steam.loaded:
+            Steam.lib.MusicSetVolume(value)
+            return True
+        return False
@@ -0,0 +1,54 @@
+#================================================
+# Steamworks For Python - adaptive callback scheduler
+#================================================
+#
+# Runs Steam.RunCallbacks often only while something is waiting on Steam:
+#
+#   scheduler = CallbackScheduler(minInterval=0.01, maxInterval=0.5)
+#   while running:
+#       scheduler.Poll()        # once per frame; cheap when nothing is due
+#
+# or on the pump thread with Steam.StartCallbackThread(scheduler=scheduler).
+#
+# While any call result issued through the wrappers (CreateItem,
+# SubmitItemUpdate, QueryUGCItem, DeleteItem, FindLeaderboard,
+# RequestGlobalStats) or a DownloadItem is in flight, callbacks run every
+# minInterval seconds. Once nothing is, the interval doubles (times
+# `backoff`) after every run, up to maxInterval. Issuing a new call brings
+# the next run forward, so results never wait out a long idle interval.
+import time
+from .core import Steam
+#------------------------------------------------
+# Scheduler
+#------------------------------------------------
+class CallbackScheduler:
+    def __init__(self, minInterval=1.0 / 60, maxInterval=0.5, backoff=2.0):
+        if not 0 < minInterval <= maxInterval:
+            raise ValueError("need 0 < minInterval <= maxInterval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        self.minInterval = minInterval
+        self.maxInterval = maxInterval
+        self.backoff = backoff
+        # Seconds until the run after the last one
+        self.interval = minInterval
+        self._nextRun = 0.0
+    # Run callbacks now and return the seconds until the next run is due
+    def Pump(self):
+        # Cleared first, so a call issued by a callback below still counts
+        Steam._callIssued.clear()
+        try:
+            Steam.RunCallbacks()
+        finally:
+            if Steam.CallsInFlight():
+                self.interval = self.minInterval
+            else:
+                self.interval = min(self.interval * self.backoff, self.maxInterval)
+            self._nextRun = time.monotonic() + self.interval
+        return self.interval
+    # Run callbacks if they are due or a call was issued since the last run; returns True if they ran
+    def Poll(self):
+        if Steam._callIssued.is_set() or time.monotonic() >= self._nextRun:
+            self.Pump()
+            return True
+        return False
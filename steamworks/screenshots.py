@@ -0,0 +1,39 @@
+#================================================
+# Steamworks For Python - Steam Screenshots
+#================================================
+from ctypes import *
+from .core import Steam, EventType
+#------------------------------------------------
+# Class for Steam Screenshots
+#------------------------------------------------
+class SteamScreenshots:
+    # Causes Steam overlay to take a screenshot
+    @staticmethod
+    def TriggerScreenshot():
+        if Steam.loaded:
+            Steam.lib.TriggerScreenshot()
+            return True
+
+        return False
+
+    @staticmethod
+    def SetScreenshotLocation(hScreenshot, pchLocation):
+        if Steam.loaded:
+            return Steam.lib.SetScreenshotLocation(hScreenshot, pchLocation)
+        return False
+
+    class ScreenshotReady_t(Structure):
+        _fields_ = [
+            ("local", c_uint32),
+            ("result", c_uint32),
+        ]
+    screenshotReadyCallback = None
+
+    @classmethod
+    def SetScreenshotReadyCallback(cls, callback):
+        if Steam.loaded:
+            cls.screenshotReadyCallback = callback
+            Steam._setLegacyCallback(EventType['ScreenshotReady'], callback)
+            return True
+
+        return False
@@ -0,0 +1,539 @@
+#================================================
+# Steamworks For Python - simulated backend
+#================================================
+from ctypes import *
+from types import SimpleNamespace
+import heapq, itertools, time
+from .core import Steam, SteamBackend, WorkshopItemState, CallResultType, EventType, CallResultEvents
+from .batch import SteamBatch
+from .user import SteamUser
+from .userstats import SteamUserStats
+from .workshop import SteamWorkshop
+#------------------------------------------------
+# Simulated backend
+#------------------------------------------------
+#
+# A pure-Python SteamBackend for machines without a Steam client. Pass an
+# instance to Steam.Init(backend=SimulatedBackend()) and every wrapper runs
+# unchanged against it. Stats, achievements, leaderboards and workshop items
+# are plain attributes that callers can seed directly. Call results go to the
+# handlers registered with CallResult_SetHandler and callbacks to the
+# Set*Callback registrations, like the native library, and are delivered
+# from RunCallbacks once `latency` seconds have passed, or queued as packed
+# records while Events_SetQueueMode is on. `resultCodes` maps a call type ('CreateItem', 'SubmitItemUpdate',
+# 'QueryUGCItem', 'QueryUGCItems', 'RequestCurrentStats', 'RequestGlobalStats', 'DeleteItem',
+# 'DownloadItem') to the EResult it reports; anything unset succeeds.
+class SimulatedBackend(SteamBackend):
+    # EResult values the simulation reports
+    RESULT_OK = 1
+    RESULT_FILE_NOT_FOUND = 9
+    # Callback name -> event type it is queued under
+    EVENT_TYPES = {
+        'GameOverlayActivated': EventType['GameOverlayActivated'],
+        'ScreenshotReady': EventType['ScreenshotReady'],
+        'UserStatsReceived': EventType['UserStatsReceived'],
+        'GamepadTextInputDismissed': EventType['GamepadTextInputDismissed'],
+        'IPCountryChanged': EventType['IPCountry'],
+        'ItemInstalled': EventType['ItemInstalled'],
+        'DownloadItemResult': EventType['DownloadItemResult'],
+    }
+
+    def __init__(self, appId=480, steamId=76561197960287930, latency=0.0, resultCodes=None, steamRunning=True):
+        self.appId = appId
+        self.steamId = steamId
+        self.latency = latency
+        self.resultCodes = dict(resultCodes or {})
+        self.steamRunning = steamRunning
+        self.personaName = b"Player"
+        self.language = b"english"
+        self.ipCountry = b"US"
+        self.stats = {}
+        self.globalStats = {}
+        self.achievements = set()
+        # Leaderboard name -> handle
+        self.leaderboards = {}
+        # Published file ID -> item record, see AddItem
+        self.items = {}
+        # Callback name -> CFUNCTYPE instance registered by the wrappers
+        self.callbacks = {}
+        # CallResultType value -> CFUNCTYPE instance registered by the wrappers
+        self.callResultHandlers = {}
+        self._apiCalls = itertools.count(1)
+        # SteamAPICall_t of every call still waiting on its result
+        self._callsInFlight = set()
+        self._pending = []
+        self._sequence = itertools.count()
+        self._publishedFileIds = itertools.count(1000000)
+        self._updateHandles = itertools.count(1)
+        self._updates = {}
+        # Event queue, see Events_SetQueueMode: packed records and their total size
+        self.eventQueueCapacity = 0
+        self._events = []
+        self._eventBytes = 0
+        self.droppedEvents = 0
+        # Headers of call results the queue dropped, drained after the queued records
+        self._failedCalls = []
+    # Add a workshop item to the simulated client and return its record
+    def AddItem(self, publishedFileId, title=b"", description=b"", tags=b"", timeUpdated=0, subscribed=True,
+                installed=True, sizeOnDisk=0, folder=b"", fileSize=0):
+        item = SimpleNamespace(
+            published_file_id=publishedFileId,
+            title=title,
+            description=description,
+            tags=tags,
+            time_updated=timeUpdated,
+            subscribed=subscribed,
+            installed=installed,
+            needs_update=False,
+            size_on_disk=sizeOnDisk,
+            folder=folder,
+            file_size=fileSize,
+            bytes_downloaded=0,
+            bytes_total=0,
+            download_pending=False)
+        self.items[publishedFileId] = item
+        return item
+
+    # Change the IP country and notify the wrappers, like IPCountry_t
+    def SetIPCountry(self, country):
+        self.ipCountry = country
+        self._schedule(lambda: self._fire('IPCountryChanged'))
+
+    def _resultCode(self, callType):
+        return self.resultCodes.get(callType, SimulatedBackend.RESULT_OK)
+    # Queue a delivery for RunCallbacks, like a call result waiting on the Steam client
+    def _schedule(self, deliver):
+        heapq.heappush(self._pending, (time.monotonic() + self.latency, next(self._sequence), deliver))
+
+    def _fire(self, name, *args):
+        callback = self.callbacks.get(name)
+        if callback is None:
+            return
+        if self.eventQueueCapacity:
+            self._queueEvent(SimulatedBackend.EVENT_TYPES[name], 0, False, args[0] if args else None)
+        else:
+            callback(*args)
+    # Pack one event like the native EventQueue, dropping it if the queue is full
+    def _queueEvent(self, eventType, handle, ioFailure, payload):
+        payload = bytes(payload) if payload is not None else b""
+        header = Steam.EVENT_HEADER
+        recordSize = (header.size + len(payload) + 7) & ~7
+        if handle and self._eventBytes + recordSize > self.eventQueueCapacity:
+            # Like the native ring, grow for call results, with room for as much again
+            needed = (self._eventBytes + recordSize) * 2
+            self.eventQueueCapacity = min(max(self.eventQueueCapacity * 2, needed), Steam.EVENT_QUEUE_MAX_CAPACITY)
+        if self._eventBytes + recordSize > self.eventQueueCapacity:
+            self.droppedEvents += 1
+            if handle:
+                self._failedCalls.append(header.pack(eventType, 0, handle, Steam.EVENT_IO_FAILURE, 0))
+            return
+        flags = Steam.EVENT_IO_FAILURE if ioFailure else 0
+        record = header.pack(eventType, len(payload), handle, flags, 0) + payload
+        self._events.append(record.ljust(recordSize, b"\0"))
+        self._eventBytes += recordSize
+    # Start a call result and return its SteamAPICall_t; makeResult builds the struct on delivery
+    def _callResult(self, callType, makeResult):
+        hCall = next(self._apiCalls)
+        self._callsInFlight.add(hCall)
+        def deliver():
+            if hCall not in self._callsInFlight:
+                return
+            self._callsInFlight.discard(hCall)
+            handler = self.callResultHandlers.get(CallResultType[callType])
+            result = makeResult()
+            if handler is None:
+                return
+            if self.eventQueueCapacity:
+                self._queueEvent(CallResultEvents[callType], hCall, False, result)
+            else:
+                # Like SteamworksPy.cpp, handlers get a pointer to the result
+                handler(hCall, False, cast(pointer(result), handler._argtypes_[2]))
+        self._schedule(deliver)
+        return hCall
+    #--------------------------------------------
+    # Steamworks
+    #--------------------------------------------
+    def SteamInit(self):
+        return self.steamRunning
+
+    def IsSteamRunning(self):
+        return self.steamRunning
+
+    def SteamUseManualDispatch(self):
+        # Deliveries already only reach registered handlers
+        pass
+
+    def SteamShutdown(self):
+        self._pending = []
+        self.Events_SetQueueMode(False, 0)
+
+    def RunCallbacks(self):
+        now = time.monotonic()
+        while self._pending and self._pending[0][0] <= now:
+            heapq.heappop(self._pending)[2]()
+    #--------------------------------------------
+    # Callback registration
+    #--------------------------------------------
+    def Callbacks_SetGameOverlayActivatedCallback(self, callback):
+        self.callbacks['GameOverlayActivated'] = callback
+
+    def Callbacks_SetScreenshotReadyCallback(self, callback):
+        self.callbacks['ScreenshotReady'] = callback
+
+    def Callbacks_SetUserStatsReceivedCallback(self, callback):
+        self.callbacks['UserStatsReceived'] = callback
+
+    def Callbacks_SetGamepadTextInputDismissedCallback(self, callback):
+        self.callbacks['GamepadTextInputDismissed'] = callback
+
+    def Callbacks_SetIPCountryChangedCallback(self, callback):
+        self.callbacks['IPCountryChanged'] = callback
+
+    def Workshop_SetItemInstalledCallback(self, callback):
+        self.callbacks['ItemInstalled'] = callback
+
+    def Workshop_ClearItemInstalledCallback(self):
+        self.callbacks.pop('ItemInstalled', None)
+
+    def Workshop_SetDownloadItemResultCallback(self, callback):
+        self.callbacks['DownloadItemResult'] = callback
+    def CallResult_SetHandler(self, callType, handler):
+        self.callResultHandlers[callType] = handler
+
+    def CallResult_Cancel(self, hCall):
+        if hCall not in self._callsInFlight:
+            return False
+        self._callsInFlight.discard(hCall)
+        return True
+    #--------------------------------------------
+    # Event queue
+    #--------------------------------------------
+    def Events_SetQueueMode(self, enabled, capacity):
+        self.eventQueueCapacity = capacity if enabled else 0
+        self._events = []
+        self._eventBytes = 0
+        self._failedCalls = []
+
+    def Events_Drain(self, buffer, capacity, needed):
+        written = 0
+        while self._events and written + len(self._events[0]) <= capacity:
+            record = self._events.pop(0)
+            memmove(addressof(buffer) + written, record, len(record))
+            written += len(record)
+            self._eventBytes -= len(record)
+        while not self._events and self._failedCalls and written + len(self._failedCalls[0]) <= capacity:
+            record = self._failedCalls.pop(0)
+            memmove(addressof(buffer) + written, record, len(record))
+            written += len(record)
+        pending = self._events or self._failedCalls
+        needed.contents.value = len(pending[0]) if pending else 0
+        return written
+
+    def Events_GetDropped(self):
+        return self.droppedEvents
+
+    def Events_GetQueued(self):
+        return len(self._events) + len(self._failedCalls)
+    #--------------------------------------------
+    # Apps, Friends, User and Utilities
+    #--------------------------------------------
+    def GetCurrentGameLanguage(self):
+        return self.language
+
+    def GetPersonaName(self):
+        return self.personaName
+
+    def GetSteamID(self):
+        return self.steamId
+
+    def GetAppID(self):
+        return self.appId
+
+    def GetIPCountry(self):
+        return self.ipCountry
+
+    def GetSteamUILanguage(self):
+        return self.language
+
+    def GetServerRealTime(self):
+        return int(time.time())
+    #--------------------------------------------
+    # User Statistics
+    #--------------------------------------------
+    def GetStatInt(self, name):
+        return int(self.stats.get(name, 0))
+
+    def GetStatFloat(self, name):
+        return float(self.stats.get(name, 0.0))
+
+    def SetStatInt(self, name, value):
+        self.stats[name] = int(value)
+        return True
+
+    def SetStatFloat(self, name, value):
+        self.stats[name] = float(value)
+        return True
+
+    def GetGlobalStatInt(self, name):
+        return int(self.globalStats.get(name, 0))
+
+    def GetGlobalStatFloat(self, name):
+        return float(self.globalStats.get(name, 0.0))
+
+    def GetAchievement(self, name):
+        return name in self.achievements
+
+    def SetAchievement(self, name):
+        self.achievements.add(name)
+        return True
+
+    def ClearAchievement(self, name):
+        self.achievements.discard(name)
+        return True
+
+    def IndicateAchievementProgress(self, name, nCurProgress, nMaxProgress):
+        return True
+
+    def ResetAllStats(self, achievesToo):
+        self.stats.clear()
+        if achievesToo:
+            self.achievements.clear()
+        return True
+
+    def StoreStats(self):
+        return True
+
+    def RequestCurrentStats(self):
+        result = self._resultCode('RequestCurrentStats')
+        # Like SteamworksPy.cpp, only successful results reach Python
+        if result == SimulatedBackend.RESULT_OK:
+            self._schedule(lambda: self._fire('UserStatsReceived', SteamUser.UserStatsReceived_t(
+                game_id=self.appId, result=result, steam_id_user=self.steamId)))
+        return True
+
+    def Stats_RequestGlobalStats(self, nHistoryDays):
+        result = self._resultCode('RequestGlobalStats')
+        return self._callResult('RequestGlobalStats', lambda: SteamUser.GlobalStatsReceived_t(
+            game_id=self.appId, result=result))
+
+    def Leaderboard_FindLeaderboard(self, name):
+        handle = self.leaderboards.get(name, 0)
+        return self._callResult('FindLeaderboard', lambda: SteamUserStats.FindLeaderboardResult_t(
+            leaderboard_handle=handle, leaderboard_found=1 if handle else 0))
+    #--------------------------------------------
+    # Workshop
+    #--------------------------------------------
+    def Workshop_CreateItem(self, consumerAppId, fileType):
+        result = self._resultCode('CreateItem')
+        publishedFileId = next(self._publishedFileIds) if result == SimulatedBackend.RESULT_OK else 0
+        def makeResult():
+            if publishedFileId:
+                self.AddItem(publishedFileId, installed=False)
+            return SteamWorkshop.CreateItemResult_t(
+                result=result, published_file_id=publishedFileId, legal_accept_needed=False)
+        return self._callResult('CreateItem', makeResult)
+
+    def Workshop_StartItemUpdate(self, consumerAppId, publishedFileId):
+        handle = next(self._updateHandles)
+        # SteamWorkshop.StartItemUpdate passes the ID wrapped in a c_uint64
+        self._updates[handle] = (getattr(publishedFileId, 'value', publishedFileId), {})
+        return handle
+
+    def _setItemField(self, updateHandle, field, value):
+        if updateHandle not in self._updates:
+            return False
+        self._updates[updateHandle][1][field] = value
+        return True
+
+    def Workshop_SetItemTitle(self, updateHandle, title):
+        return self._setItemField(updateHandle, 'title', title)
+
+    def Workshop_SetItemDescription(self, updateHandle, description):
+        return self._setItemField(updateHandle, 'description', description)
+
+    def Workshop_SetItemTags(self, updateHandle, tags, count):
+        return self._setItemField(updateHandle, 'tags', b",".join(tags[i] for i in range(count)))
+
+    def Workshop_SetItemContent(self, updateHandle, contentFolder):
+        return self._setItemField(updateHandle, 'folder', contentFolder)
+
+    def Workshop_SetItemVisibility(self, updateHandle, visibility):
+        return updateHandle in self._updates
+
+    def Workshop_SubmitItemUpdate(self, updateHandle, changeNote):
+        publishedFileId, fields = self._updates.pop(updateHandle, (0, {}))
+        result = self._resultCode('SubmitItemUpdate')
+        def makeResult():
+            item = self.items.get(publishedFileId)
+            if item is not None and result == SimulatedBackend.RESULT_OK:
+                for field, value in fields.items():
+                    setattr(item, field, value)
+                item.time_updated = int(time.time())
+            return SteamWorkshop.SubmitItemUpdateResult_t(
+                result=result, legal_accept_needed=False, published_file_id=publishedFileId)
+        return self._callResult('SubmitItemUpdate', makeResult)
+
+    def Workshop_QueryUGCItem(self, publishedFileId):
+        result = self._resultCode('QueryUGCItem')
+        # Like SteamworksPy.cpp, a failed query reports the requested ID and the reason
+        if result != SimulatedBackend.RESULT_OK:
+            return self._callResult('QueryUGCItem', lambda: SteamWorkshop.SteamUGCDetails_t(
+                published_file_id=publishedFileId, result=result))
+        return self._callResult('QueryUGCItem', lambda: self._details(publishedFileId))
+
+    def Workshop_QueryUGCItems(self, publishedFileIds, count):
+        publishedFileIds = publishedFileIds[:count]
+        result = self._resultCode('QueryUGCItems')
+        def makeResult():
+            found = [self._details(publishedFileId) for publishedFileId in publishedFileIds] if result == SimulatedBackend.RESULT_OK else []
+            # UGCQueryBatchResult_t followed by the details, like SteamworksPy.cpp
+            class BatchResult(Structure):
+                _fields_ = [
+                    ("header", SteamWorkshop.UGCQueryBatchResult_t),
+                    ("details", SteamWorkshop.SteamUGCDetails_t * len(found)),
+                ]
+            return BatchResult(SteamWorkshop.UGCQueryBatchResult_t(result=result, num_results=len(found)), tuple(found))
+        return self._callResult('QueryUGCItems', makeResult)
+
+    def Workshop_GetUGCDetailsSize(self):
+        return sizeof(SteamWorkshop.SteamUGCDetails_t)
+
+    def _details(self, publishedFileId):
+        item = self.items.get(publishedFileId)
+        if item is None:
+            return SteamWorkshop.SteamUGCDetails_t(
+                published_file_id=publishedFileId, result=SimulatedBackend.RESULT_FILE_NOT_FOUND)
+        return SteamWorkshop.SteamUGCDetails_t(
+            published_file_id=publishedFileId,
+            result=SimulatedBackend.RESULT_OK,
+            creator_app_id=self.appId,
+            consumer_app_id=self.appId,
+            title=item.title,
+            description=item.description,
+            steam_owner_id=self.steamId,
+            time_updated=item.time_updated,
+            tags=item.tags,
+            file_size=item.file_size)
+
+    def Workshop_GetNumSubscribedItems(self):
+        return sum(1 for item in self.items.values() if item.subscribed)
+
+    def Workshop_GetSubscribedItems(self, publishedFileIds, maxEntries):
+        subscribed = [item.published_file_id for item in self.items.values() if item.subscribed][:maxEntries]
+        for i, publishedFileId in enumerate(subscribed):
+            publishedFileIds[i] = publishedFileId
+        return len(subscribed)
+
+    def Workshop_GetItemState(self, publishedFileId):
+        item = self.items.get(publishedFileId)
+        if item is None:
+            return WorkshopItemState['ItemStateNone']
+        state = 0
+        if item.subscribed:
+            state |= WorkshopItemState['ItemStateSubscribed']
+        if item.installed:
+            state |= WorkshopItemState['ItemStateInstalled']
+        if item.needs_update:
+            state |= WorkshopItemState['ItemStateNeedsUpdate']
+        if item.bytes_total:
+            state |= WorkshopItemState['ItemStateDownloading']
+        if item.download_pending:
+            state |= WorkshopItemState['ItemStateDownloadPending']
+        return state
+
+    def Workshop_GetItemInstallInfo(self, publishedFileId, pSizeOnDisk, pFolder, folderSize, pTimestamp):
+        item = self.items.get(publishedFileId)
+        if item is None or not item.installed:
+            return False
+        pSizeOnDisk.contents.value = item.size_on_disk
+        pFolder.value = item.folder[:folderSize - 1]
+        pTimestamp.contents.value = item.time_updated
+        return True
+
+    def Workshop_GetItemsInstallInfo(self, publishedFileIds, count, states, sizesOnDisk, timeStamps, folderEnds, folders, foldersSize, foldersNeeded):
+        used = 0
+        fits = True
+        for i in range(count):
+            publishedFileId = publishedFileIds[i]
+            states[i] = self.Workshop_GetItemState(publishedFileId)
+            item = self.items.get(publishedFileId)
+            folder = b""
+            if item is not None and item.installed:
+                folder = item.folder[:1023]
+                fits = fits and len(folder) <= foldersSize - used
+                if fits:
+                    memmove(addressof(folders) + used, folder, len(folder))
+                sizesOnDisk[i] = item.size_on_disk
+                timeStamps[i] = item.time_updated
+            else:
+                sizesOnDisk[i] = 0
+                timeStamps[i] = 0
+            used += len(folder)
+            folderEnds[i] = used
+        foldersNeeded.contents.value = used
+        return True
+
+    def Workshop_GetItemDownloadInfo(self, publishedFileId, pBytesDownloaded, pBytesTotal):
+        item = self.items.get(publishedFileId)
+        if item is None:
+            return False
+        pBytesDownloaded.contents.value = item.bytes_downloaded
+        pBytesTotal.contents.value = item.bytes_total
+        return True
+
+    def Workshop_GetItemUpdateProgress(self, updateHandle, pBytesProcessed, pBytesTotal):
+        pBytesProcessed.contents.value = 0
+        pBytesTotal.contents.value = 0
+        return 0
+
+    def Workshop_DownloadItem(self, publishedFileId, highPriority):
+        item = self.items.get(publishedFileId)
+        if item is None:
+            return False
+        result = self._resultCode('DownloadItem')
+        item.download_pending = True
+        def deliver():
+            item.download_pending = False
+            if result == SimulatedBackend.RESULT_OK:
+                item.installed = True
+                item.needs_update = False
+                self._fire('ItemInstalled', SteamWorkshop.ItemInstalled_t(
+                    appId=self.appId, published_file_id=publishedFileId))
+                self._fire('DownloadItemResult', SteamWorkshop.DownloadItemResult_t(
+                    app_id=self.appId, published_file_id=publishedFileId, result=result))
+        self._schedule(deliver)
+        return True
+
+    def Workshop_DeleteItem(self, publishedFileId):
+        result = self._resultCode('DeleteItem')
+        def makeResult():
+            if result == SimulatedBackend.RESULT_OK:
+                self.items.pop(publishedFileId, None)
+            return SteamWorkshop.DeleteItemResult_t(result=result, published_file_id=publishedFileId)
+        return self._callResult('DeleteItem', makeResult)
+    #--------------------------------------------
+    # Batched calls
+    #--------------------------------------------
+    def Batch_Run(self, ops, count, results):
+        floats = (c_double * count).from_buffer(results)
+        for i in range(count):
+            op = ops[i]
+            if op.op == SteamBatch.STAT_INT:
+                results[i] = self.GetStatInt(op.name)
+            elif op.op == SteamBatch.STAT_FLOAT:
+                floats[i] = self.GetStatFloat(op.name)
+            elif op.op == SteamBatch.ACHIEVEMENT:
+                results[i] = self.GetAchievement(op.name)
+            elif op.op == SteamBatch.GLOBAL_STAT_INT:
+                results[i] = self.GetGlobalStatInt(op.name)
+            elif op.op == SteamBatch.GLOBAL_STAT_FLOAT:
+                floats[i] = self.GetGlobalStatFloat(op.name)
+            elif op.op == SteamBatch.ITEM_STATE:
+                results[i] = self.Workshop_GetItemState(op.arg)
+            elif op.op == SteamBatch.DLC_INSTALLED:
+                results[i] = self.IsDlcInstalled(op.arg)
+            elif op.op == SteamBatch.HAS_OTHER_APP:
+                results[i] = self.HasOtherApp(op.arg)
+            else:
+                return i
+        return count
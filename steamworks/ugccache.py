@@ -0,0 +1,168 @@
+#================================================
+# Steamworks For Python - UGC details cache
+#================================================
+#
+# Keeps recently fetched SteamUGCDetails_t in memory, so a mod browser that
+# asks for the same items again does not go back to Steam each time:
+#
+#   cache = UGCDetailsCache(maxItems=512, ttl=300)    # after Steam.Init
+#   cache.Get(itemId, showDetails)
+#   cache.GetMany(itemIds, showPage)
+#
+# Entries are kept least recently used first and dropped once there are more
+# than maxItems, or when they are older than ttl seconds. When ItemInstalled
+# or DownloadItemResult reports an item, its install timestamp is compared
+# with the cached time_updated and the entry is dropped if the item changed.
+# Requests for an item that is already being fetched wait for that fetch
+# instead of starting another, and misses are fetched through
+# SteamWorkshop.QueryUGCItems, 50 to a request.
+#
+# Callbacks get the cached struct itself; treat it as read-only. Failed
+# lookups are passed on but not cached. A cache belongs to one Steam session:
+# create it after Steam.Init and Close it before Steam.Shutdown.
+import threading, time
+from collections import OrderedDict
+from .core import Steam, EResult
+from .workshop import SteamWorkshop
+#------------------------------------------------
+# Cache
+#------------------------------------------------
+class UGCDetailsCache:
+    def __init__(self, maxItems=512, ttl=300.0):
+        if maxItems < 1:
+            raise ValueError("maxItems must be at least 1")
+        self.maxItems = maxItems
+        self.ttl = ttl
+        # Lookups answered from the cache, sent to Steam, and joined to a fetch in flight
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        # published_file_id -> (details, time fetched), least recently used first
+        self._entries = OrderedDict()
+        # published_file_id -> callbacks waiting on the fetch in flight
+        self._waiting = {}
+        self._lock = threading.Lock()
+        Steam.Subscribe('ItemInstalled', self._onItemChanged)
+        Steam.Subscribe('DownloadItemResult', self._onItemChanged)
+    # Stop revalidating entries on Steam events
+    def Close(self):
+        Steam.Unsubscribe('ItemInstalled', self._onItemChanged)
+        Steam.Unsubscribe('DownloadItemResult', self._onItemChanged)
+    # Get the details of one item
+    #
+    # callback gets the SteamUGCDetails_t, right away if the item is cached.
+    #
+    # Return value:
+    # True if the item was answered from the cache
+    def Get(self, publishedFileId, callback, timeout=None):
+        details = self.Peek(publishedFileId)
+        if details is not None:
+            callback(details)
+            return True
+        self._request([publishedFileId], {publishedFileId: callback}, timeout)
+        return False
+    # Get the details of many items
+    #
+    # callback gets a list of SteamUGCDetails_t in the order of the IDs, once
+    # all of them are available. Only the items not cached are fetched.
+    def GetMany(self, publishedFileIds, callback, timeout=None):
+        publishedFileIds = list(publishedFileIds)
+        results = [None] * len(publishedFileIds)
+        missing = {}
+        for index, publishedFileId in enumerate(publishedFileIds):
+            details = self.Peek(publishedFileId)
+            if details is None:
+                missing.setdefault(publishedFileId, []).append(index)
+            else:
+                results[index] = details
+        if not missing:
+            callback(results)
+            return
+        remaining = [len(missing)]
+        def fill(indices):
+            def waiter(details):
+                for index in indices:
+                    results[index] = details
+                with self._lock:
+                    remaining[0] -= 1
+                    done = remaining[0] == 0
+                if done:
+                    callback(results)
+            return waiter
+        self._request(list(missing), {publishedFileId: fill(indices) for publishedFileId, indices in missing.items()}, timeout)
+    # Return the cached details of an item, or None if it is not cached or has expired
+    def Peek(self, publishedFileId):
+        with self._lock:
+            entry = self._entries.get(publishedFileId)
+            if entry is not None:
+                if time.monotonic() - entry[1] <= self.ttl:
+                    self._entries.move_to_end(publishedFileId)
+                    self.hits += 1
+                    return entry[0]
+                del self._entries[publishedFileId]
+        return None
+    # Drop one item, or every item when publishedFileId is None
+    def Invalidate(self, publishedFileId=None):
+        with self._lock:
+            if publishedFileId is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(publishedFileId, None)
+    def __len__(self):
+        return len(self._entries)
+    # True if the item is cached and has not expired; unlike Peek it leaves the order and counters alone
+    def __contains__(self, publishedFileId):
+        with self._lock:
+            entry = self._entries.get(publishedFileId)
+            return entry is not None and time.monotonic() - entry[1] <= self.ttl
+    # Queue `waiters` on the items and fetch those nobody is fetching yet
+    def _request(self, publishedFileIds, waiters, timeout):
+        fetch = []
+        with self._lock:
+            for publishedFileId in publishedFileIds:
+                waiting = self._waiting.get(publishedFileId)
+                if waiting is None:
+                    self._waiting[publishedFileId] = [waiters[publishedFileId]]
+                    fetch.append(publishedFileId)
+                    self.misses += 1
+                else:
+                    waiting.append(waiters[publishedFileId])
+                    self.coalesced += 1
+        if fetch:
+            # Steam not loaded: answer the waiters with a failure rather than leave them hanging
+            if SteamWorkshop.QueryUGCItems(fetch, lambda found: self._onFetched(fetch, found), timeout) is False:
+                self._onFetched(fetch, [])
+    # Store what a fetch returned and answer everyone waiting on it
+    def _onFetched(self, fetch, found):
+        now = time.monotonic()
+        answered = []
+        with self._lock:
+            for details in found:
+                publishedFileId = details.published_file_id
+                if details.result == EResult['OK']:
+                    self._entries[publishedFileId] = (details, now)
+                    self._entries.move_to_end(publishedFileId)
+                answered.append((details, self._waiting.pop(publishedFileId, ())))
+            # Items Steam left out, or all of them when the fetch could not be made
+            for publishedFileId in fetch:
+                if publishedFileId in self._waiting:
+                    details = SteamWorkshop.SteamUGCDetails_t(published_file_id=publishedFileId, result=EResult['Fail'])
+                    answered.append((details, self._waiting.pop(publishedFileId)))
+            while len(self._entries) > self.maxItems:
+                self._entries.popitem(last=False)
+        for details, waiting in answered:
+            for waiter in waiting:
+                waiter(details)
+    # ItemInstalled_t / DownloadItemResult_t: drop the entry if the installed content is newer
+    def _onItemChanged(self, event):
+        publishedFileId = event.published_file_id
+        with self._lock:
+            entry = self._entries.get(publishedFileId)
+        if entry is None:
+            return
+        installed = SteamWorkshop.GetItemInstallInfo(publishedFileId)
+        if not installed or installed.timestamp > entry[0].time_updated:
+            with self._lock:
+                # Leave it if a fetch replaced the entry in the meantime
+                if self._entries.get(publishedFileId) is entry:
+                    del self._entries[publishedFileId]
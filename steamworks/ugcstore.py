@@ -0,0 +1,113 @@
+#================================================
+# Steamworks For Python - persistent workshop metadata
+#================================================
+#
+# Keeps the details of subscribed workshop items in an SQLite file, so a mod
+# list can be shown at launch before Steam has answered a single query:
+#
+#   store = UGCMetadataStore("workshop.db")
+#   showList(store.Items())                 # straight from disk
+#   store.Refresh(updateList)               # after Steam.Init
+#
+# Refresh compares each subscribed item's state and install timestamp, read
+# locally with one GetItemsInstallInfo call, with what the store last saw. Only new items and items whose
+# state or timestamp changed are queried, through SteamWorkshop.QueryUGCItems;
+# their rows are rewritten once the results arrive from RunCallbacks, and
+# items no longer subscribed are removed. Items whose query failed keep their
+# old row and are tried again on the next Refresh.
+#
+# Each record is a SimpleNamespace with published_file_id, title,
+# description, tags, file_size, time_updated, state, size_on_disk, folder and
+# install_timestamp; the install fields are 0 or "" if the item is not
+# installed.
+import sqlite3, threading
+from types import SimpleNamespace
+from .core import EResult, WorkshopItemState
+from .workshop import SteamWorkshop
+#------------------------------------------------
+# Store
+#------------------------------------------------
+class UGCMetadataStore:
+    COLUMNS = ('published_file_id', 'title', 'description', 'tags', 'file_size', 'time_updated',
+               'state', 'size_on_disk', 'folder', 'install_timestamp')
+
+    def __init__(self, path):
+        self.path = path
+        # Results are written from whichever thread runs RunCallbacks
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._db:
+            self._db.execute("""CREATE TABLE IF NOT EXISTS items (
+                published_file_id INTEGER PRIMARY KEY, title TEXT, description TEXT, tags TEXT,
+                file_size INTEGER, time_updated INTEGER, state INTEGER, size_on_disk INTEGER,
+                folder TEXT, install_timestamp INTEGER)""")
+    # Close the database file
+    def Close(self):
+        with self._lock:
+            self._db.close()
+    # Return every stored item, ordered by title
+    def Items(self):
+        with self._lock:
+            rows = self._db.execute("SELECT %s FROM items ORDER BY title" % ", ".join(self.COLUMNS)).fetchall()
+        return [SimpleNamespace(**dict(zip(self.COLUMNS, row))) for row in rows]
+    # Return one stored item, or None
+    def Get(self, publishedFileId):
+        with self._lock:
+            row = self._db.execute("SELECT %s FROM items WHERE published_file_id = ?" % ", ".join(self.COLUMNS),
+                                   (publishedFileId,)).fetchone()
+        return SimpleNamespace(**dict(zip(self.COLUMNS, row))) if row else None
+    # Bring the store up to date with the subscribed items
+    #
+    # callback gets the records that were rewritten, once all queries have
+    # finished; right away with an empty list if nothing changed.
+    #
+    # Return value:
+    # The number of items being queried, False if Steam is not loaded or the
+    # state of the subscribed items could not be read
+    def Refresh(self, callback=None, timeout=None):
+        subscribed = SteamWorkshop.SubscribedItems()
+        if subscribed is False:
+            return False
+        with self._lock:
+            seen = dict((row[0], row[1:]) for row in
+                        self._db.execute("SELECT published_file_id, state, install_timestamp FROM items"))
+        installInfo = SteamWorkshop.GetItemsInstallInfo(subscribed)
+        if installInfo is False:
+            return False
+        installedFlag = WorkshopItemState['ItemStateInstalled']
+        local = dict((info.published_file_id, (info.state, info if info.state & installedFlag else None))
+                     for info in installInfo)
+        changed = [publishedFileId for publishedFileId, (state, installed) in local.items()
+                   if seen.get(publishedFileId) != (state, installed.timestamp if installed else 0)]
+        gone = [(publishedFileId,) for publishedFileId in seen if publishedFileId not in local]
+        if gone:
+            with self._lock, self._db:
+                self._db.executemany("DELETE FROM items WHERE published_file_id = ?", gone)
+        if not changed:
+            if callback is not None:
+                callback([])
+            return 0
+        def store(found):
+            records = [self._record(details, *local[details.published_file_id])
+                       for details in found if details.result == EResult['OK'] and details.published_file_id in local]
+            with self._lock, self._db:
+                self._db.executemany("INSERT OR REPLACE INTO items VALUES (%s)" % ", ".join("?" * len(self.COLUMNS)),
+                                     [tuple(getattr(record, column) for column in self.COLUMNS) for record in records])
+            if callback is not None:
+                callback(records)
+        SteamWorkshop.QueryUGCItems(changed, store, timeout)
+        return len(changed)
+    # Build a record from the details and local state of an item
+    @staticmethod
+    def _record(details, state, installed):
+        return SimpleNamespace(
+            published_file_id=details.published_file_id,
+            title=details.title.decode('utf-8', 'replace'),
+            description=details.description.decode('utf-8', 'replace'),
+            tags=details.tags.decode('utf-8', 'replace'),
+            file_size=details.file_size,
+            time_updated=details.time_updated,
+            state=state,
+            size_on_disk=installed.size_on_disk if installed else 0,
+            folder=installed.folder if installed else "",
+            install_timestamp=installed.timestamp if installed else 0)
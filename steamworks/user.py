@@ -0,0 +1,86 @@
+#================================================
+# Steamworks For Python - Steam Users
+#================================================
+from ctypes import *
+from .core import Steam, EventType
+#------------------------------------------------
+# Class for Steam Users
+#------------------------------------------------
+class SteamUser:
+    # Get user's Steam ID
+    @staticmethod
+    def GetPlayerID():
+        if Steam.loaded:
+            return Steam._sessionValue('GetSteamID')
+        return 0
+    # Get the user's Steam level
+    @staticmethod
+    def GetPlayerSteamLevel():
+        if Steam.loaded:
+            return Steam.lib.GetPlayerSteamLevel()
+        return 0
+    # Get the user's Steam installation path
+    @staticmethod
+    def GetUserDataFolder():
+        if Steam.loaded:
+            return Steam.lib.GetUserDataFolder()
+        return ""
+    # Get the value of a float statistic
+    @staticmethod
+    def GetGobalStatFloat(name):
+        if Steam.loaded:
+            return Steam.lib.GetGlobalStatFloat(name)
+        return 0.0
+    # Get the value of an integer statistic
+    @staticmethod
+    def GetGlobalStatInt(name):
+        if Steam.loaded:
+            return Steam.lib.GetGlobalStatInt(name)
+        return 0
+
+    # Request global statistics for the last nHistoryDays
+    #
+    # callback -- The function to call once the statistics arrive; without one
+    # the result goes to the SetGlobalStatsReceivedCallback callback
+    # timeout -- Seconds to wait before the callback gets a result of
+    # EResult['Timeout'] and the call is cancelled; defaults to Steam.callTimeout
+    #
+    # Returns the SteamAPICall_t of the request, 0 if it could not be made
+    @staticmethod
+    def RequestGlobalStats(nHistoryDays, callback=None, timeout=None):
+        if Steam.loaded:
+            handler = Steam._resultCallback(callback, checkResult=True) if callback is not None else None
+            return Steam._startCallResult('RequestGlobalStats', SteamUser.GlobalStatsReceived_t,
+                                          lambda: Steam.lib.Stats_RequestGlobalStats(nHistoryDays), handler, timeout)
+        return False
+
+    class UserStatsReceived_t(Structure):
+        _fields_ = [
+            ("game_id", c_uint64),
+            ("result", c_uint32),
+            ("steam_id_user", c_uint64),
+        ]
+    userStatsReceivedCallback = None
+
+    @classmethod
+    def SetUserStatsReceivedCallback(cls, callback):
+        if Steam.loaded:
+            cls.userStatsReceivedCallback = callback
+            Steam._setLegacyCallback(EventType['UserStatsReceived'], callback)
+            return True
+        return False
+
+    class GlobalStatsReceived_t(Structure):
+        _fields_ = [
+            ("game_id", c_uint64),
+            ("result", c_uint32),
+        ]
+    globalStatsReceivedCallback = None
+
+    @classmethod
+    def SetGlobalStatsReceivedCallback(cls, callback):
+        if Steam.loaded:
+            cls.globalStatsReceivedCallback = callback
+            Steam._setCallResultDefault('RequestGlobalStats', cls.GlobalStatsReceived_t, Steam._resultCallback(callback, checkResult=True))
+            return True
+        return False
@@ -0,0 +1,104 @@
+#================================================
+# Steamworks For Python - Steam User Statistics
+#================================================
+from ctypes import *
+from .core import Steam
+#------------------------------------------------
+# Class for Steam User Statistics
+#------------------------------------------------
+class SteamUserStats:
+    # Return true/false if use has given achievement
+    @staticmethod
+    def GetAchievement(name):
+        if Steam.loaded:
+            return Steam.lib.GetAchievement(name)
+        return ""
+    # Get the value of a float statistic
+    @staticmethod
+    def GetStatFloat(name):
+        if Steam.loaded:
+            return Steam.lib.GetStatFloat(name)
+        return 0.0
+    # Get the value of a float statistic
+    @staticmethod
+    def IndicateAchievementProgress(name, nCurProgress, nMaxProgress):
+        if Steam.loaded:
+            return Steam.lib.IndicateAchievementProgress(name, nCurProgress, nMaxProgress)
+        return 0
+    # Get the value of an integer statistic
+    @staticmethod
+    def GetStatInt(name):
+        if Steam.loaded:
+            return Steam.lib.GetStatInt(name)
+        return 0
+    # Reset all Steam statistics; optional to reset achievements
+    @staticmethod
+    def ResetAllStats(achievesToo):
+        if Steam.loaded:
+            return Steam.lib.ResetAllStats(achievesToo)
+        return False
+    # Request all statistics and achievements from Steam servers
+    @staticmethod
+    def RequestCurrentStats():
+        if Steam.loaded:
+            return Steam.lib.RequestCurrentStats()
+        return False
+    # Set a given achievement
+    @staticmethod
+    def SetAchievement(name):
+        if Steam.loaded:
+            return Steam.lib.SetAchievement(name)
+        return False
+    # Set a statistic
+    @staticmethod
+    def SetStat(name, value):
+        if Steam.loaded:
+            if isinstance(value, float):
+                return Steam.lib.SetStatFloat(name, value)
+            elif isinstance(value, int):
+                return Steam.lib.SetStatInt(name, value)
+            raise Exception("SteamUserStats: SetStat value can be only int or float.")
+    # Store all statistics, and achievements, on Steam servers; must be called to "pop" achievements
+    @staticmethod
+    def StoreStats():
+        if Steam.loaded:
+            return Steam.lib.StoreStats()
+        return False
+    # Clears a given achievement
+    @staticmethod
+    def ClearAchievement(name):
+        if Steam.loaded:
+            return Steam.lib.ClearAchievement(name)
+        return False
+    # A class that describes Steam's LeaderboardFindResult_t C struct
+    class FindLeaderboardResult_t(Structure):
+        _fields_ = [
+            ("leaderboard_handle", c_uint64),
+            ("leaderboard_found", c_uint32)
+        ]
+    findLeaderboardResultCallback = None
+
+    @classmethod
+    def SetFindLeaderboardResultCallback(cls, callback):
+        if Steam.loaded:
+            cls.findLeaderboardResultCallback = callback
+            Steam._setCallResultDefault('FindLeaderboard', cls.FindLeaderboardResult_t, Steam._resultCallback(callback))
+            return True
+        return False
+    #
+    # Find Leaderboard by name
+    #
+    # name -- The leaderboard name to search for
+    # callback -- The function to call once the find returns a result; without
+    # one the result goes to the SetFindLeaderboardResultCallback callback
+    # timeout -- Seconds to wait before the callback gets a result with
+    # leaderboard_found 0 and the call is cancelled; defaults to Steam.callTimeout
+    #
+    # Returns the SteamAPICall_t of the request, 0 if it could not be made
+    @staticmethod
+    def FindLeaderboard(name, callback = None, timeout = None):
+        if Steam.loaded:
+            handler = Steam._resultCallback(callback) if callback is not None else None
+            return Steam._startCallResult('FindLeaderboard', SteamUserStats.FindLeaderboardResult_t,
+                                          lambda: Steam.lib.Leaderboard_FindLeaderboard(name.encode()), handler, timeout)
+        return False
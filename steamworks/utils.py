@@ -0,0 +1,76 @@
+#================================================
+# Steamworks For Python - Steam Utilities
+#================================================
+from ctypes import *
+from .core import Steam
+#------------------------------------------------
+# Class for Steam Utilities
+#------------------------------------------------
+class SteamUtilities:
+    # A class that describes Steam's GamepadTextInputDismissed_t C struct
+    class GamepadTextInputDismissed_t(Structure):
+        _fields_ = [
+            ("submitted", c_bool),
+            ("submitted_text", c_uint32)
+        ]
+    # Get the amount of battery power, clearly for laptops
+    @staticmethod
+    def GetCurrentBatteryPower():
+        if Steam.loaded:
+            return Steam.lib.GetCurrentBatteryPower()
+        return 0
+    # Get the user's country by IP
+    @staticmethod
+    def GetIPCountry():
+        if Steam.loaded:
+            return Steam._sessionValue('GetIPCountry')
+        return ""
+    # Returns seconds since application/game was started
+    @staticmethod
+    def GetSecondsSinceAppActive():
+        if Steam.loaded:
+            return Steam.lib.GetSecondsSinceAppActive()
+        return 0
+    # Return seconds since computer was started
+    @staticmethod
+    def GetSecondsSinceComputerActive():
+        if Steam.loaded:
+            return Steam.lib.GetSecondsSinceComputerActive()
+        return 0
+    # Get the actual time
+    @staticmethod
+    def GetServerRealTime():
+        if Steam.loaded:
+            return Steam.lib.GetServerRealTime()
+        return 0
+    # Returns true/false if Steam overlay is enabled
+    @staticmethod
+    def IsOverlayEnabled():
+        if Steam.loaded:
+            return Steam.lib.IsOverlayEnabled()
+        return False
+    # Is Steam running in VR?
+    @staticmethod
+    def IsSteamRunningInVR():
+        if Steam.loaded:
+            return Steam.lib.IsSteamRunningInVR()
+        return False
+    # Get the Steam user interface language
+    @staticmethod
+    def GetSteamUILanguage():
+        if Steam.loaded:
+            return Steam._sessionValue('GetSteamUILanguage')
+        return ""
+    # Get the Steam ID of the running application/game
+    @staticmethod
+    def GetAppID():
+        if Steam.loaded:
+            return Steam._sessionValue('GetAppID')
+        return 0
+    # Set the position where overlay shows notifications
+    @staticmethod
+    def SetOverlayNotificationPosition(pos):
+        if Steam.loaded:
+            Steam.lib.SetOverlayNotificationPosition(pos)
+            return True
+        return False
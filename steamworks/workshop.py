@@ -0,0 +1,626 @@
+#================================================
+# Steamworks For Python - Steam Workshop
+#================================================
+from ctypes import *
+from types import SimpleNamespace
+from array import array
+from collections import namedtuple
+import logging
+from .core import Steam, EventType, EResult, STEAM_CALLBACK_PACK
+logger = logging.getLogger(__name__)
+#------------------------------------------------
+# Class for Steam Workshop
+#------------------------------------------------
+class SteamWorkshop:
+    # A class that describes Steam's CreateItemResult_t C struct
+    class CreateItemResult_t(Structure):
+        _fields_ = [
+            ("result", c_int),
+            ("published_file_id", c_uint64),
+            ("legal_accept_needed", c_bool)
+        ]
+    # A class that describes Steam's SubmitItemUpdateResult_t C struct
+    class SubmitItemUpdateResult_t(Structure):
+        _fields_ = [
+            ("result", c_int),
+            ("legal_accept_needed", c_bool),
+            ("published_file_id", c_uint64),
+        ]
+    # A class that describes Steam's ItemInstalled_t C struct
+    class ItemInstalled_t(Structure):
+        _fields_ = [
+            ("appId", c_uint32),
+            ("published_file_id", c_uint64)
+        ]
+    # A class that describes Steam's DeleteItemResult_t C struct
+    class DeleteItemResult_t(Structure):
+        _fields_ = [
+            ("result", c_uint32),
+            ("published_file_id", c_uint64)
+        ]
+    # A class that describes Steam's DownloadItemResult_t C struct
+    class DownloadItemResult_t(Structure):
+        _fields_ = [
+            ("app_id", c_uint32),
+            ("published_file_id", c_uint64),
+            ("result", c_uint32),
+        ]
+    # A class that describes Steam's SteamUGCDetails_t C struct; packed like the SDK, so
+    # the fields after the title, and the stride of a batch of them, line up
+    class SteamUGCDetails_t(Structure):
+        _pack_ = STEAM_CALLBACK_PACK
+        _fields_ = [
+            ("published_file_id", c_uint64),
+            ("result", c_uint32),
+            ("file_type", c_uint32),
+            ("creator_app_id", c_uint32),
+            ("consumer_app_id", c_uint32),
+            ("title", c_char * 129),
+            ("description", c_char * 8000),
+            ("steam_owner_id", c_uint64),
+            ("time_created", c_uint32),
+            ("time_updated", c_uint32),
+            ("time_added_to_user_list", c_uint32),
+            ("visibility", c_uint32),
+            ("banned", c_bool),
+            ("accepted_for_use", c_bool),
+            ("tags_truncated", c_bool),
+            ("tags", c_char * 1025),
+            ("file", c_uint64),
+            ("preview_file", c_uint64),
+            ("file_name", c_char * 260),
+            ("file_size", c_int32),
+            ("preview_file_size", c_int32),
+            ("url", c_char * 256),
+            ("votes_up", c_uint32),
+            ("voted_down", c_uint32),
+            ("score", c_float),
+            ("num_children", c_uint32),
+        ]
+    # Result of a QueryUGCItems request; num_results SteamUGCDetails_t follow it
+    class UGCQueryBatchResult_t(Structure):
+        _fields_ = [
+            ("result", c_int32),
+            ("num_results", c_uint32),
+        ]
+    # One item of GetItemsInstallInfo; the install fields are 0 and "" if it is not installed
+    class ItemInstallInfo(namedtuple('ItemInstallInfo', 'published_file_id state size_on_disk timestamp folder')):
+        __slots__ = ()
+    # Folder path blob GetItemsInstallInfo reads into, grown as needed
+    _folderBuffer = bytearray(1 << 16)
+    # Paths come back at most 1023 bytes each, so no call ever needs more than this per item
+    FOLDER_BYTES_PER_ITEM = 1023
+    # Count that receives the bytes the folder paths needed
+    _foldersNeeded = pointer(c_uint32())
+    # Buffer SubscribedItems reads into: (array('Q'), ctypes array over it)
+    _subscribedBuffer = (array('Q'), None)
+    # Most items one UGC details request can ask for (kNumUGCResultsPerPage)
+    UGC_QUERY_BATCH_SIZE = 50
+    # Callbacks set through the Set*Callback wrappers below, each of which
+    # owns one subscription on the Steam.Subscribe event bus
+    itemInstalledCallback = None
+    itemDownloadedCallback = None
+
+    # Call results are routed per SteamAPICall_t by Steam._startCallResult;
+    # these are the callbacks for results whose call was made without one
+    itemCreatedCallback = None
+    itemUpdatedCallback = None
+    itemDeletedCallback = None
+    queryUGCItemCallback = None
+    #
+    @classmethod
+    def SetItemCreatedCallback(cls, callback):
+        if Steam.loaded:
+            cls.itemCreatedCallback = callback
+            Steam._setCallResultDefault('CreateItem', cls.CreateItemResult_t, Steam._resultCallback(callback))
+            return True
+        return False
+    #
+    @classmethod
+    def SetQueryUGCItemCallback(cls, callback):
+        if Steam.loaded:
+            cls.queryUGCItemCallback = callback
+            Steam._setCallResultDefault('QueryUGCItem', cls.SteamUGCDetails_t, Steam._resultCallback(callback, checkResult=True))
+            return True
+        return False
+    #
+    @classmethod
+    def ClearSteamUGCDetailsCallback(cls):
+        if Steam.loaded:
+            cls.queryUGCItemCallback = None
+            Steam._callResultDefaults.pop('QueryUGCItem', None)
+            return True
+        return False
+    #
+    @classmethod
+    def SetItemUpdatedCallback(cls, callback):
+        if Steam.loaded:
+            cls.itemUpdatedCallback = callback
+            Steam._setCallResultDefault('SubmitItemUpdate', cls.SubmitItemUpdateResult_t, Steam._resultCallback(callback))
+            return True
+        return False
+    #
+    @classmethod
+    def SetItemInstalledCallback(cls, callback):
+        if Steam.loaded:
+            cls.itemInstalledCallback = callback
+            Steam._setLegacyCallback(EventType['ItemInstalled'], callback)
+            return True
+        return False
+    #
+    @classmethod
+    def ClearItemInstalledCallback(cls):
+        if Steam.loaded:
+            cls.itemInstalledCallback = None
+            # Other subscribers keep receiving the event
+            Steam._setLegacyCallback(EventType['ItemInstalled'], None)
+            return True
+        return False
+    #
+    @classmethod
+    def SetDeleteItemResultCallback(cls, callback):
+        if Steam.loaded:
+            cls.itemDeletedCallback = callback
+            Steam._setCallResultDefault('DeleteItem', cls.DeleteItemResult_t, Steam._resultCallback(callback, checkResult=True))
+            return True
+        return False
+    # Delete a workshop item
+    #
+    # callback -- The function to call once the item is deleted; without one
+    # the result goes to the SetDeleteItemResultCallback callback.
+    # timeout -- Seconds to wait before the callback gets a result of
+    # EResult['Timeout'] and the call is cancelled; defaults to Steam.callTimeout
+    #
+    # Returns the SteamAPICall_t of the request, 0 if it could not be made
+    @staticmethod
+    def DeleteItem(publishedFileId, callback=None, timeout=None):
+        if Steam.loaded:
+            handler = Steam._resultCallback(callback, checkResult=True) if callback is not None else None
+            return Steam._startCallResult('DeleteItem', SteamWorkshop.DeleteItemResult_t,
+                                          lambda: Steam.lib.Workshop_DeleteItem(publishedFileId), handler, timeout,
+                                          {'published_file_id': publishedFileId})
+        return False
+    #
+    @classmethod
+    def DownloadItem(cls, publishedFileId, highPriority):
+        if Steam.loaded:
+            started = Steam.lib.Workshop_DownloadItem(publishedFileId, highPriority)
+            if started:
+                Steam._trackDownload(publishedFileId)
+            return started
+        return False
+    #
+    @classmethod
+    def SetDownloadItemResultCallback(cls, callback):
+        if Steam.loaded:
+            cls.itemDownloadedCallback = callback
+            Steam._setLegacyCallback(EventType['DownloadItemResult'], callback)
+            return True
+        return False
+    #
+    # Create a UGC (Workshop) item
+    #
+    # Arguments:
+    # appId -- The app ID of the game on Steam.
+    # Do not use the creation tool app ID if they are separate.
+    #
+    # filetype -- Can be a community file type or microtransactions.
+    # Use predefined `WorkshopFileType` values.
+    #
+    # callback -- The function to call once the item creation is finished.
+    # Without one the result goes to the SetItemCreatedCallback callback.
+    # timeout -- Seconds to wait before the callback gets a result of
+    # EResult['Timeout'] and the call is cancelled; defaults to Steam.callTimeout
+    #
+    # Return value:
+    # The SteamAPICall_t of the request, 0 if it could not be made
+    @staticmethod
+    def CreateItem(appId, filetype, callback=None, timeout=None):
+        if Steam.loaded:
+            handler = Steam._resultCallback(callback) if callback is not None else None
+            return Steam._startCallResult('CreateItem', SteamWorkshop.CreateItemResult_t,
+                                          lambda: Steam.lib.Workshop_CreateItem(appId, filetype), handler, timeout)
+        return False
+    # Query the details of a workshop item
+    #
+    # Any number of queries can be in flight; each result goes to the callback
+    # passed with it, and only successful or timed out queries call back. The callback gets
+    # a StructView of SteamUGCDetails_t that is only valid during the call;
+    # copy() it to keep it.
+    #
+    # timeout -- Seconds to wait before the callback gets a result of
+    # EResult['Timeout'] and the call is cancelled; defaults to Steam.callTimeout
+    #
+    # Return value:
+    # The SteamAPICall_t of the request, 0 if it could not be made
+    @staticmethod
+    def QueryUGCItem(nPublishedFileID, callback=None, timeout=None):
+        if Steam.loaded:
+            SteamWorkshop._checkDetailsLayout()
+            handler = Steam._resultCallback(callback, checkResult=True) if callback is not None else None
+            return Steam._startCallResult('QueryUGCItem', SteamWorkshop.SteamUGCDetails_t,
+                                          lambda: Steam.lib.Workshop_QueryUGCItem(nPublishedFileID), handler, timeout,
+                                          {'published_file_id': nPublishedFileID})
+        return False
+    # Raise if SteamUGCDetails_t is laid out differently from the library's, once per session
+    #
+    # Every field past the title, and every record of a batch after the first,
+    # would be read at the wrong offset. A library that reports 0 is not checked.
+    @staticmethod
+    def _checkDetailsLayout():
+        size = Steam._sessionValue('Workshop_GetUGCDetailsSize')
+        if size and size != sizeof(SteamWorkshop.SteamUGCDetails_t):
+            raise RuntimeError("SteamUGCDetails_t is %d bytes in SteamworksPy but %d in Python; check STEAM_CALLBACK_PACK"
+                               % (size, sizeof(SteamWorkshop.SteamUGCDetails_t)))
+    # Query the details of many workshop items
+    #
+    # The IDs are split into requests of UGC_QUERY_BATCH_SIZE, which are all
+    # in flight at once. Once every request has finished, callback gets a list
+    # with a SteamUGCDetails_t for each item Steam returned. The items of a
+    # request that failed, timed out or could not be made are reported with
+    # their ID and the EResult of the failure.
+    #
+    # timeout -- Seconds each request may take; defaults to Steam.callTimeout
+    #
+    # Return value:
+    # The SteamAPICall_t of each request, 0 for any that could not be made
+    @staticmethod
+    def QueryUGCItems(publishedFileIds, callback=None, timeout=None):
+        if not Steam.loaded:
+            return False
+        SteamWorkshop._checkDetailsLayout()
+        publishedFileIds = list(publishedFileIds)
+        size = SteamWorkshop.UGC_QUERY_BATCH_SIZE
+        chunks = [publishedFileIds[i:i + size] for i in range(0, len(publishedFileIds), size)]
+        results = [None] * len(chunks)
+        remaining = [len(chunks)]
+        deliver = Steam._wrapCallback(callback) if callback is not None else None
+        def finish(index, details):
+            results[index] = details
+            remaining[0] -= 1
+            if remaining[0] == 0 and deliver is not None:
+                deliver([item for details in results for item in details])
+        def failed(chunk, result):
+            return [SteamWorkshop.SteamUGCDetails_t(published_file_id=publishedFileId, result=result) for publishedFileId in chunk]
+        def chunkHandler(index, chunk):
+            def handler(result, ioFailure):
+                if ioFailure:
+                    finish(index, failed(chunk, EResult['IOFailure']))
+                elif result.result != EResult['OK']:
+                    finish(index, failed(chunk, result.result))
+                else:
+                    finish(index, list(result.copyTrailing(SteamWorkshop.SteamUGCDetails_t, result.num_results)))
+            return handler
+        if not chunks and deliver is not None:
+            deliver([])
+        hCalls = []
+        for index, chunk in enumerate(chunks):
+            ids = (c_uint64 * len(chunk))(*chunk)
+            hCall = Steam._startCallResult('QueryUGCItems', SteamWorkshop.UGCQueryBatchResult_t,
+                                           lambda: Steam.lib.Workshop_QueryUGCItems(ids, len(chunk)), chunkHandler(index, chunk), timeout)
+            if not hCall:
+                finish(index, failed(chunk, EResult['Fail']))
+            hCalls.append(hCall)
+        return hCalls
+    # Start the item update process and receive an update handle.
+    #
+    # Arguments:
+    # appId -- The app ID of the game on Steam.
+    # Do not use the creation tool app ID if they are separate
+    # publishedFileId -- The ID of the Workshop file you are updating
+    #
+    # Return value:
+    # If sucessful: update handle - an ID of the current update transaction
+    # Otherwise: False
+    @staticmethod
+    def StartItemUpdate(appId, publishedFileId):
+        if Steam.loaded:
+            return Steam.lib.Workshop_StartItemUpdate(appId, c_uint64(publishedFileId))
+        return False
+    # Set the title of a Workshop item
+    #
+    # Arguments:
+    #
+    # updateHandle -- the handle returned by 'StartItemUpdate'
+    # title -- the desired title of the item.
+    #
+    # Return value:
+    # True on succes,
+    # False otherwise.
+    @staticmethod
+    def SetItemTitle(updateHandle, title):
+        if Steam.loaded:
+            if len(title) > 128:
+                logger.error("Your title is longer than 128 characters.")
+                return False
+
+            return Steam.lib.Workshop_SetItemTitle(updateHandle, title.encode())
+        return False
+    # Set the description of a Workshop item
+    #
+    # Arguments:
+    # updateHandle -- the handle returned by 'StartItemUpdate'
+    # description -- the desired description of the item.
+    #
+    # Return value:
+    # True on succes,
+    # False otherwise.
+    @staticmethod
+    def SetItemDescription(updateHandle, description):
+        if Steam.loaded:
+            if len(description) > 8000:
+                logger.error("Your description is longer than 8000 characters.")
+                return False
+
+            return Steam.lib.Workshop_SetItemDescription(updateHandle, description.encode())
+        return False
+    #
+    @staticmethod
+    def SetItemTags(updateHandle, *tags):
+        if Steam.loaded:
+            arr = (c_char_p * len(tags))()
+            arr[:] = [t.encode("utf-8") for t in tags]
+            return Steam.lib.Workshop_SetItemTags(updateHandle, arr, len(tags))
+        return False
+    # Set the directory containing the content you wish to upload to Workshop.
+    #
+    # Arguments:
+    # updateHandle -- the handle returned by 'StartItemUpdate'
+    # contentDirectory -- path to the directory containing the content of the workshop item.
+    #
+    # Return value:
+    # True on succes,
+    # False otherwise.
+    @staticmethod
+    def SetItemContent(updateHandle, contentDirectory):
+        if Steam.loaded:
+            return Steam.lib.Workshop_SetItemContent(updateHandle, contentDirectory.encode())
+        return False
+    # Set the preview image of the Workshop item.
+    #
+    # Arguments:
+    # updateHandle -- the handle returned by 'StartItemUpdate'
+    # previewImage -- path to the preview image file.
+    #
+    # Return value:
+    # True on succes,
+    # False otherwise.
+    #
+    @staticmethod
+    def SetItemVisibility(updateHandle, visibility):
+        if Steam.loaded:
+            return Steam.lib.Workshop_SetItemVisibility(updateHandle, visibility)
+        return False
+    #
+    # Submit the item update with the given handle to Steam.
+    #
+    # Arguments:
+    # updateHandle -- the handle returned by 'StartItemUpdate'
+    # changeNote -- a string containing change notes for the current update.
+    # callback -- The function to call once the update is submitted. Without
+    # one the result goes to the SetItemUpdatedCallback callback.
+    # timeout -- Seconds to wait before the callback gets a result of
+    # EResult['Timeout'] and the call is cancelled; defaults to Steam.callTimeout
+    #
+    # Return value:
+    # The SteamAPICall_t of the request, 0 if it could not be made
+    @staticmethod
+    def SubmitItemUpdate(updateHandle, changeNote="", callback=None, timeout=None):
+        if Steam.loaded:
+            handler = Steam._resultCallback(callback) if callback is not None else None
+            changeNote = changeNote.encode() if changeNote else c_char_p(0)
+            return Steam._startCallResult('SubmitItemUpdate', SteamWorkshop.SubmitItemUpdateResult_t,
+                                          lambda: Steam.lib.Workshop_SubmitItemUpdate(updateHandle, changeNote), handler, timeout)
+        return False
+    # Get the progress of an item update request.
+    #
+    # Argument:
+    # updateHandle -- the handle returned by 'StartItemUpdate'
+    #
+    # Return Value:
+    # On success: An object with the following attributes
+    # -- 'itemUpdateStatus - a `WorkshopItemUpdateStatus` value describing the update status of the item
+    # -- 'bytesProcessed' - amount of bytes processed
+    # -- 'bytesTotal' - total amount of bytes to be processed
+    # -- 'progress' - a value ranging from 0 to 1 representing update progress
+    # Otherwise: False
+    @staticmethod
+    def GetItemUpdateProgress(updateHandle):
+        if Steam.loaded:
+            pBytesProcessed = pointer(c_uint64(0))
+            pBytesTotal = pointer(c_uint64(0))
+
+            itemUpdateStatus = Steam.lib.Workshop_GetItemUpdateProgress(updateHandle, pBytesProcessed, pBytesTotal)
+            # Unlike for GetItemDownloadInfo, pBytesTotal should always be set here
+            progress = pBytesProcessed.contents.value / pBytesTotal.contents.value if pBytesTotal.contents.value else 0
+
+            return SimpleNamespace(
+                item_update_status=itemUpdateStatus,
+                bytes_processed=pBytesProcessed.contents.value,
+                bytes_total=pBytesTotal.contents.value,
+                progress=progress
+            )
+        return False
+    # Get the total number of items the user is subscribed to for this game or application.
+    #
+    # Return value:
+    # On success: The number of subscribed items,
+    # Otherwise: False.
+    @staticmethod
+    def GetNumSubscribedItems():
+        if Steam.loaded:
+            return Steam.lib.Workshop_GetNumSubscribedItems()
+        return False
+    # Get a list of published file IDs that the user is subscribed to
+    #
+    # Arguments:
+    # maxEntries -- the maximum number of entries to fetch. If omitted
+    # the function will try to fetch as much items as the user is
+    # subscribed to.
+    #
+    # Return Value:
+    # On success: A list of published file IDs that the user is subscribed to.
+    # Otherwise: False.
+    @staticmethod
+    def GetSubscribedItems(maxEntries=-1):
+        items = SteamWorkshop.SubscribedItems()
+        if items is False:
+            return False
+        if maxEntries >= 0:
+            items = items[:maxEntries]
+        return items.tolist()
+    # Get the published file IDs the user is subscribed to, without copying them
+    #
+    # The IDs are read into a buffer that is kept between calls and grown by
+    # powers of two, so the count is only asked for when the buffer fills up.
+    # The result is a memoryview of unsigned 64-bit integers over that buffer,
+    # or a NumPy uint64 array over it with asNumpy=True. The next call
+    # overwrites it; copy it (bytes(), .tolist(), numpy.copy) to keep it.
+    #
+    # Return Value:
+    # On success: A memoryview (or NumPy array) of published file IDs.
+    # Otherwise: False.
+    @staticmethod
+    def SubscribedItems(asNumpy=False):
+        if not Steam.loaded:
+            return False
+        items, native = SteamWorkshop._subscribedBuffer
+        while True:
+            capacity = len(items)
+            count = Steam.lib.Workshop_GetSubscribedItems(native, capacity) if capacity else 0
+            # Only a full buffer can have cut the list short
+            if count < capacity:
+                break
+            needed = max(count, Steam.lib.Workshop_GetNumSubscribedItems())
+            if needed <= capacity:
+                break
+            # A new buffer rather than a resize, so views handed out earlier stay valid
+            capacity = max(1 << needed.bit_length(), 64)
+            items = array('Q', bytes(8 * capacity))
+            native = (c_uint64 * capacity).from_buffer(items)
+            SteamWorkshop._subscribedBuffer = (items, native)
+        count = min(count, capacity)
+        if asNumpy:
+            import numpy
+            return numpy.frombuffer(items, dtype=numpy.uint64, count=count)
+        return memoryview(items)[:count]
+    # Get the current state of a workshop item.
+    #
+    # Arguments:
+    # publishedFileId -- the id of the item whose state to check
+    #
+    # Return Value:
+    # On success: A `WorkshopItemState` value describing the item state.
+    # Otherwise: False
+    @staticmethod
+    def GetItemState(publishedFileId):
+        if Steam.loaded:
+            return Steam.lib.Workshop_GetItemState(publishedFileId)
+        return False
+    # Get info about an installed item
+    #
+    # Arguments:
+    # publishedFileId -- the id of the item to look up,
+    # maxFolderPathLength -- maximum length of the folder path in characters.
+    #
+    # Return Value:
+    # If the item is installed: an object with the following attributes
+    # -- 'sizeOnDisk'
+    # -- 'folder'
+    # -- 'timestamp'
+    #
+    # If the item is not installed, or the method fails it returns: False
+    @staticmethod
+    def GetItemInstallInfo(publishedFileId, maxFolderPathLength=1024):
+        if Steam.loaded:
+            pSizeOnDisk = pointer(c_uint64(0))
+            pTimestamp = pointer(c_uint32(0))
+            pFolder = create_string_buffer(maxFolderPathLength)
+
+            isInstalled = Steam.lib.Workshop_GetItemInstallInfo(publishedFileId, pSizeOnDisk, pFolder, maxFolderPathLength, pTimestamp)
+
+            if isInstalled:
+                itemInfo = SimpleNamespace(
+                    size_on_disk=pSizeOnDisk.contents.value,
+                    folder=pFolder.value.decode(),
+                    timestamp=pTimestamp.contents.value)
+
+                return itemInfo
+        return False
+    # Get the state and install info of many items in one native call
+    #
+    # Arguments:
+    # publishedFileIds -- the ids of the items to look up, e.g. SubscribedItems()
+    #
+    # Return Value:
+    # On success: A list with an ItemInstallInfo per item, in order.
+    # Otherwise: False
+    @staticmethod
+    def GetItemsInstallInfo(publishedFileIds):
+        if not Steam.loaded:
+            return False
+        ids = array('Q', publishedFileIds)
+        count = len(ids)
+        if not count:
+            return []
+        states = array('I', bytes(4 * count))
+        sizes = array('Q', bytes(8 * count))
+        timestamps = array('I', bytes(4 * count))
+        ends = array('I', bytes(4 * count))
+        # A second try only happens if the paths did not fit; a third only if items were
+        # installed in between, and after that we give up rather than keep growing
+        for attempt in range(3):
+            folders = SteamWorkshop._folderBuffer
+            if not Steam.lib.Workshop_GetItemsInstallInfo(
+                    (c_uint64 * count).from_buffer(ids), count, (c_uint32 * count).from_buffer(states),
+                    (c_uint64 * count).from_buffer(sizes), (c_uint32 * count).from_buffer(timestamps),
+                    (c_uint32 * count).from_buffer(ends), (c_char * len(folders)).from_buffer(folders), len(folders),
+                    SteamWorkshop._foldersNeeded):
+                return False
+            needed = SteamWorkshop._foldersNeeded.contents.value
+            if needed <= len(folders):
+                break
+            if needed > count * SteamWorkshop.FOLDER_BYTES_PER_ITEM:
+                return False
+            SteamWorkshop._folderBuffer = bytearray(max(needed, 2 * len(folders)))
+        else:
+            return False
+        info = []
+        start = 0
+        for i in range(count):
+            end = ends[i]
+            info.append(SteamWorkshop.ItemInstallInfo(ids[i], states[i], sizes[i], timestamps[i], folders[start:end].decode()))
+            start = end
+        return info
+    # Get download info for a subscribed item
+    #
+    # Arguments:
+    # publishedFileId -- the id of the item whose download info to look up
+    #
+    # Return Value:
+    # If download information is available returns a SimpleNamespace with
+    # the following attributes
+    # -- 'bytes_downloaded'- the amount of downloaded bytes
+    # -- 'bytes_total' - the total amounts of bytes an item has
+    #
+    # If download information or steamworks or not available,
+    # returns False
+    @staticmethod
+    def GetItemDownloadInfo(publishedFileId):
+        if Steam.loaded:
+            pBytesDownloaded = pointer(c_uint64(0))
+            pBytesTotal = pointer(c_uint64(0))
+            # NOTE: pBytesTotal will only be valid after the download has started.
+            downloadInfoAvailable = Steam.lib.Workshop_GetItemDownloadInfo(publishedFileId, pBytesDownloaded, pBytesTotal)
+            if downloadInfoAvailable:
+                bytesDownloaded = pBytesDownloaded.contents.value
+                bytesTotal = pBytesTotal.contents.value
+                progress = 0
+                if bytesTotal > 0 and bytesDownloaded > 0:
+                    progress = bytesDownloaded / bytesTotal
+                downloadInfo = SimpleNamespace(
+                    bytes_downloaded=bytesDownloaded,
+                    bytes_total=bytesTotal,
+                    progress=progress)
+                return downloadInfo
+        return False